@@ -1,5 +1,6 @@
 import asyncio
 import random
+import time
 
 from iop import BusinessProcess
 from msg import MyMessage
@@ -7,21 +8,45 @@ from msg import MyMessage
 
 class MyAsyncNGBP(BusinessProcess):
 
-    def on_message(self, request):
+    async def on_message(self, request):
+        # create 1 to 10 messages
+        tasks = []
+        for i in range(random.randint(1, 10)):
+            tasks.append(self.send_request_async_ng("Python.MyAsyncNGBO",
+                                                    MyMessage(message=f"Message {i}")))
 
-        results = asyncio.run(self.await_response(request))
+        results = await asyncio.gather(*tasks)
 
         for result in results:
             self.logger.info(f"Received response: {result.message}")
 
         return MyMessage(message="All responses received")
 
-    async def await_response(self, request):
-        # create 1 to 10 messages
-        tasks = []
-        for i in range(random.randint(1, 10)):
-            tasks.append(self.send_request_async_ng("Python.MyAsyncNGBO",
-                                                    MyMessage(message=f"Message {i}")))
 
-        return await asyncio.gather(*tasks)
+class MyFanOutBenchBP(BusinessProcess):
+    """Compare sequential send_request_sync() with send_many_async_ng()."""
+
+    COUNT = 20
+    MAX_IN_FLIGHT = 5
+
+    async def on_message(self, request):
+        pairs = [("Python.MyAsyncNGBO", MyMessage(message=f"Message {i}"))
+                 for i in range(self.COUNT)]
+
+        start = time.perf_counter()
+        for target, message in pairs:
+            self.send_request_sync(target, message)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        async for index, target, response, status in self.send_many_async_ng(
+                pairs, max_in_flight=self.MAX_IN_FLIGHT):
+            if status != 1:
+                self.logger.error(f"Request {index} to {target} failed: {response}")
+        fan_out = time.perf_counter() - start
 
+        report = (f"{self.COUNT} requests: sequential send_request_sync "
+                  f"{sequential:.1f}s, send_many_async_ng "
+                  f"(max_in_flight={self.MAX_IN_FLIGHT}) {fan_out:.1f}s")
+        self.logger.info(report)
+        return MyMessage(message=report)
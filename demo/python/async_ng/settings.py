@@ -1,7 +1,8 @@
 from bo import MyAsyncNGBO
-from bp import MyAsyncNGBP
+from bp import MyAsyncNGBP, MyFanOutBenchBP
 
 CLASSES = {
     "Python.MyAsyncNGBO": MyAsyncNGBO,
     "Python.MyAsyncNGBP": MyAsyncNGBP,
+    "Python.MyFanOutBenchBP": MyFanOutBenchBP,
 }
\ No newline at end of file
@@ -1,54 +1,66 @@
-from iop.components.business_operation import _BusinessOperation
-from iop.components.business_process import _BusinessProcess
-from iop.components.business_service import _BusinessService
-from iop.components.inbound_adapter import _InboundAdapter
-from iop.components.outbound_adapter import _OutboundAdapter
-from iop.components.polling_business_service import _PollingBusinessServiceMixin
-from iop.components.private_session_duplex import _PrivateSessionDuplex
-from iop.components.private_session_process import _PrivateSessionProcess
-from iop.components.settings import Category as Category
-from iop.components.settings import Setting as Setting
-from iop.components.settings import controls as controls
-from iop.components.settings import setting as setting
-from iop.messages.base import (
-    _Message,
-    _PickleMessage,
-    _PydanticMessage,
-    _PydanticPickleMessage,
-)
-from iop.messages.decorators import handler as handler
-from iop.messages.persistent import Field as Field
-from iop.messages.persistent import Model as Model
-from iop.messages.persistent import _PersistentMessage
-from iop.migration.utils import _Utils
-from iop.migration.utils import bind_component as bind_component
-from iop.migration.utils import list_bindings as list_bindings
-from iop.migration.utils import register_component as register_component
-from iop.migration.utils import unbind_component as unbind_component
-from iop.migration.utils import unregister_component as unregister_component
-from iop.production import ComponentItem as ComponentItem
-from iop.production import ComponentRef as ComponentRef
-from iop.production import OperationItem as OperationItem
-from iop.production import ProcessItem as ProcessItem
-from iop.production import Production as Production
-from iop.production import ProductionApplyResult as ProductionApplyResult
-from iop.production import ProductionChangePlan as ProductionChangePlan
-from iop.production import ProductionDiff as ProductionDiff
-from iop.production import ProductionDiffEntry as ProductionDiffEntry
-from iop.production import ProductionGraph as ProductionGraph
-from iop.production import ProductionPlanOperation as ProductionPlanOperation
-from iop.production import ProductionValidationError as ProductionValidationError
-from iop.production import ProductionValidationIssue as ProductionValidationIssue
-from iop.production import ProductionValidationReport as ProductionValidationReport
-from iop.production import ProductionValidationWarning as ProductionValidationWarning
-from iop.production import ProductionVerifyResult as ProductionVerifyResult
-from iop.production import Route as Route
-from iop.production import ServiceItem as ServiceItem
-from iop.production import TargetSetting as TargetSetting
-from iop.production import TargetSettingRef as TargetSettingRef
-from iop.production import target as target
-from iop.runtime.director import _Director
-from iop.runtime.protocol import DirectorProtocol as DirectorProtocol
+"""Interoperability Embedded Python (IoP).
+
+The public names below are imported from their defining module on first
+access (PEP 562): importing a component does not load the production,
+migration or remote director modules it does not use.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from iop._components import BusinessOperation as BusinessOperation
+    from iop._components import BusinessProcess as BusinessProcess
+    from iop._components import BusinessService as BusinessService
+    from iop._components import DuplexOperation as DuplexOperation
+    from iop._components import DuplexProcess as DuplexProcess
+    from iop._components import DuplexService as DuplexService
+    from iop._components import InboundAdapter as InboundAdapter
+    from iop._components import OutboundAdapter as OutboundAdapter
+    from iop._components import PollingBusinessService as PollingBusinessService
+    from iop._director import Director as Director
+    from iop._messages import Message as Message
+    from iop._messages import PersistentMessage as PersistentMessage
+    from iop._messages import PickleMessage as PickleMessage
+    from iop._messages import PydanticMessage as PydanticMessage
+    from iop._messages import PydanticPickleMessage as PydanticPickleMessage
+    from iop._migration import Utils as Utils
+    from iop.components.settings import Category as Category
+    from iop.components.settings import Setting as Setting
+    from iop.components.settings import controls as controls
+    from iop.components.settings import setting as setting
+    from iop.messages.decorators import handler as handler
+    from iop.messages.persistent import Field as Field
+    from iop.messages.persistent import Model as Model
+    from iop.migration.utils import bind_component as bind_component
+    from iop.migration.utils import list_bindings as list_bindings
+    from iop.migration.utils import register_component as register_component
+    from iop.migration.utils import unbind_component as unbind_component
+    from iop.migration.utils import unregister_component as unregister_component
+    from iop.production import ComponentItem as ComponentItem
+    from iop.production import ComponentRef as ComponentRef
+    from iop.production import OperationItem as OperationItem
+    from iop.production import ProcessItem as ProcessItem
+    from iop.production import Production as Production
+    from iop.production import ProductionApplyResult as ProductionApplyResult
+    from iop.production import ProductionChangePlan as ProductionChangePlan
+    from iop.production import ProductionDiff as ProductionDiff
+    from iop.production import ProductionDiffEntry as ProductionDiffEntry
+    from iop.production import ProductionGraph as ProductionGraph
+    from iop.production import ProductionPlanOperation as ProductionPlanOperation
+    from iop.production import ProductionValidationError as ProductionValidationError
+    from iop.production import ProductionValidationIssue as ProductionValidationIssue
+    from iop.production import ProductionValidationReport as ProductionValidationReport
+    from iop.production import (
+        ProductionValidationWarning as ProductionValidationWarning,
+    )
+    from iop.production import ProductionVerifyResult as ProductionVerifyResult
+    from iop.production import Route as Route
+    from iop.production import ServiceItem as ServiceItem
+    from iop.production import TargetSetting as TargetSetting
+    from iop.production import TargetSettingRef as TargetSettingRef
+    from iop.production import target as target
+    from iop.runtime.protocol import DirectorProtocol as DirectorProtocol
 
 __all__ = [
     "BusinessOperation",
@@ -103,243 +115,69 @@ __all__ = [
     "unregister_component",
 ]
 
-
-class Utils(_Utils):
-    pass
-
-
-class InboundAdapter(_InboundAdapter):
-    pass
-
-
-class OutboundAdapter(_OutboundAdapter):
-    pass
-
-
-class BusinessService(_BusinessService):
-    """Purpose:
-        Inbound production entry point for messages entering an IoP production.
-
-    Use when:
-        External data, an adapter, or custom code must send a message into the
-        production graph.
-
-    Lifecycle:
-        IRIS calls on_process_input(); the default implementation delegates the
-        incoming request to on_message(request).
-
-    Best practices:
-        Declare outbound routes with target() and wire them in a Production
-        graph. Use PollingBusinessService for scheduled Python polling.
-
-    Common mistakes:
-        Do not put startup work in __init__(); use on_init(). Do not instantiate
-        downstream components directly.
-
-    Minimal example:
-        class FileIn(BusinessService):
-            Output = target()
-
-            def on_process_input(self, request):
-                self.send_request_async(self.Output, request)
-
-    Related:
-        docs/cookbooks/add-polling-service.md,
-        docs/cookbooks/hl7v2-native-input.md
-    """
-
-    pass
-
-
-class PollingBusinessService(_PollingBusinessServiceMixin, BusinessService):
-    """Purpose:
-        Scheduled Python service called by the default IRIS inbound adapter.
-
-    Use when:
-        A production must poll an API, directory, queue, database, or other
-        source from Python.
-
-    Lifecycle:
-        IRIS calls on_process_input(); the mixin delegates that call to
-        on_poll().
-
-    Best practices:
-        Put one polling cycle in on_poll(). Declare outbound routes with
-        target() and send messages with send_request_async(...).
-
-    Common mistakes:
-        Do not block forever inside on_poll(). Do not put startup work in
-        __init__(); use on_init().
-
-    Minimal example:
-        class ApiPoller(PollingBusinessService):
-            Output = target()
-
-            def on_poll(self):
-                self.send_request_async(self.Output, MyRequest())
-
-    Related:
-        docs/cookbooks/add-polling-service.md
-    """
-
-    pass
-
-
-class BusinessOperation(_BusinessOperation):
-    """Purpose:
-        Outbound side-effect boundary for production messages.
-
-    Use when:
-        A production must call an external API, write a file, update a database,
-        submit FHIR resources, or perform another side effect.
-
-    Lifecycle:
-        IRIS calls on_message(request). IoP can dispatch to @handler methods,
-        typed one-argument methods, or the on_message fallback.
-
-    Best practices:
-        Keep external-system code here. Return a response message when callers
-        expect synchronous results.
-
-    Common mistakes:
-        Do not put routing orchestration in an operation when a BusinessProcess
-        should own the decision.
-
-    Minimal example:
-        class SubmitOrder(BusinessOperation):
-            def on_message(self, request):
-                return SubmitResult(ok=True)
-
-    Related:
-        docs/cookbooks/add-business-operation.md
-    """
-
-    pass
-
-
-class BusinessProcess(_BusinessProcess):
-    """Purpose:
-        Routing, orchestration, decision, and transformation component.
-
-    Use when:
-        A production needs branching, enrichment, transformation, fan-out,
-        request/reply orchestration, or response aggregation.
-
-    Lifecycle:
-        IRIS calls on_message(request). For async requests, IRIS can later call
-        on_response(...) and on_complete(...).
-
-    Best practices:
-        Declare outbound routes with target() and wire them with
-        Production.connect(...). Use @handler(MessageType) or typed methods for
-        multiple message types.
-
-    Common mistakes:
-        Do not hard-code target component names when target() can expose a
-        configurable route.
-
-    Minimal example:
-        class Router(BusinessProcess):
-            Accepted = target()
-
-            def on_message(self, request):
-                return self.send_request_sync(self.Accepted, request)
-
-    Related:
-        docs/cookbooks/add-business-process.md,
-        docs/cookbooks/production-settings-and-targets.md
-    """
-
-    pass
-
-
-class DuplexService(_PrivateSessionDuplex):
-    pass
-
-
-class DuplexOperation(_PrivateSessionDuplex):
-    pass
-
-
-class DuplexProcess(_PrivateSessionProcess):
-    pass
-
-
-class Message(_Message):
-    """Purpose:
-        Python-only JSON-serialized message contract.
-
-    Use when:
-        IoP components exchange structured Python data and IRIS does not need a
-        native persistent message body.
-
-    Lifecycle:
-        IoP serializes dataclass fields into IOP.Message and restores the Python
-        class on receipt.
-
-    Best practices:
-        Decorate subclasses with @dataclass. Use PydanticMessage when runtime
-        validation is more important.
-
-    Common mistakes:
-        Do not use Message without @dataclass. Do not register Message classes
-        in CLASSES; use PersistentMessage for native IRIS message bodies.
-
-    Minimal example:
-        @dataclass
-        class OrderRequest(Message):
-            order_id: str
-
-    Related:
-        docs/cookbooks/add-business-process.md,
-        docs/cookbooks/add-business-operation.md,
-        docs/getting-started/register-component.md
-    """
-
-    pass
-
-
-class PickleMessage(_PickleMessage):
-    """Python-only pickle-serialized message contract.
-
-    Prefer Message or PydanticMessage for new app code unless JSON-compatible
-    fields cannot represent the payload.
-    """
-
-    pass
-
-
-class PydanticMessage(_PydanticMessage):
-    """Python-only Pydantic message contract with validation.
-
-    Use for app messages that benefit from Pydantic validation. Do not decorate
-    PydanticMessage classes with @dataclass and do not put these classes in
-    CLASSES; see docs/getting-started/register-component.md.
-    """
-
-    pass
-
-
-class PydanticPickleMessage(_PydanticPickleMessage):
-    """Pydantic message contract serialized through pickle.
-
-    Prefer PydanticMessage unless the payload must preserve Python-only object
-    shapes that JSON serialization cannot represent.
-    """
-
-    pass
-
-
-class PersistentMessage(_PersistentMessage):
-    """Native persistent IRIS message body contract.
-
-    Use when IRIS needs a generated message class or persistent message body.
-    Prefer Message or PydanticMessage for Python-only routing. See
-    docs/getting-started/register-component.md and docs/settings.md.
-    """
-
-    _iop_persistent_message_abstract = True
-
-
-class Director(_Director):
-    pass
+# public name -> module defining it
+_LAZY_ATTRIBUTES = {
+    "BusinessOperation": "iop._components",
+    "BusinessProcess": "iop._components",
+    "BusinessService": "iop._components",
+    "Category": "iop.components.settings",
+    "ComponentItem": "iop.production",
+    "ComponentRef": "iop.production",
+    "Director": "iop._director",
+    "DirectorProtocol": "iop.runtime.protocol",
+    "DuplexOperation": "iop._components",
+    "DuplexProcess": "iop._components",
+    "DuplexService": "iop._components",
+    "Field": "iop.messages.persistent",
+    "InboundAdapter": "iop._components",
+    "Message": "iop._messages",
+    "Model": "iop.messages.persistent",
+    "OperationItem": "iop.production",
+    "OutboundAdapter": "iop._components",
+    "PersistentMessage": "iop._messages",
+    "PickleMessage": "iop._messages",
+    "PollingBusinessService": "iop._components",
+    "ProcessItem": "iop.production",
+    "Production": "iop.production",
+    "ProductionApplyResult": "iop.production",
+    "ProductionChangePlan": "iop.production",
+    "ProductionDiff": "iop.production",
+    "ProductionDiffEntry": "iop.production",
+    "ProductionGraph": "iop.production",
+    "ProductionPlanOperation": "iop.production",
+    "ProductionValidationError": "iop.production",
+    "ProductionValidationIssue": "iop.production",
+    "ProductionValidationReport": "iop.production",
+    "ProductionValidationWarning": "iop.production",
+    "ProductionVerifyResult": "iop.production",
+    "PydanticMessage": "iop._messages",
+    "PydanticPickleMessage": "iop._messages",
+    "Route": "iop.production",
+    "ServiceItem": "iop.production",
+    "Setting": "iop.components.settings",
+    "TargetSetting": "iop.production",
+    "TargetSettingRef": "iop.production",
+    "Utils": "iop._migration",
+    "bind_component": "iop.migration.utils",
+    "controls": "iop.components.settings",
+    "handler": "iop.messages.decorators",
+    "list_bindings": "iop.migration.utils",
+    "register_component": "iop.migration.utils",
+    "setting": "iop.components.settings",
+    "target": "iop.production",
+    "unbind_component": "iop.migration.utils",
+    "unregister_component": "iop.migration.utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,172 @@
+"""Public component base classes, exported lazily by the iop package.
+
+The classes keep ``__module__ = "iop"``: registration recognises components by
+these ``iop.<Name>`` class paths. inspect.getsource() looks for them in
+iop/__init__.py and therefore cannot find their source; help() is unaffected.
+"""
+
+from iop.components.business_operation import _BusinessOperation
+from iop.components.business_process import _BusinessProcess
+from iop.components.business_service import _BusinessService
+from iop.components.inbound_adapter import _InboundAdapter
+from iop.components.outbound_adapter import _OutboundAdapter
+from iop.components.polling_business_service import _PollingBusinessServiceMixin
+from iop.components.private_session_duplex import _PrivateSessionDuplex
+from iop.components.private_session_process import _PrivateSessionProcess
+
+
+class InboundAdapter(_InboundAdapter):
+    __module__ = "iop"
+
+
+class OutboundAdapter(_OutboundAdapter):
+    __module__ = "iop"
+
+
+class BusinessService(_BusinessService):
+    """Purpose:
+        Inbound production entry point for messages entering an IoP production.
+
+    Use when:
+        External data, an adapter, or custom code must send a message into the
+        production graph.
+
+    Lifecycle:
+        IRIS calls on_process_input(); the default implementation delegates the
+        incoming request to on_message(request).
+
+    Best practices:
+        Declare outbound routes with target() and wire them in a Production
+        graph. Use PollingBusinessService for scheduled Python polling.
+
+    Common mistakes:
+        Do not put startup work in __init__(); use on_init(). Do not instantiate
+        downstream components directly.
+
+    Minimal example:
+        class FileIn(BusinessService):
+            Output = target()
+
+            def on_process_input(self, request):
+                self.send_request_async(self.Output, request)
+
+    Related:
+        docs/cookbooks/add-polling-service.md,
+        docs/cookbooks/hl7v2-native-input.md
+    """
+
+    __module__ = "iop"
+
+
+class PollingBusinessService(_PollingBusinessServiceMixin, BusinessService):
+    """Purpose:
+        Scheduled Python service called by the default IRIS inbound adapter.
+
+    Use when:
+        A production must poll an API, directory, queue, database, or other
+        source from Python.
+
+    Lifecycle:
+        IRIS calls on_process_input(); the mixin delegates that call to
+        on_poll().
+
+    Best practices:
+        Put one polling cycle in on_poll(). Declare outbound routes with
+        target() and send messages with send_request_async(...).
+
+    Common mistakes:
+        Do not block forever inside on_poll(). Do not put startup work in
+        __init__(); use on_init().
+
+    Minimal example:
+        class ApiPoller(PollingBusinessService):
+            Output = target()
+
+            def on_poll(self):
+                self.send_request_async(self.Output, MyRequest())
+
+    Related:
+        docs/cookbooks/add-polling-service.md
+    """
+
+    __module__ = "iop"
+
+
+class BusinessOperation(_BusinessOperation):
+    """Purpose:
+        Outbound side-effect boundary for production messages.
+
+    Use when:
+        A production must call an external API, write a file, update a database,
+        submit FHIR resources, or perform another side effect.
+
+    Lifecycle:
+        IRIS calls on_message(request). IoP can dispatch to @handler methods,
+        typed one-argument methods, or the on_message fallback.
+
+    Best practices:
+        Keep external-system code here. Return a response message when callers
+        expect synchronous results.
+
+    Common mistakes:
+        Do not put routing orchestration in an operation when a BusinessProcess
+        should own the decision.
+
+    Minimal example:
+        class SubmitOrder(BusinessOperation):
+            def on_message(self, request):
+                return SubmitResult(ok=True)
+
+    Related:
+        docs/cookbooks/add-business-operation.md
+    """
+
+    __module__ = "iop"
+
+
+class BusinessProcess(_BusinessProcess):
+    """Purpose:
+        Routing, orchestration, decision, and transformation component.
+
+    Use when:
+        A production needs branching, enrichment, transformation, fan-out,
+        request/reply orchestration, or response aggregation.
+
+    Lifecycle:
+        IRIS calls on_message(request). For async requests, IRIS can later call
+        on_response(...) and on_complete(...).
+
+    Best practices:
+        Declare outbound routes with target() and wire them with
+        Production.connect(...). Use @handler(MessageType) or typed methods for
+        multiple message types.
+
+    Common mistakes:
+        Do not hard-code target component names when target() can expose a
+        configurable route.
+
+    Minimal example:
+        class Router(BusinessProcess):
+            Accepted = target()
+
+            def on_message(self, request):
+                return self.send_request_sync(self.Accepted, request)
+
+    Related:
+        docs/cookbooks/add-business-process.md,
+        docs/cookbooks/production-settings-and-targets.md
+    """
+
+    __module__ = "iop"
+
+
+class DuplexService(_PrivateSessionDuplex):
+    __module__ = "iop"
+
+
+class DuplexOperation(_PrivateSessionDuplex):
+    __module__ = "iop"
+
+
+class DuplexProcess(_PrivateSessionProcess):
+    __module__ = "iop"
@@ -0,0 +1,7 @@
+"""Public director class, exported lazily by the iop package."""
+
+from iop.runtime.director import _Director
+
+
+class Director(_Director):
+    pass
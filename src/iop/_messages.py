@@ -0,0 +1,91 @@
+"""Public message base classes, exported lazily by the iop package.
+
+The classes keep ``__module__ = "iop"`` so the class path stored with a message
+or a pickle stays ``iop.<Name>``. inspect.getsource() looks for them in
+iop/__init__.py and therefore cannot find their source; help() is unaffected.
+"""
+
+from iop.messages.base import (
+    _Message,
+    _PickleMessage,
+    _PydanticMessage,
+    _PydanticPickleMessage,
+)
+from iop.messages.persistent import _PersistentMessage
+
+
+class Message(_Message):
+    """Purpose:
+        Python-only JSON-serialized message contract.
+
+    Use when:
+        IoP components exchange structured Python data and IRIS does not need a
+        native persistent message body.
+
+    Lifecycle:
+        IoP serializes dataclass fields into IOP.Message and restores the Python
+        class on receipt.
+
+    Best practices:
+        Decorate subclasses with @dataclass. Use PydanticMessage when runtime
+        validation is more important.
+
+    Common mistakes:
+        Do not use Message without @dataclass. Do not register Message classes
+        in CLASSES; use PersistentMessage for native IRIS message bodies.
+
+    Minimal example:
+        @dataclass
+        class OrderRequest(Message):
+            order_id: str
+
+    Related:
+        docs/cookbooks/add-business-process.md,
+        docs/cookbooks/add-business-operation.md,
+        docs/getting-started/register-component.md
+    """
+
+    __module__ = "iop"
+
+
+class PickleMessage(_PickleMessage):
+    """Python-only pickle-serialized message contract.
+
+    Prefer Message or PydanticMessage for new app code unless JSON-compatible
+    fields cannot represent the payload.
+    """
+
+    __module__ = "iop"
+
+
+class PydanticMessage(_PydanticMessage):
+    """Python-only Pydantic message contract with validation.
+
+    Use for app messages that benefit from Pydantic validation. Do not decorate
+    PydanticMessage classes with @dataclass and do not put these classes in
+    CLASSES; see docs/getting-started/register-component.md.
+    """
+
+    __module__ = "iop"
+
+
+class PydanticPickleMessage(_PydanticPickleMessage):
+    """Pydantic message contract serialized through pickle.
+
+    Prefer PydanticMessage unless the payload must preserve Python-only object
+    shapes that JSON serialization cannot represent.
+    """
+
+    __module__ = "iop"
+
+
+class PersistentMessage(_PersistentMessage):
+    """Native persistent IRIS message body contract.
+
+    Use when IRIS needs a generated message class or persistent message body.
+    Prefer Message or PydanticMessage for Python-only routing. See
+    docs/getting-started/register-component.md and docs/settings.md.
+    """
+
+    __module__ = "iop"
+    _iop_persistent_message_abstract = True
@@ -0,0 +1,7 @@
+"""Public migration helpers class, exported lazily by the iop package."""
+
+from iop.migration.utils import _Utils
+
+
+class Utils(_Utils):
+    pass
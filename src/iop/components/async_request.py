@@ -1,4 +1,5 @@
 import asyncio
+import time
 from typing import Any
 
 from ..messages.base import _Message as Message
@@ -45,7 +46,8 @@ class AsyncRequest(asyncio.Future):
             end_time = iris.ref()
             request = dispatch_serializer(self.request)
 
-            self._iris_handle.dispatchSendRequestAsyncNG(
+            deadline = None if self.timeout == -1 else time.monotonic() + self.timeout
+            sent = self._iris_handle.dispatchSendRequestAsyncNG(
                 self.target,
                 request,
                 self.timeout,
@@ -59,21 +61,39 @@ class AsyncRequest(asyncio.Future):
             self._queue_name = queue_name.value
             self._end_time = end_time.value
 
-            while not self._done:
-                await asyncio.sleep(0.1)
-                self.is_done()
+            if self._message_header_id:
+                response = await response_demultiplexer(self.host).wait(
+                    self._message_header_id, self._queue_name, deadline
+                )
+            else:
+                # InProc targets answer during the send call; anything else
+                # that returns without a message header is a failed send.
+                response = _inproc_response(iris, sent)
 
+            self._response = dispatch_deserializer(response)
+            self._done = True
             if not self.done():
                 self.set_result(self._response)
         except asyncio.CancelledError:
             if not self.done():
-                self.cancel()
+                super().cancel()
             raise
         except Exception as exc:
             if not self.done():
                 self.set_exception(exc)
 
+    def cancel(self, msg: Any = None) -> bool:
+        # Stop waiting for the response too, so the host's demultiplexer
+        # forgets the request instead of polling for it until it times out.
+        self._send_task.cancel()
+        return super().cancel(msg)
+
     def is_done(self) -> None:
+        """Poll the return queue for this request alone.
+
+        Kept for callers that drive a single request by hand; awaiting the
+        request polls through the host's ResponseDemultiplexer instead.
+        """
         iris = _iris.get_iris()
         response = iris.ref()
         status = self._iris_handle.dispatchIsRequestDone(
@@ -94,3 +114,122 @@ class AsyncRequest(asyncio.Future):
             self.set_exception(
                 RuntimeError(iris.system.Status.GetOneStatusText(status))
             )
+
+
+class ResponseDemultiplexer:
+    """Collects async responses for every pending request of one host.
+
+    All send_request_async_ng() calls of a host job share one IRIS return
+    queue. A single poller task drains that queue once per tick through
+    dispatchCollectResponses() and resolves the waiting futures by message
+    header id. The poll interval starts at ``min_interval``, doubles up to
+    ``max_interval`` while no response arrives, and resets as soon as one
+    does; the poller stops when nothing is pending.
+    """
+
+    min_interval: float = 0.001
+    max_interval: float = 0.1
+
+    def __init__(self, iris_handle: Any, loop: asyncio.AbstractEventLoop) -> None:
+        self.iris_handle = iris_handle
+        self.loop = loop
+        self.pending: dict[str, tuple[asyncio.Future, str, float | None]] = {}
+        self.polls = 0
+        self._task: asyncio.Task | None = None
+
+    def wait(
+        self, message_header_id: Any, queue_name: str, deadline: float | None
+    ) -> asyncio.Future:
+        """Return a future resolved with the response body of a request."""
+        future = self.loop.create_future()
+        self.pending[str(message_header_id)] = (future, queue_name, deadline)
+        if self._task is None or self._task.done():
+            self._task = self.loop.create_task(self._run())
+        return future
+
+    async def _run(self) -> None:
+        interval = self.min_interval
+        while self.pending:
+            await asyncio.sleep(interval)
+            try:
+                resolved = self.poll()
+            except Exception as exc:
+                self._fail_all(exc)
+                return
+            if resolved:
+                interval = self.min_interval
+            else:
+                interval = min(interval * 2, self.max_interval)
+
+    def poll(self) -> int:
+        """Drain the return queues once; return how many requests resolved."""
+        by_queue: dict[str, dict[str, None]] = {}
+        for key, (future, queue_name, _) in list(self.pending.items()):
+            if future.done():
+                # Cancelled by the caller.
+                del self.pending[key]
+            else:
+                by_queue.setdefault(queue_name, {})[key] = None
+
+        resolved = 0
+        iris = _iris.get_iris()
+        for queue_name, keys in by_queue.items():
+            responses: dict[str, Any] = {}
+            errors: dict[str, str] = {}
+            self.polls += 1
+            status = self.iris_handle.dispatchCollectResponses(
+                queue_name, keys, responses, errors
+            )
+            if iris.system.Status.IsError(status):
+                raise RuntimeError(iris.system.Status.GetOneStatusText(status))
+            for key, response in responses.items():
+                resolved += self._resolve(key, response=response)
+            for key, text in errors.items():
+                resolved += self._resolve(key, error=RuntimeError(text))
+
+        now = time.monotonic()
+        for key, (_, _, deadline) in list(self.pending.items()):
+            if deadline is not None and now >= deadline:
+                resolved += self._resolve(
+                    key,
+                    error=RuntimeError(
+                        f"Timed out waiting for the response to message header {key}"
+                    ),
+                )
+        return resolved
+
+    def _resolve(
+        self, key: str, response: Any = None, error: Exception | None = None
+    ) -> int:
+        entry = self.pending.pop(str(key), None)
+        if entry is None or entry[0].done():
+            return 0
+        if error is not None:
+            entry[0].set_exception(error)
+        else:
+            entry[0].set_result(response)
+        return 1
+
+    def _fail_all(self, exc: Exception) -> None:
+        for key in list(self.pending):
+            self._resolve(key, error=exc)
+
+
+def response_demultiplexer(host: Any) -> ResponseDemultiplexer:
+    """Return the demultiplexer of host for the running event loop."""
+    loop = asyncio.get_running_loop()
+    demux = host.__dict__.get("_iop_response_demux")
+    if demux is None or demux.loop is not loop or demux.iris_handle is not (
+        host.iris_handle
+    ):
+        demux = ResponseDemultiplexer(host.iris_handle, loop)
+        host._iop_response_demux = demux
+    return demux
+
+
+def _inproc_response(iris: Any, sent: Any) -> Any:
+    if type(sent).__module__.startswith("iris"):
+        return sent
+    if sent is not None and iris.system.Status.IsError(sent):
+        raise RuntimeError(iris.system.Status.GetOneStatusText(sent))
+    return None
@@ -1,7 +1,13 @@
 import ast
+import asyncio
+import linecache
+import os
 import textwrap
-from inspect import getsource
-from typing import Any, cast
+import threading
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from inspect import getsource, getsourcefile
+from typing import Any, TypeVar, cast
 
 from ..messages.base import _Message as Message
 from ..messages.decorators import (
@@ -15,11 +21,12 @@ from ..messages.dispatch import (
     dispatch_message,
     dispatch_serializer,
 )
-from ..production import TargetSettingRef, resolve_target
+from ..production.runtime import resolve_target
+from ..production.types import TargetSettingRef
 from ..runtime import iris as _iris
 from .async_request import AsyncRequest
 from .common import _Common
-from .generator_request import _GeneratorRequest
+from .generator_request import _collect_batch, _GeneratorRequest, _poll_limits
 
 _CONNECTION_METHODS = {
     "send_request_sync",
@@ -28,6 +35,10 @@ _CONNECTION_METHODS = {
     "send_generator_request",
 }
 _UNRESOLVED = object()
+_T = TypeVar("_T")
+# class -> ((source path, mtime), connection call sites)
+_connection_sites: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_connection_sites_lock = threading.Lock()
 
 
 def _call_name(node: ast.AST) -> str | None:
@@ -64,6 +75,55 @@ def _resolve_connection_target(host: Any, node: ast.AST) -> Any:
     return _UNRESOLVED
 
 
+def _class_connection_sites(klass: type) -> tuple[Any, ...]:
+    """Return the target argument of every connection call in klass's source.
+
+    Literal targets are returned as strings and the others as AST nodes that
+    are resolved against each instance. The result is cached per class and
+    parsed again when the modification time of its source file changes.
+    """
+    try:
+        path = getsourcefile(klass)
+        mtime = os.stat(path).st_mtime_ns if path else None
+    except (OSError, TypeError):
+        path = mtime = None
+
+    if path is not None:
+        with _connection_sites_lock:
+            cached = _connection_sites.get(klass)
+        if cached is not None and cached[0] == (path, mtime):
+            return cached[1]
+        linecache.checkcache(path)
+
+    sites = _parse_connection_sites(klass)
+    if path is not None:
+        with _connection_sites_lock:
+            _connection_sites[klass] = ((path, mtime), sites)
+    return sites
+
+
+def _parse_connection_sites(klass: type) -> tuple[Any, ...]:
+    tree = ast.parse(textwrap.dedent(getsource(klass)))
+    sites: list[Any] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        if _call_name(node.func) not in _CONNECTION_METHODS:
+            continue
+
+        target_node = _call_target_node(node)
+        if target_node is None:
+            continue
+        try:
+            value = ast.literal_eval(target_node)
+        except (ValueError, SyntaxError):
+            sites.append(target_node)
+            continue
+        if isinstance(value, str):
+            sites.append(value)
+    return tuple(sites)
+
+
 def _resolve_attribute_target(host: Any, node: ast.Attribute) -> Any:
     chain = []
     current: ast.AST = node
@@ -98,6 +158,48 @@ class _BusinessHost(_Common):
 
     buffer: int = 64000
     DISPATCH: list[tuple[str, str]] = []
+    # Receive messages as proxies that decode on first use; undecoded
+    # messages are forwarded as their original IRIS body.
+    LAZY_MESSAGES: bool = False
+    _event_loop: asyncio.AbstractEventLoop | None = None
+
+    def run_async(self, awaitable: Awaitable[_T]) -> _T:
+        """Run awaitable to completion on the component's event loop.
+
+        The loop is created on first use and closed when the component tears
+        down, so async clients opened by one message stay usable for the next.
+        dispatch_message() runs ``async def`` handlers through this method.
+        """
+        loop = self._event_loop
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            self._event_loop = loop
+        return loop.run_until_complete(awaitable)
+
+    def _close_event_loop(self) -> None:
+        """Cancel leftover tasks and close the component's event loop."""
+        loop, self._event_loop = self._event_loop, None
+        if loop is None or loop.is_closed():
+            return
+        try:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(
+                    asyncio.gather(*tasks, return_exceptions=True)
+                )
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+
+    def _dispatch_on_tear_down(self, host_object: Any) -> None:
+        """For internal use only."""
+        try:
+            super()._dispatch_on_tear_down(host_object)
+        finally:
+            self._close_event_loop()
 
     @input_serializer_param(1, "request")
     @output_deserializer
@@ -202,12 +304,107 @@ class _BusinessHost(_Common):
             description = f"{self.__class__.__name__} -> {target}"
         return await AsyncRequest(target, request, timeout, description, self)
 
+    async def send_many_async_ng(
+        self,
+        target_request: Iterable[tuple[str | TargetSettingRef, Message | Any]],
+        max_in_flight: int = 32,
+        timeout: int = -1,
+        overall_timeout: float | None = None,
+        description: str | None = None,
+    ) -> AsyncIterator[tuple[int, str, Any, int]]:
+        """Send many messages asynchronously and yield responses as they arrive.
+
+        At most max_in_flight requests are outstanding at any time; the next
+        (target, request) pair is taken from target_request as soon as a
+        response frees a slot, so the iterable may be a lazy generator. A
+        failed or timed out request is yielded with its RuntimeError as the
+        response and a status of 0 instead of ending the iteration.
+
+        Outstanding requests are cancelled when the iteration stops early.
+        Wrap the call in contextlib.aclosing() to cancel them as soon as the
+        loop is left, rather than when the generator is garbage collected.
+
+        Args:
+            target_request: Iterable of tuples (target, request) to send
+            max_in_flight: Maximum number of requests awaiting a response
+            timeout: Timeout in seconds for each request, -1 means wait forever
+            overall_timeout: Timeout in seconds for the whole fan-out, None
+                means wait forever
+            description: Optional description for logging
+
+        Yields:
+            Tuples (index, target, response, status) in completion order,
+            where index is the position of the request in target_request and
+            status is 1 for a response and 0 for an error
+
+        Raises:
+            ValueError: If max_in_flight is lower than 1
+            TypeError: If target_request contains something else than
+                (target, request) tuples
+            TimeoutError: If overall_timeout elapses before every response
+                arrives
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        loop = asyncio.get_running_loop()
+        deadline = None if overall_timeout is None else loop.time() + overall_timeout
+        pending_requests = enumerate(target_request)
+        in_flight: dict[AsyncRequest, tuple[int, str]] = {}
+        try:
+            while True:
+                while len(in_flight) < max_in_flight:
+                    item = next(pending_requests, None)
+                    if item is None:
+                        break
+                    index, pair = item
+                    if not (isinstance(pair, tuple) and len(pair) == 2):
+                        raise TypeError(
+                            "target_request must contain tuples of (target, request)"
+                        )
+                    target = cast(str, resolve_target(pair[0]))
+                    request_description = description
+                    if request_description is None:
+                        request_description = f"{self.__class__.__name__} -> {target}"
+                    future = AsyncRequest(
+                        target, pair[1], timeout, request_description, self
+                    )
+                    in_flight[future] = (index, target)
+                if not in_flight:
+                    return
+
+                wait_timeout = None
+                if deadline is not None:
+                    wait_timeout = max(0.0, deadline - loop.time())
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise TimeoutError(
+                        f"Timed out with {len(in_flight)} requests awaiting a response"
+                    )
+                for future in sorted(done, key=lambda f: in_flight[f][0]):
+                    index, target = in_flight.pop(future)
+                    if future.cancelled():
+                        continue
+                    error = future.exception()
+                    if error is None:
+                        yield index, target, future.result(), 1
+                    else:
+                        yield index, target, error, 0
+        finally:
+            for future in in_flight:
+                future.cancel()
+
     def send_generator_request(
         self,
         target: str | TargetSettingRef,
         request: Message | Any,
         timeout: int = -1,
         description: str | None = None,
+        batch_size: int = 1,
+        max_batch_bytes: int = 0,
+        max_batch_seconds: float = 0.0,
+        prefetch: bool = False,
     ) -> _GeneratorRequest:
         """Send message as a generator request to target component.
 
@@ -219,15 +416,33 @@ class _BusinessHost(_Common):
             request: Message to send
             timeout: Timeout in seconds, -1 means wait forever
             description: Optional description for logging
+            batch_size: Maximum number of items the target returns per poll;
+                1 polls for every item
+            max_batch_bytes: Close a batch once its pickled items reach this
+                size, 0 for no limit
+            max_batch_seconds: Close a batch once the target has collected
+                items for this long, 0 for no limit
+            prefetch: Poll for the next batch while the current one is consumed
         Returns:
             _GeneratorRequest: An instance of _GeneratorRequest to iterate over responses
         Raises:
             TypeError: If request is not of type Message
+            ValueError: If batch_size is lower than 1
         """
         target = cast(str, resolve_target(target))
         if description is None:
             description = f"{self.__class__.__name__} -> {target}"
-        return _GeneratorRequest(self, target, request, timeout, description)
+        return _GeneratorRequest(
+            self,
+            target,
+            request,
+            timeout,
+            description,
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+            max_batch_seconds=max_batch_seconds,
+            prefetch=prefetch,
+        )
 
     def send_multi_request_sync(
         self,
@@ -327,24 +542,19 @@ class _BusinessHost(_Common):
         Implement this method to allow connections between components to show up
         in the interoperability UI.
 
+        The call sites are read from the class source once and cached until
+        the source file changes; only their targets are resolved per call.
+
         Returns:
             A list containing all targets for this class.
         """
-        source = textwrap.dedent(getsource(self.__class__))
-        tree = ast.parse(source)
         target_list: list[str] = []
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
-            if _call_name(node.func) not in _CONNECTION_METHODS:
-                continue
-
-            target_node = _call_target_node(node)
-            if target_node is None:
-                continue
-
-            target = _resolve_connection_target(self, target_node)
+        for site in _class_connection_sites(self.__class__):
+            if isinstance(site, str):
+                target = site
+            else:
+                target = _resolve_connection_target(self, site)
             if isinstance(target, str) and target not in target_list:
                 target_list.append(target)
 
@@ -363,8 +573,14 @@ class _BusinessHost(_Common):
         return _iris.get_iris().IOP.Generator.Message.Ack._New()
 
     @output_serializer
-    def _dispatch_generator_poll(self) -> Any:
+    def _dispatch_generator_poll(self, poll: Any = None) -> Any:
         """For internal use only."""
+        batch_size, max_bytes, max_seconds = _poll_limits(poll)
+        if batch_size > 1:
+            response, self._gen = _collect_batch(
+                self._gen, batch_size, max_bytes, max_seconds
+            )
+            return response
         try:
             return next(self._gen)
         except StopIteration:
@@ -1,5 +1,7 @@
+import base64
 from typing import Any
 
+from ..messages.codecs import get_codec
 from ..messages.decorators import (
     input_deserializer,
     input_serializer_param,
@@ -7,8 +9,43 @@ from ..messages.decorators import (
 )
 from ..messages.dispatch import create_dispatch, dispatch_message
 from ..production import TargetSettingRef, resolve_target
+from ..runtime import iris as _iris
 from .business_host import _BusinessHost
 
+_SCALAR_TYPES = (str, int, float, bool, bytes)
+# Marks container values stored as base64 MessagePack in persistentProperties.
+_ENCODED_PREFIX = "\x00msgpack:"
+_UNSAVED = object()
+
+
+def _encode_persistent_value(value: Any) -> Any:
+    if type(value) in _SCALAR_TYPES and not (
+        isinstance(value, str) and value.startswith(_ENCODED_PREFIX)
+    ):
+        return value
+    payload = get_codec("msgpack").pack(value)
+    return _ENCODED_PREFIX + base64.b64encode(payload).decode("ascii")
+
+
+def _iris_value(value: Any) -> Any:
+    """Return value as IRIS hands it back: booleans and whole floats as ints."""
+    if type(value) is bool or (type(value) is float and value.is_integer()):
+        return int(value)
+    return value
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    # "1" == 1 in IRIS, but a string and a number are stored differently.
+    old, new = _iris_value(old), _iris_value(new)
+    return type(old) is type(new) and old == new
+
+
+def _decode_persistent_value(value: Any) -> Any:
+    if not (isinstance(value, str) and value.startswith(_ENCODED_PREFIX)):
+        return value
+    payload = base64.b64decode(value[len(_ENCODED_PREFIX) :])
+    return get_codec("msgpack").unpack(payload)
+
 
 class _BusinessProcess(_BusinessHost):
     """Business process component that contains routing and transformation logic.
@@ -198,31 +235,69 @@ class _BusinessProcess(_BusinessHost):
         return
 
     def _save_persistent_properties(self, host_object: Any) -> None:
-        """For internal use only."""
+        """For internal use only.
+
+        Writes the properties whose value changed since they were last
+        restored or saved, in one call. Scalars are stored as-is; other
+        values are stored MessagePack-encoded.
+        """
         if self.PERSISTENT_PROPERTY_LIST is None:
             return
+        snapshot = self._persistent_snapshot(host_object)
+        changes: list[Any] = []
         for prop in self.PERSISTENT_PROPERTY_LIST:
             val = getattr(self, prop, None)
-            typ = val.__class__.__name__
-            if typ in ["str", "int", "float", "bool", "bytes"]:
-                try:
-                    host_object.setPersistentProperty(prop, val)
-                except Exception:
-                    pass
+            try:
+                stored = _encode_persistent_value(val)
+            except Exception as exc:
+                if snapshot.get(prop, _UNSAVED) is not val:
+                    self.log_warning(
+                        f"Persistent property {prop} of type "
+                        f"{val.__class__.__name__} cannot be saved: {exc}"
+                    )
+                    snapshot[prop] = val
+                continue
+            if not _same_value(snapshot.get(prop, _UNSAVED), stored):
+                changes += (prop, stored)
+                snapshot[prop] = stored
+        if changes:
+            status = host_object.setPersistentProperties(changes)
+            _raise_on_error(status)
         return
 
     def _restore_persistent_properties(self, host_object: Any) -> None:
         """For internal use only."""
         if self.PERSISTENT_PROPERTY_LIST is None:
             return
+        values: dict[str, Any] = {}
+        status = host_object.getPersistentProperties(values)
+        _raise_on_error(status)
+        snapshot = self._persistent_snapshot(host_object)
         for prop in self.PERSISTENT_PROPERTY_LIST:
-            try:
-                val = host_object.getPersistentProperty(prop)
-                setattr(self, prop, val)
-            except Exception:
-                pass
+            if prop not in values:
+                snapshot.pop(prop, None)
+                continue
+            stored = values[prop]
+            setattr(self, prop, _decode_persistent_value(stored))
+            snapshot[prop] = stored
         return
 
+    def _persistent_snapshot(self, host_object: Any) -> dict[str, Any]:
+        """Return the stored values last seen for host_object's properties.
+
+        IRIS may pass a new wrapper for the same host on every callback, so
+        saved hosts are recognised by their ID rather than by the wrapper.
+        """
+        try:
+            host = host_object._Id() or host_object
+        except Exception:
+            host = host_object
+        seen = self.__dict__.get("_persistent_host")
+        if seen is not host and not (isinstance(host, str) and seen == host):
+            self._persistent_host = host
+            self._persistent_values = {}
+        return self._persistent_values
+
     def _dispatch_on_connected(self, host_object: Any) -> None:
         """For internal use only."""
         self.on_connected()
@@ -241,7 +316,7 @@ class _BusinessProcess(_BusinessHost):
     def _dispatch_on_tear_down(self, host_object: Any) -> None:
         """For internal use only."""
         self._restore_persistent_properties(host_object)
-        self.on_tear_down()
+        super()._dispatch_on_tear_down(host_object)
         self._save_persistent_properties(host_object)
         return
 
@@ -284,3 +359,8 @@ class _BusinessProcess(_BusinessHost):
         self._save_persistent_properties(host_object)
         return return_object
 
+
+def _raise_on_error(status: Any) -> None:
+    iris = _iris.get_iris()
+    if status is not None and iris.system.Status.IsError(status):
+        raise RuntimeError(iris.system.Status.GetOneStatusText(status))
@@ -1,12 +1,16 @@
 import inspect
-import traceback
+import sys
+import threading
 import warnings
+import weakref
+from collections.abc import Callable, Mapping
 from enum import Enum
 from types import UnionType
 from typing import (
     Annotated,
     Any,
     ClassVar,
+    NamedTuple,
     Union,
     get_args,
     get_origin,
@@ -14,6 +18,7 @@ from typing import (
 )
 
 from ..runtime import iris as _iris
+from ..runtime.class_version import class_version
 from .debugpy import debugpython
 from .log_manager import LogManager, logging
 from .settings import Setting
@@ -28,6 +33,9 @@ _EXCLUDED_SETTING_NAMES = {
     "logger",
     "iris_handle",
     "DISPATCH",
+    "LAZY_MESSAGES",
+    "LOG_BUFFER_SIZE",
+    "LOG_FLUSH_INTERVAL",
     "adapter",
     "Adapter",
     "buffer",
@@ -58,6 +66,96 @@ _SIMPLE_TYPE_NAMES = {
 }
 
 
+class SettingsCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+# class -> (class version, {"info": ..., "properties": ...})
+_SETTINGS_CACHE: weakref.WeakKeyDictionary[type, tuple[int, dict[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+_SETTINGS_CACHE_LOCK = threading.Lock()
+_settings_cache_hits = 0
+_settings_cache_misses = 0
+
+
+def _cached_metadata(cls: type, kind: str, build: Callable[[], Any]) -> Any:
+    global _settings_cache_hits, _settings_cache_misses
+
+    version = class_version(cls)
+    with _SETTINGS_CACHE_LOCK:
+        entry = _SETTINGS_CACHE.get(cls)
+        if entry is not None and entry[0] == version and kind in entry[1]:
+            _settings_cache_hits += 1
+            return entry[1][kind]
+        _settings_cache_misses += 1
+
+    value = build()
+    # Building may add attributes such as __annotations__ to the class, so the
+    # entry is stored under the version seen afterwards.
+    version = class_version(cls)
+    with _SETTINGS_CACHE_LOCK:
+        entry = _SETTINGS_CACHE.get(cls)
+        if entry is None or entry[0] != version:
+            entry = (version, {})
+            _SETTINGS_CACHE[cls] = entry
+        entry[1][kind] = value
+    return value
+
+
+def settings_cache_info() -> SettingsCacheInfo:
+    """Return hit/miss counters and the size of the settings metadata cache."""
+    with _SETTINGS_CACHE_LOCK:
+        return SettingsCacheInfo(
+            _settings_cache_hits, _settings_cache_misses, len(_SETTINGS_CACHE)
+        )
+
+
+def clear_settings_cache(klass: type | None = None) -> None:
+    """Invalidate cached settings metadata.
+
+    Args:
+        klass: Component class to invalidate. When omitted, every cached entry
+            is dropped and the hit/miss counters are reset.
+    """
+    global _settings_cache_hits, _settings_cache_misses
+
+    with _SETTINGS_CACHE_LOCK:
+        if klass is not None:
+            _SETTINGS_CACHE.pop(klass, None)
+            return
+        _SETTINGS_CACHE.clear()
+        _settings_cache_hits = 0
+        _settings_cache_misses = 0
+
+
+def settings_metadata(
+    classes: Mapping[str, Any],
+) -> dict[str, tuple[list[str], list[list[Any]]]]:
+    """Return ``(_get_info(), _get_properties())`` for every component class.
+
+    Takes a mapping like the ``CLASSES`` dict of a settings module; entries
+    that are not component classes are skipped. A class registered under
+    several names is analysed once.
+
+    This is a helper for tooling that inspects settings modules. Migration
+    does not use it: IOP.Utils imports each class inside IRIS when it
+    generates the proxy and calls ``_get_info()``/``_get_properties()`` there.
+    """
+    computed: dict[type, tuple[list[str], list[list[Any]]]] = {}
+    result: dict[str, tuple[list[str], list[list[Any]]]] = {}
+    for name, cls in classes.items():
+        if not (isinstance(cls, type) and issubclass(cls, _Common)):
+            continue
+        if cls not in computed:
+            computed[cls] = (cls._get_info(), cls._get_properties())
+        info, properties = computed[cls]
+        result[name] = (list(info), [list(row) for row in properties])
+    return result
+
+
 def _string_metadata(value: Any) -> str:
     if value is None:
         return ""
@@ -154,9 +252,14 @@ class _Common:
 
     INFO_URL: ClassVar[str]
     ICON_URL: ClassVar[str]
+    # Buffer up to LOG_BUFFER_SIZE log records and write them to IRIS in
+    # batches; 0 writes every record immediately.
+    LOG_BUFFER_SIZE: ClassVar[int] = 0
+    LOG_FLUSH_INTERVAL: ClassVar[float] = 1.0
     iris_handle: Any = None
     _log_to_console: bool = False
     _logger: logging.Logger | None = None
+    _trace_enabled: bool | None = None
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -205,9 +308,7 @@ class _Common:
     @property
     def logger(self) -> logging.Logger:
         if self._logger is None:
-            self._logger = LogManager.get_logger(
-                self.__class__.__name__, self.log_to_console
-            )
+            self._logger = self._create_logger(self.log_to_console)
         return self._logger
 
     @logger.setter
@@ -221,7 +322,50 @@ class _Common:
     @log_to_console.setter
     def log_to_console(self, value: bool) -> None:
         self._log_to_console = value
-        self.logger = LogManager.get_logger(self.__class__.__name__, value)
+        self._flush_logs()
+        self.logger = self._create_logger(value)
+
+    def _create_logger(self, to_console: bool) -> logging.Logger:
+        return LogManager.get_logger(
+            self.__class__.__name__,
+            to_console,
+            buffer_size=self.LOG_BUFFER_SIZE,
+            flush_interval=self.LOG_FLUSH_INTERVAL,
+        )
+
+    def _flush_logs(self) -> None:
+        """Write any buffered log records to IRIS.
+
+        Errors are reported on the console instead of raised, so a failed
+        flush never replaces the exception of the callback that logged.
+        """
+        if self._logger is None:
+            return
+        for log_handler in self._logger.handlers:
+            try:
+                log_handler.flush()
+            except Exception as e:
+                message = f"Failed to write buffered log records: {e!r}"
+                try:
+                    _iris.get_iris().cls("%SYS.System").WriteToConsoleLog(
+                        message, 0, 2, f"{self.__class__.__name__}._flush_logs"
+                    )
+                except Exception:
+                    try:
+                        warnings.warn(message, RuntimeWarning, stacklevel=2)
+                    except Exception:
+                        pass
+
+    def _trace_events_enabled(self) -> bool:
+        """Return whether the host item logs trace events, read once."""
+        if self._trace_enabled is None:
+            try:
+                self._trace_enabled = bool(self.iris_handle.IsTraceEnabled())
+            except Exception:
+                # No IRIS host yet (tests, local runs): keep trace output and
+                # ask again next time.
+                return True
+        return self._trace_enabled
 
     # Lifecycle methods
     def on_init(self) -> None:
@@ -273,11 +417,24 @@ class _Common:
 
     def _dispatch_on_tear_down(self, host_object: Any) -> None:
         self.on_tear_down()
+        self._flush_logs()
 
     def _set_iris_handles(self, handle_current: Any, handle_partner: Any) -> None:
         """Internal method to set IRIS handles."""
         pass
 
+    def _apply_settings(self, settings: dict[str, Any]) -> None:
+        """Set every production setting on the instance in one call.
+
+        Called once by IOP.Common.SetPropertyValues(); a setting that cannot
+        be assigned is logged and the others are still applied.
+        """
+        for name, value in settings.items():
+            try:
+                setattr(self, name, value)
+            except Exception as exc:
+                self.log_warning(f"Cannot apply setting {name}: {exc!r}")
+
     def _debugpy(self, host) -> None:
         """Set up debugpy for debugging."""
         if debugpython is not None:
@@ -288,6 +445,15 @@ class _Common:
     def _get_info(cls) -> list[str]:
         """Get component configuration information.
 
+        Computed once per class and reused until the class, one of its bases
+        or its module (on reload) changes; see _build_info().
+        """
+        return list(_cached_metadata(cls, "info", cls._build_info))
+
+    @classmethod
+    def _build_info(cls) -> list[str]:
+        """Compute component configuration information.
+
         Returns information used to display in Production config UI including:
         - Superclass
         - Description
@@ -353,6 +519,16 @@ class _Common:
     def _get_properties(cls) -> list[list[Any]]:
         """Get component properties for Production configuration.
 
+        Computed once per class and reused until the class, one of its bases
+        or its module (on reload) changes; see _build_properties().
+        """
+        properties = _cached_metadata(cls, "properties", cls._build_properties)
+        return [list(row) for row in properties]
+
+    @classmethod
+    def _build_properties(cls) -> list[list[Any]]:
+        """Compute component properties for Production configuration.
+
         Returns list of property definitions containing:
         - Property name
         - Data type
@@ -488,9 +664,9 @@ class _Common:
         current_class = self.__class__.__name__
         current_method = None
         try:
-            frame = traceback.extract_stack()[-4]
-            current_method = frame.name
-        except Exception:
+            # Skip this method, its caller and the public log_* method.
+            current_method = sys._getframe(3).f_code.co_name
+        except ValueError:
             pass
         return current_class, current_method
 
@@ -524,6 +700,10 @@ class _Common:
             message: Message to log
             to_console: If True, log to console instead of IRIS
         """
+        if to_console is None:
+            to_console = self.log_to_console
+        if not to_console and not self._trace_events_enabled():
+            return
         self._logging(message, logging.DEBUG, to_console)
 
     def log_info(self, message: str, to_console: bool | None = None) -> None:
@@ -1,12 +1,48 @@
+import itertools
+import pickle
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
-from ..messages.dispatch import dispatch_serializer
+from ..messages.base import _Message as Message
+from ..messages.dispatch import dispatch_deserializer, dispatch_serializer
+from ..messages.persistent import is_persistent_message_instance
 from ..runtime import iris as _iris
+from .async_request import _inproc_response
+
+_PREFETCH_MIN_INTERVAL = 0.001
+_PREFETCH_MAX_INTERVAL = 0.1
+
+
+@dataclass
+class _GeneratorBatch(Message):
+    """Several generator items returned by one poll, each pickled on its own.
+
+    The batch travels as a binary message, so the pickled items are copied
+    into the body as-is. ``done`` is set when the generator ended while the
+    batch was collected, so the consumer stops without sending another poll.
+    """
+
+    CODEC = "msgpack"
+
+    items: list[bytes] = field(default_factory=list)
+    done: bool = False
 
 
 class _GeneratorRequest:
     """Generator class to interetate over responses from a request.
-    This class is used to handle the responses from a request in a generator-like manner."""
+    This class is used to handle the responses from a request in a generator-like manner.
+
+    With batch_size > 1 every poll asks the target for up to batch_size items,
+    fewer when max_batch_bytes of pickled items or max_batch_seconds of
+    collection time are reached first, and the items are unpacked one by one.
+    With prefetch the poll for the next batch is sent before the items of the
+    current one are handed out, so the target produces it meanwhile. A caller
+    that stops early should close() the request, or use it as a context
+    manager, so that poll is not left outstanding.
+    """
 
     def __init__(
         self,
@@ -15,10 +51,24 @@ class _GeneratorRequest:
         request: Any,
         timeout: int = -1,
         description: str | None = None,
+        batch_size: int = 1,
+        max_batch_bytes: int = 0,
+        max_batch_seconds: float = 0.0,
+        prefetch: bool = False,
     ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         self.host = host
         self.target = target
         self.request = request
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_seconds = max_batch_seconds
+        self.prefetch = prefetch
+        self._items: deque[bytes] = deque()
+        self._stopped = False
+        self._prefetched: tuple[Any, Any, Any, Any] | None = None
 
         ack_response = self.host.send_request_sync(
             self.target,
@@ -33,11 +83,151 @@ class _GeneratorRequest:
     def __iter__(self):
         return self
 
+    def __enter__(self) -> "_GeneratorRequest":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop iterating and collect the response of a prefetched poll.
+
+        The unread items are discarded. Closing an exhausted or closed
+        request does nothing.
+        """
+        self._stopped = True
+        self._items.clear()
+        if self._prefetched is not None:
+            pending, self._prefetched = self._prefetched, None
+            self._wait_for_poll(pending)
+
     def __next__(self):
+        while not self._items:
+            if self._stopped:
+                raise StopIteration("No more responses available.")
+            rsp = self._next_response()
+            if not isinstance(rsp, _GeneratorBatch):
+                if rsp is None or (
+                    hasattr(rsp, "_IsA") and rsp._IsA("IOP.Generator.Message.Stop")
+                ):
+                    self._stopped = True
+                    raise StopIteration("No more responses available.")
+                return rsp
+            self._items.extend(rsp.items)
+            self._stopped = rsp.done
+        return pickle.loads(self._items.popleft())
+
+    def _new_poll(self) -> Any:
         poll = _iris.get_iris().IOP.Generator.Message.Poll._New()
-        rsp = self.host.send_request_sync(self.target, poll)
-        if rsp is None or (
-            hasattr(rsp, "_IsA") and rsp._IsA("IOP.Generator.Message.Stop")
-        ):
-            raise StopIteration("No more responses available.")
+        if self.batch_size > 1:
+            poll.BatchSize = self.batch_size
+            poll.MaxBytes = self.max_batch_bytes
+            poll.MaxSeconds = self.max_batch_seconds
+        return poll
+
+    def _next_response(self) -> Any:
+        if self._prefetched is not None:
+            pending, self._prefetched = self._prefetched, None
+            rsp = self._wait_for_poll(pending)
+        else:
+            rsp = self.host.send_request_sync(self.target, self._new_poll())
+        if self.prefetch and _has_more(rsp):
+            self._prefetched = self._send_poll()
         return rsp
+
+    def _send_poll(self) -> tuple[Any, Any, Any, Any]:
+        iris = _iris.get_iris()
+        message_header_id = iris.ref()
+        queue_name = iris.ref()
+        end_time = iris.ref()
+        sent = self.host.iris_handle.dispatchSendRequestAsyncNG(
+            self.target,
+            self._new_poll(),
+            self.timeout,
+            f"{self.host.__class__.__name__} -> {self.target}",
+            message_header_id,
+            queue_name,
+            end_time,
+        )
+        return sent, message_header_id.value, queue_name.value, end_time.value
+
+    def _wait_for_poll(self, pending: tuple[Any, Any, Any, Any]) -> Any:
+        sent, message_header_id, queue_name, end_time = pending
+        iris = _iris.get_iris()
+        if not message_header_id:
+            return dispatch_deserializer(_inproc_response(iris, sent))
+
+        response = iris.ref()
+        interval = _PREFETCH_MIN_INTERVAL
+        while True:
+            status = self.host.iris_handle.dispatchIsRequestDone(
+                self.timeout, end_time, queue_name, message_header_id, response
+            )
+            if status == 2:  # message found
+                return dispatch_deserializer(response.value)
+            if status != 1:  # anything but "message not found"
+                raise RuntimeError(iris.system.Status.GetOneStatusText(status))
+            time.sleep(interval)
+            interval = min(interval * 2, _PREFETCH_MAX_INTERVAL)
+
+
+def _has_more(rsp: Any) -> bool:
+    if isinstance(rsp, _GeneratorBatch):
+        return not rsp.done
+    return rsp is not None and not (
+        hasattr(rsp, "_IsA") and rsp._IsA("IOP.Generator.Message.Stop")
+    )
+
+
+def _poll_limits(poll: Any) -> tuple[int, int, float]:
+    """Return (batch_size, max_bytes, max_seconds) requested by a poll."""
+    if poll is None:
+        return 1, 0, 0.0
+    return (
+        int(getattr(poll, "BatchSize", 0) or 0),
+        int(getattr(poll, "MaxBytes", 0) or 0),
+        float(getattr(poll, "MaxSeconds", 0) or 0),
+    )
+
+
+def _pickle_item(item: Any) -> bytes | None:
+    """Return the pickled item, or None if it must be sent on its own."""
+    if type(item).__module__.startswith("iris") or is_persistent_message_instance(
+        item
+    ):
+        return None
+    try:
+        return pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
+def _collect_batch(
+    gen: Any, batch_size: int, max_bytes: int = 0, max_seconds: float = 0.0
+) -> tuple[Any, Iterator]:
+    """Pack the next items of gen into a _GeneratorBatch.
+
+    IRIS objects, persistent messages and items that fail to pickle end the
+    batch and are returned on their own by the next call, so they are sent
+    through dispatch_serializer as without batching. Returns the response and
+    the iterator to continue from.
+    """
+    gen = iter(gen)
+    deadline = time.monotonic() + max_seconds if max_seconds > 0 else None
+    items: list[bytes] = []
+    size = 0
+    for item in gen:
+        data = _pickle_item(item)
+        if data is None:
+            if not items:
+                return item, gen
+            return _GeneratorBatch(items), itertools.chain((item,), gen)
+        items.append(data)
+        size += len(data)
+        if (
+            len(items) >= batch_size
+            or (max_bytes > 0 and size >= max_bytes)
+            or (deadline is not None and time.monotonic() >= deadline)
+        ):
+            return _GeneratorBatch(items), gen
+    return _GeneratorBatch(items, done=True), gen
@@ -1,4 +1,6 @@
 import logging
+import time
+from collections.abc import Iterable
 
 from ..runtime import iris as _iris
 
@@ -7,13 +9,22 @@ class LogManager:
     """Manages logging integration between Python's logging module and IRIS."""
 
     @staticmethod
-    def get_logger(class_name: str, to_console: bool = False) -> logging.Logger:
+    def get_logger(
+        class_name: str,
+        to_console: bool = False,
+        buffer_size: int = 0,
+        flush_interval: float = 1.0,
+    ) -> logging.Logger:
         """Get a logger instance configured for IRIS integration.
 
         Args:
             class_name: Name of the class logging the message
             method_name: Optional name of the method logging the message
             to_console: If True, log to the console instead of IRIS
+            buffer_size: If greater than 0, buffer up to this many records
+                and write them to IRIS in batches
+            flush_interval: Maximum age in seconds of a buffered record
+                before the buffer is flushed
 
         Returns:
             Logger instance configured for IRIS integration
@@ -22,7 +33,14 @@ class LogManager:
 
         # Only add handler if none exists
         if not logger.handlers:
-            handler = IRISLogHandler(to_console=to_console)
+            if buffer_size > 0:
+                handler = BufferedIRISLogHandler(
+                    to_console=to_console,
+                    capacity=buffer_size,
+                    flush_interval=flush_interval,
+                )
+            else:
+                handler = IRISLogHandler(to_console=to_console)
             formatter = logging.Formatter("%(message)s")
             handler.setFormatter(formatter)
             logger.addHandler(handler)
@@ -74,23 +92,88 @@ class IRISLogHandler(logging.Handler):
         Args:
             record: The logging record to emit
         """
-        # Extract class and method names with fallbacks
-        class_name = getattr(record, "class_name", record.name)
-        method_name = getattr(record, "method_name", record.funcName)
-
-        # Format message and get full method path
-        message = self.format(record)
-        method_path = f"{class_name}.{method_name}"
-
-        # Determine if console logging should be used
-        use_console = self.to_console or getattr(record, "to_console", False)
-
-        if use_console:
-            _iris.get_iris().cls("%SYS.System").WriteToConsoleLog(
-                message, 0, self.level_map_console.get(record.levelno, 0), method_path
-            )
-        else:
-            log_level = self.level_map.get(record.levelno, 4)
-            _iris.get_iris().cls("Ens.Util.Log").Log(
-                log_level, class_name, method_name, message
-            )
+        self._write_records((record,))
+
+    def _write_records(self, records: Iterable[logging.LogRecord]) -> None:
+        iris = _iris.get_iris()
+        system = log = None
+        for record in records:
+            # Extract class and method names with fallbacks
+            class_name = getattr(record, "class_name", record.name)
+            method_name = getattr(record, "method_name", record.funcName)
+
+            # Format message and get full method path
+            message = self.format(record)
+            method_path = f"{class_name}.{method_name}"
+
+            # Determine if console logging should be used
+            use_console = self.to_console or getattr(record, "to_console", False)
+
+            if use_console:
+                if system is None:
+                    system = iris.cls("%SYS.System")
+                system.WriteToConsoleLog(
+                    message,
+                    0,
+                    self.level_map_console.get(record.levelno, 0),
+                    method_path,
+                )
+            else:
+                if log is None:
+                    log = iris.cls("Ens.Util.Log")
+                log_level = self.level_map.get(record.levelno, 4)
+                log.Log(log_level, class_name, method_name, message)
+
+
+class BufferedIRISLogHandler(IRISLogHandler):
+    """IRISLogHandler that queues records and writes them in batches.
+
+    The buffer is flushed when it holds ``capacity`` records, when a record at
+    ``flush_level`` or above arrives, when the oldest queued record is older
+    than ``flush_interval`` seconds (checked as records arrive), and when the
+    handler is flushed or closed. Components flush it when each IRIS callback
+    returns, so records never wait for the next message.
+    """
+
+    def __init__(
+        self,
+        to_console: bool = False,
+        capacity: int = 100,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.ERROR,
+    ):
+        super().__init__(to_console=to_console)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.buffer: list[logging.LogRecord] = []
+        self._oldest = 0.0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Freeze the message now; arguments may change before the flush.
+        record.msg = self.format(record)
+        record.args = None
+        if not self.buffer:
+            self._oldest = time.monotonic()
+        self.buffer.append(record)
+        if (
+            len(self.buffer) >= self.capacity
+            or record.levelno >= self.flush_level
+            or time.monotonic() - self._oldest >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            records, self.buffer = self.buffer, []
+            if records:
+                self._write_records(records)
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            super().close()
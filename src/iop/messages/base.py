@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
@@ -15,6 +15,8 @@ class _Message:
     """
 
     _iris_id: str | None = None
+    CODEC: ClassVar[str | None] = None
+    LAZY_BODY: ClassVar[bool] = False
 
     def get_iris_id(self) -> str | None:
         """Get the IRIS ID of the message."""
@@ -41,6 +43,8 @@ class _PydanticMessage(BaseModel):
     """
 
     _iris_id: str | None = None
+    CODEC: ClassVar[str | None] = None
+    LAZY_BODY: ClassVar[bool] = False
 
     def __init__(self, **data: Any):
         super().__init__(**data)
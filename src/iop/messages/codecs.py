@@ -0,0 +1,363 @@
+"""Binary message codecs carried in IOP.BinaryMessage bodies.
+
+JSON (IOP.Message) and pickle (IOP.PickleMessage) remain the default message
+formats. A message class opts into a registered binary codec by naming it in
+its ``CODEC`` class attribute::
+
+    @dataclass
+    class Reading(Message):
+        CODEC = "msgpack"
+        sensor: str = ""
+        values: list[float] = None
+"""
+
+from __future__ import annotations
+
+import struct
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import is_dataclass
+from typing import Any, cast
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+try:
+    import msgpack as _msgpack
+except ImportError:  # pragma: no cover - optional accelerator
+    _msgpack = None
+
+_FRAME = struct.Struct("!4sBQ")
+_FRAME_MAGIC = b"IOPB"
+_FRAME_VERSION = 1
+
+_CODECS: dict[str, MessageCodec] = {}
+_CODECS_LOCK = threading.Lock()
+
+
+class CodecError(Exception):
+    """Raised when a binary payload cannot be encoded or decoded."""
+
+    pass
+
+
+class MessageCodec(ABC):
+    """Base class for binary message codecs.
+
+    Subclasses set ``name`` and implement ``pack``/``unpack`` for plain Python
+    values (dict, list, str, bytes, numbers, bool, None). Converting messages
+    to and from those values, and framing the payload, is handled here. A
+    subclass missing either method cannot be instantiated, so it is rejected
+    before it can be registered.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def pack(self, data: Any) -> bytes:
+        """Serialize plain Python values to bytes."""
+
+    @abstractmethod
+    def unpack(self, payload: bytes) -> Any:
+        """Deserialize bytes produced by pack()."""
+
+    def encode(self, message: Any) -> bytes:
+        """Encode a message instance into a framed payload."""
+        body = self.pack(message_to_data(message))
+        return _FRAME.pack(_FRAME_MAGIC, _FRAME_VERSION, len(body)) + body
+
+    def decode(self, msg_class: type, payload: bytes | bytearray | memoryview) -> Any:
+        """Decode a framed payload into an instance of msg_class."""
+        if len(payload) < _FRAME.size:
+            raise CodecError("Binary message payload is truncated")
+        magic, version, size = _FRAME.unpack_from(payload)
+        if magic != _FRAME_MAGIC or version != _FRAME_VERSION:
+            raise CodecError("Binary message payload has an unknown frame header")
+        body = memoryview(payload)[_FRAME.size :]
+        if len(body) != size:
+            raise CodecError(
+                f"Binary message payload size mismatch: expected {size} bytes, "
+                f"got {len(body)}"
+            )
+        return data_to_message(msg_class, self.unpack(bytes(body)))
+
+
+class MsgpackCodec(MessageCodec):
+    """Schema-less MessagePack codec.
+
+    Uses the ``msgpack`` package when it is installed and a built-in encoder
+    for the same wire format otherwise. Only plain data types are produced on
+    decode; no code is executed while reading a payload.
+    """
+
+    name = "msgpack"
+
+    def pack(self, data: Any) -> bytes:
+        if _msgpack is not None:
+            return cast(
+                bytes, _msgpack.packb(data, default=_fallback, use_bin_type=True)
+            )
+        out = bytearray()
+        _pack_value(out, data)
+        return bytes(out)
+
+    def unpack(self, payload: bytes) -> Any:
+        if _msgpack is not None:
+            return _msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        value, offset = _unpack_value(payload, 0)
+        if offset != len(payload):
+            raise CodecError("Trailing bytes after MessagePack value")
+        return value
+
+
+def register_codec(codec: MessageCodec) -> MessageCodec:
+    """Register a binary codec under its ``name``.
+
+    Registering the same name again replaces the codec. The names ``json``
+    and ``pickle`` are reserved for the built-in message formats.
+    """
+    if not codec.name:
+        raise ValueError("Codec must define a name")
+    if codec.name in ("json", "pickle"):
+        raise ValueError(f"Codec name '{codec.name}' is reserved")
+    with _CODECS_LOCK:
+        _CODECS[codec.name] = codec
+    return codec
+
+
+def get_codec(name: str) -> MessageCodec:
+    """Return the registered codec called name."""
+    try:
+        return _CODECS[name]
+    except KeyError:
+        raise CodecError(f"Unknown message codec '{name}'") from None
+
+
+def message_codec(message: Any) -> MessageCodec | None:
+    """Return the binary codec declared by a message class, if any."""
+    name = getattr(type(message), "CODEC", None)
+    if not name or name in ("json", "pickle"):
+        return None
+    return get_codec(name)
+
+
+def message_to_data(message: Any) -> Any:
+    """Convert a Message or PydanticMessage into plain Python data."""
+    if isinstance(message, BaseModel):
+        return message.model_dump()
+    if is_dataclass(message):
+        from .serialization import _json_ready_object
+
+        return _json_ready_object(message)
+    raise CodecError(f"Object {message} must be a Pydantic model or dataclass Message")
+
+
+def data_to_message(msg_class: type, data: Any) -> Any:
+    """Build a message instance from decoded plain Python data."""
+    if not isinstance(data, dict):
+        raise CodecError("Binary message payload must decode to a mapping")
+    if issubclass(msg_class, BaseModel):
+        return msg_class.model_validate(data)
+    if is_dataclass(msg_class):
+        from .serialization import dataclass_from_dict
+
+        return dataclass_from_dict(msg_class, data)
+    raise CodecError(f"Class {msg_class} must be a Pydantic model or dataclass")
+
+
+def _fallback(value: Any) -> Any:
+    # Values without a native MessagePack type (dates, Decimal, UUID, sets,
+    # nested models) use their JSON representation; typed message fields
+    # restore them on decode.
+    if isinstance(value, tuple):
+        return list(value)
+    return to_jsonable_python(value)
+
+
+def _pack_value(out: bytearray, value: Any) -> None:
+    if value is None:
+        out.append(0xC0)
+    elif value is True:
+        out.append(0xC3)
+    elif value is False:
+        out.append(0xC2)
+    elif isinstance(value, int):
+        _pack_int(out, value)
+    elif isinstance(value, float):
+        out.append(0xCB)
+        out += struct.pack("!d", value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        size = len(data)
+        if size < 32:
+            out.append(0xA0 | size)
+        elif size < 0x100:
+            out += struct.pack("!BB", 0xD9, size)
+        elif size < 0x10000:
+            out += struct.pack("!BH", 0xDA, size)
+        else:
+            out += struct.pack("!BI", 0xDB, size)
+        out += data
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = bytes(value)
+        size = len(data)
+        if size < 0x100:
+            out += struct.pack("!BB", 0xC4, size)
+        elif size < 0x10000:
+            out += struct.pack("!BH", 0xC5, size)
+        else:
+            out += struct.pack("!BI", 0xC6, size)
+        out += data
+    elif isinstance(value, (list, tuple)):
+        size = len(value)
+        if size < 16:
+            out.append(0x90 | size)
+        elif size < 0x10000:
+            out += struct.pack("!BH", 0xDC, size)
+        else:
+            out += struct.pack("!BI", 0xDD, size)
+        for item in value:
+            _pack_value(out, item)
+    elif isinstance(value, dict):
+        size = len(value)
+        if size < 16:
+            out.append(0x80 | size)
+        elif size < 0x10000:
+            out += struct.pack("!BH", 0xDE, size)
+        else:
+            out += struct.pack("!BI", 0xDF, size)
+        for key, item in value.items():
+            _pack_value(out, key)
+            _pack_value(out, item)
+    else:
+        _pack_value(out, _fallback(value))
+
+
+def _pack_int(out: bytearray, value: int) -> None:
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out += struct.pack("!b", value)
+    elif 0 <= value < 0x100:
+        out += struct.pack("!BB", 0xCC, value)
+    elif 0 <= value < 0x10000:
+        out += struct.pack("!BH", 0xCD, value)
+    elif 0 <= value < 0x100000000:
+        out += struct.pack("!BI", 0xCE, value)
+    elif 0 <= value < 0x10000000000000000:
+        out += struct.pack("!BQ", 0xCF, value)
+    elif -0x80 <= value < 0:
+        out += struct.pack("!Bb", 0xD0, value)
+    elif -0x8000 <= value < 0:
+        out += struct.pack("!Bh", 0xD1, value)
+    elif -0x80000000 <= value < 0:
+        out += struct.pack("!Bi", 0xD2, value)
+    elif -0x8000000000000000 <= value < 0:
+        out += struct.pack("!Bq", 0xD3, value)
+    else:
+        # Same error as the msgpack package, so payloads do not depend on
+        # which packer is installed.
+        raise OverflowError("Integer value out of range")
+
+
+_FIXED_FORMATS = {
+    0xCA: struct.Struct("!f"),
+    0xCB: struct.Struct("!d"),
+    0xCC: struct.Struct("!B"),
+    0xCD: struct.Struct("!H"),
+    0xCE: struct.Struct("!I"),
+    0xCF: struct.Struct("!Q"),
+    0xD0: struct.Struct("!b"),
+    0xD1: struct.Struct("!h"),
+    0xD2: struct.Struct("!i"),
+    0xD3: struct.Struct("!q"),
+}
+_SIZE_FORMATS = {
+    0xC4: struct.Struct("!B"),
+    0xC5: struct.Struct("!H"),
+    0xC6: struct.Struct("!I"),
+    0xD9: struct.Struct("!B"),
+    0xDA: struct.Struct("!H"),
+    0xDB: struct.Struct("!I"),
+    0xDC: struct.Struct("!H"),
+    0xDD: struct.Struct("!I"),
+    0xDE: struct.Struct("!H"),
+    0xDF: struct.Struct("!I"),
+}
+
+
+def _unpack_value(data: bytes, offset: int) -> tuple[Any, int]:
+    try:
+        code = data[offset]
+    except IndexError:
+        raise CodecError("MessagePack payload is truncated") from None
+    offset += 1
+
+    if code < 0x80:
+        return code, offset
+    if code >= 0xE0:
+        return code - 0x100, offset
+    if 0xA0 <= code <= 0xBF:
+        return _read_str(data, offset, code & 0x1F)
+    if 0x90 <= code <= 0x9F:
+        return _read_array(data, offset, code & 0x0F)
+    if 0x80 <= code <= 0x8F:
+        return _read_map(data, offset, code & 0x0F)
+    if code == 0xC0:
+        return None, offset
+    if code == 0xC2:
+        return False, offset
+    if code == 0xC3:
+        return True, offset
+
+    fixed = _FIXED_FORMATS.get(code)
+    if fixed is not None:
+        _check_available(data, offset, fixed.size)
+        return fixed.unpack_from(data, offset)[0], offset + fixed.size
+
+    sized = _SIZE_FORMATS.get(code)
+    if sized is None:
+        raise CodecError(f"Unsupported MessagePack type code 0x{code:02x}")
+    _check_available(data, offset, sized.size)
+    size = sized.unpack_from(data, offset)[0]
+    offset += sized.size
+    if code in (0xC4, 0xC5, 0xC6):
+        _check_available(data, offset, size)
+        return bytes(data[offset : offset + size]), offset + size
+    if code in (0xD9, 0xDA, 0xDB):
+        return _read_str(data, offset, size)
+    if code in (0xDC, 0xDD):
+        return _read_array(data, offset, size)
+    return _read_map(data, offset, size)
+
+
+def _check_available(data: bytes, offset: int, size: int) -> None:
+    if offset + size > len(data):
+        raise CodecError("MessagePack payload is truncated")
+
+
+def _read_str(data: bytes, offset: int, size: int) -> tuple[str, int]:
+    _check_available(data, offset, size)
+    return bytes(data[offset : offset + size]).decode("utf-8"), offset + size
+
+
+def _read_array(data: bytes, offset: int, size: int) -> tuple[list, int]:
+    items = []
+    for _ in range(size):
+        item, offset = _unpack_value(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _read_map(data: bytes, offset: int, size: int) -> tuple[dict, int]:
+    result = {}
+    for _ in range(size):
+        key, offset = _unpack_value(data, offset)
+        value, offset = _unpack_value(data, offset)
+        if isinstance(key, list):
+            key = tuple(key)
+        result[key] = value
+    return result, offset
+
+
+register_codec(MsgpackCodec())
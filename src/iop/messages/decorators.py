@@ -54,18 +54,31 @@ def input_deserializer(fonction: Callable) -> Callable:
 
     @wraps(fonction)
     def _dispatch_deserializer(self, *params: Any, **param2: Any) -> Any:
-        serialized = [dispatch_deserializer(param) for param in params]
-        param2 = {key: dispatch_deserializer(value) for key, value in param2.items()}
+        lazy = getattr(self, "LAZY_MESSAGES", False)
+        serialized = [dispatch_deserializer(param, lazy=lazy) for param in params]
+        param2 = {
+            key: dispatch_deserializer(value, lazy=lazy)
+            for key, value in param2.items()
+        }
         return fonction(self, *serialized, **param2)
 
     return _dispatch_deserializer
 
 
 def output_serializer(fonction: Callable) -> Callable:
-    """Decorator that serializes function output."""
+    """Decorator that serializes function output.
+
+    Also writes the component's buffered log records once the callback
+    returns, so an idle component does not hold on to them.
+    """
 
     @wraps(fonction)
     def _dispatch_serializer(self, *params: Any, **param2: Any) -> Any:
-        return dispatch_serializer(fonction(self, *params, **param2))
+        try:
+            return dispatch_serializer(fonction(self, *params, **param2))
+        finally:
+            flush_logs = getattr(self, "_flush_logs", None)
+            if flush_logs is not None:
+                flush_logs()
 
     return _dispatch_serializer
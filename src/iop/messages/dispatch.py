@@ -1,10 +1,17 @@
 import ast
+import asyncio
+import inspect
 import logging
+import threading
+import weakref
 from collections.abc import Callable
 from dataclasses import dataclass
 from inspect import Parameter, signature
-from typing import Any
+from typing import Any, NamedTuple
 
+from ..runtime.class_version import class_version
+from .codecs import message_codec
+from .lazy import LazyMessage, materialize, pass_through
 from .persistent import (
     deserialize_persistent_message,
     get_iris_object_classname,
@@ -13,8 +20,11 @@ from .persistent import (
     serialize_persistent_message,
 )
 from .serialization import (
+    deserialize_binary_message,
     deserialize_message,
     deserialize_pickle_message,
+    serialize_binary_message,
+    serialize_binary_message_generator,
     serialize_message,
     serialize_message_generator,
     serialize_pickle_message,
@@ -36,7 +46,12 @@ _PICKLE_MESSAGE_CLASSES = {
     "IOP.PickleMessage",
     "IOP.Generator.Message.StartPickle",
 }
+_BINARY_MESSAGE_CLASSES = {
+    "IOP.BinaryMessage",
+    "IOP.Generator.Message.StartBinary",
+}
 _HANDLER_ATTRIBUTE = "__iop_handler_message__"
+_INDEX_ATTRIBUTE = "_iop_dispatch_index"
 _IRIS_MODULE_PREFIX = "iris."
 _UNRESOLVED = object()
 
@@ -50,6 +65,79 @@ class _DispatchCandidate:
     index: int
 
 
+@dataclass(frozen=True)
+class _DispatchTable:
+    version: tuple
+    entries: tuple[tuple[str, str], ...]
+    warnings: tuple[str, ...]
+
+
+class _DispatchIndex:
+    """Compiled routing index for one host's dispatch table.
+
+    Maps message keys to their position in DISPATCH so the first matching
+    entry still wins, and memoizes the resolved handler per Python type.
+    """
+
+    def __init__(self, host: Any, dispatch: list[tuple[str, str]]) -> None:
+        self.host = host
+        self.source = dispatch
+        self.size = len(dispatch)
+        self.positions: dict[str, tuple[int, str]] = {}
+        for position, (message, method) in enumerate(dispatch):
+            self.positions.setdefault(message, (position, method))
+        self.by_type: dict[type, Callable | None] = {}
+
+    def is_current(self, dispatch: Any) -> bool:
+        return dispatch is self.source and len(dispatch) == self.size
+
+    def handler_for(self, request: Any) -> Callable | None:
+        klass = type(request)
+        if klass is LazyMessage:
+            # Route on the proxied message class without decoding the body.
+            klass = request.__class__
+        elif klass.__module__.startswith("iris"):
+            # Every native IRIS object shares one Python type, so the IRIS
+            # classname has to be read per message.
+            return self._handler_for_keys(_message_keys_from_request(request))
+
+        try:
+            return self.by_type[klass]
+        except KeyError:
+            method = self.by_type[klass] = self._handler_for_type(klass)
+            return method
+
+    def _handler_for_type(self, klass: type) -> Callable | None:
+        for base in klass.__mro__:
+            if base is object:
+                break
+            method = self._handler_for_keys((_python_class_key(base),))
+            if method is not None:
+                return method
+        return None
+
+    def _handler_for_keys(self, keys: tuple[str, ...]) -> Callable | None:
+        matches = [self.positions[key] for key in keys if key in self.positions]
+        if not matches:
+            return None
+        _, method = min(matches)
+        return getattr(self.host, method)
+
+
+class DispatchCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+_DISPATCH_CACHE: weakref.WeakKeyDictionary[type, _DispatchTable] = (
+    weakref.WeakKeyDictionary()
+)
+_DISPATCH_CACHE_LOCK = threading.Lock()
+_dispatch_cache_hits = 0
+_dispatch_cache_misses = 0
+
+
 def handler(message_type: Any) -> Callable[[Callable], Callable]:
     """Declare a method as the handler for a message type.
 
@@ -86,10 +174,21 @@ def dispatch_serializer(message: Any, is_generator: bool = False) -> Any:
     Raises:
         TypeError: If message is invalid type
     """
+    if type(message) is LazyMessage:
+        serial = None if is_generator else pass_through(message)
+        if serial is not None:
+            return serial
+        message = materialize(message)
+
     if message is not None:
         if is_persistent_message_instance(message):
             return serialize_persistent_message(message, is_generator=is_generator)
         elif is_message_instance(message):
+            codec = message_codec(message)
+            if codec is not None:
+                if is_generator:
+                    return serialize_binary_message_generator(message, codec)
+                return serialize_binary_message(message, codec)
             if is_generator:
                 return serialize_message_generator(message)
             return serialize_message(message)
@@ -113,11 +212,13 @@ def dispatch_serializer(message: Any, is_generator: bool = False) -> Any:
     )
 
 
-def dispatch_deserializer(serial: Any) -> Any:
+def dispatch_deserializer(serial: Any, lazy: bool = False) -> Any:
     """Deserializes the message based on its type.
 
     Args:
         serial: The serialized message
+        lazy: Return JSON, pickle and binary messages as LazyMessage proxies
+            that decode on first attribute access
 
     Returns:
         The deserialized message
@@ -128,20 +229,26 @@ def dispatch_deserializer(serial: Any) -> Any:
     iris_classname = get_iris_object_classname(serial)
 
     if iris_classname in _MESSAGE_CLASSES:
-        return deserialize_message(serial)
+        return deserialize_message(serial, lazy=lazy)
 
     if iris_classname in _PICKLE_MESSAGE_CLASSES:
-        return deserialize_pickle_message(serial)
+        return deserialize_pickle_message(serial, lazy=lazy)
+
+    if iris_classname in _BINARY_MESSAGE_CLASSES:
+        return deserialize_binary_message(serial, lazy=lazy)
 
     deserialized = deserialize_persistent_message(serial, iris_classname=iris_classname)
     if deserialized is not serial:
         return deserialized
 
     if serial._IsA("IOP.Message"):
-        return deserialize_message(serial)
+        return deserialize_message(serial, lazy=lazy)
 
     if serial._IsA("IOP.PickleMessage"):
-        return deserialize_pickle_message(serial)
+        return deserialize_pickle_message(serial, lazy=lazy)
+
+    if serial._IsA("IOP.BinaryMessage"):
+        return deserialize_binary_message(serial, lazy=lazy)
 
     return serial
 
@@ -152,25 +259,137 @@ def dispatch_message(host: Any, request: Any) -> Any:
     Args:
         request: The request object
 
+    Handlers defined with ``async def`` are run to completion on the host's
+    event loop.
+
     Returns:
         The response object
     """
     call = "on_message"
 
-    message_names = _message_keys_from_request(request)
+    method = _dispatch_index(host).handler_for(request)
+    if method is None:
+        method = getattr(host, call)
+
+    response = method(request)
+    if inspect.iscoroutine(response):
+        return _run_coroutine(host, response)
+    return response
 
-    for msg, method in host.DISPATCH:
-        if msg in message_names:
-            return getattr(host, method)(request)
 
-    return getattr(host, call)(request)
+def _run_coroutine(host: Any, coroutine: Any) -> Any:
+    run_async = getattr(host, "run_async", None)
+    if run_async is None:
+        return asyncio.run(coroutine)
+    return run_async(coroutine)
 
 
 def create_dispatch(host: Any) -> None:
     """Creates a dispatch table mapping class names to their handler methods.
     The dispatch table consists of tuples of (fully_qualified_class_name, method_name).
     Only methods that take a single typed parameter are considered as handlers.
+
+    The table is computed once per component class and reused by every
+    instance until the class (or one of its bases) changes.
     """
+    global _dispatch_cache_hits, _dispatch_cache_misses
+
+    klass = type(host)
+    if _has_instance_handlers(host):
+        entries, warnings = _build_dispatch(host)
+        _emit_dispatch_warnings(host, warnings)
+        host.DISPATCH = entries
+        _dispatch_index(host)
+        return
+
+    version = (class_version(klass), tuple(_declared_dispatch(host)))
+    with _DISPATCH_CACHE_LOCK:
+        table = _cached_dispatch_table(klass)
+        if table is not None and table.version == version:
+            _dispatch_cache_hits += 1
+        else:
+            table = None
+            _dispatch_cache_misses += 1
+
+    if table is None:
+        entries, warnings = _build_dispatch(host)
+        table = _DispatchTable(version, tuple(entries), tuple(warnings))
+        with _DISPATCH_CACHE_LOCK:
+            try:
+                _DISPATCH_CACHE[klass] = table
+            except TypeError:
+                pass
+
+    _emit_dispatch_warnings(host, table.warnings)
+    host.DISPATCH = list(table.entries)
+    _dispatch_index(host)
+
+
+def dispatch_cache_info() -> DispatchCacheInfo:
+    """Return hit/miss counters and the size of the dispatch table cache."""
+    with _DISPATCH_CACHE_LOCK:
+        return DispatchCacheInfo(
+            _dispatch_cache_hits, _dispatch_cache_misses, len(_DISPATCH_CACHE)
+        )
+
+
+def clear_dispatch_cache(klass: type | None = None) -> None:
+    """Invalidate cached dispatch tables.
+
+    Args:
+        klass: Component class to invalidate. When omitted, every cached table
+            is dropped and the hit/miss counters are reset.
+    """
+    global _dispatch_cache_hits, _dispatch_cache_misses
+
+    with _DISPATCH_CACHE_LOCK:
+        if klass is not None:
+            try:
+                _DISPATCH_CACHE.pop(klass, None)
+            except TypeError:
+                pass
+            return
+        _DISPATCH_CACHE.clear()
+        _dispatch_cache_hits = 0
+        _dispatch_cache_misses = 0
+
+
+def _dispatch_index(host: Any) -> _DispatchIndex:
+    dispatch = host.DISPATCH
+    index = getattr(host, _INDEX_ATTRIBUTE, None)
+    if index is None or not index.is_current(dispatch):
+        index = _DispatchIndex(host, dispatch)
+        try:
+            setattr(host, _INDEX_ATTRIBUTE, index)
+        except AttributeError:
+            pass
+    return index
+
+
+def _cached_dispatch_table(klass: type) -> _DispatchTable | None:
+    try:
+        return _DISPATCH_CACHE.get(klass)
+    except TypeError:
+        return None
+
+
+def _has_instance_handlers(host: Any) -> bool:
+    # Handlers bound on the instance itself cannot be shared through the
+    # class-level cache.
+    for name, value in getattr(host, "__dict__", {}).items():
+        if _handler_message(value) is not None:
+            return True
+        if not name.startswith("_") and inspect.isroutine(value):
+            return True
+    return False
+
+
+def _emit_dispatch_warnings(host: Any, warnings: tuple[str, ...] | list[str]) -> None:
+    for message in warnings:
+        _log_dispatch_warning(host, message)
+
+
+def _build_dispatch(host: Any) -> tuple[list[tuple[str, str]], list[str]]:
     candidates: list[_DispatchCandidate] = []
     index = 0
 
@@ -199,7 +418,9 @@ def create_dispatch(host: Any) -> None:
             )
             index += 1
 
-    host.DISPATCH = _deduplicate_dispatch(host, candidates)
+    warnings: list[str] = []
+    entries = _deduplicate_dispatch(candidates, warnings)
+    return entries, warnings
 
 
 def _declared_dispatch(host: Any) -> list[tuple[str, str]]:
@@ -235,7 +456,7 @@ def _decorated_dispatch(host: Any) -> list[tuple[str, str]]:
 
 
 def _deduplicate_dispatch(
-    host: Any, candidates: list[_DispatchCandidate]
+    candidates: list[_DispatchCandidate], warnings: list[str]
 ) -> list[tuple[str, str]]:
     selected: dict[str, _DispatchCandidate] = {}
 
@@ -251,10 +472,10 @@ def _deduplicate_dispatch(
             continue
 
         if _is_higher_priority(candidate, current):
-            _log_duplicate_mapping(host, kept=candidate, discarded=current)
+            warnings.append(_duplicate_mapping(kept=candidate, discarded=current))
             selected[candidate.message] = candidate
         else:
-            _log_duplicate_mapping(host, kept=current, discarded=candidate)
+            warnings.append(_duplicate_mapping(kept=current, discarded=candidate))
 
     return [
         (candidate.message, candidate.method)
@@ -270,14 +491,15 @@ def _is_higher_priority(
     return candidate.index > current.index
 
 
-def _log_duplicate_mapping(
-    host: Any, kept: _DispatchCandidate, discarded: _DispatchCandidate
-) -> None:
-    message = (
+def _duplicate_mapping(kept: _DispatchCandidate, discarded: _DispatchCandidate) -> str:
+    return (
         f"Duplicate dispatch mapping for {kept.message}: "
         f"keeping {kept.method} from {kept.source}; "
         f"discarding {discarded.method} from {discarded.source}."
     )
+
+
+def _log_dispatch_warning(host: Any, message: str) -> None:
     log_warning = getattr(host, "log_warning", None)
     if callable(log_warning):
         try:
@@ -0,0 +1,373 @@
+"""Property path access for the IOP.Message virtual document used by DTLs.
+
+IOP.Message.GetValueAt() and SetValueAt() delegate to a DTLDocument kept on
+the message for the length of a transform: the JSON body is parsed once on
+first access, assignments edit the parsed document in place, and the body is
+serialized once when the message is read, saved or its json property is set.
+Property paths ("list_post(2).Title") are converted to JSONPath and compiled
+once per distinct path.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import re
+from functools import lru_cache
+from typing import Any
+
+from jsonpath_ng.parser import parse as _parse_jsonpath
+
+_PATH_CACHE_SIZE = 1024
+_TRANSFORM_CACHE_SIZE = 256
+_BRACKETS = re.compile(r"\[([^\]]*)\]")
+_ACTIONS = ("set", "append", "remove", "insert")
+_UNPARSED = object()
+
+
+def _zero_based(match: re.Match) -> str:
+    index = match.group(1)
+    try:
+        number = int(index)
+    except ValueError:
+        return match.group(0)
+    return f"[{number - 1}]" if number else match.group(0)
+
+
+@lru_cache(maxsize=_PATH_CACHE_SIZE)
+def convert_path(property_path: str) -> str:
+    """Convert a DTL property path to JSONPath.
+
+    ``()`` becomes ``[*]``, ``(n)`` becomes ``[n-1]`` and other parentheses
+    become brackets, as IOP.Message.ConvertPath() does.
+    """
+    path = property_path.replace("()", "[*]").replace("(", "[").replace(")", "]")
+    return _BRACKETS.sub(_zero_based, path)
+
+
+class CompiledPath:
+    """A JSONPath compiled for repeated use.
+
+    Paths made only of field names and positive indexes ("a.b[0].c") are
+    resolved by walking the document directly: jsonpath_ng's
+    update_or_create() visits the whole document on every call. Other paths,
+    and simple paths that do not fit the document, use jsonpath_ng.
+    """
+
+    __slots__ = ("_expr", "jsonpath", "steps")
+
+    def __init__(self, jsonpath: str) -> None:
+        self.jsonpath = jsonpath
+        self.steps = _simple_steps(jsonpath)
+        self._expr: Any = None
+
+    @property
+    def expr(self) -> Any:
+        if self._expr is None:
+            self._expr = _parse_jsonpath(self.jsonpath)
+        return self._expr
+
+    def values(self, data: Any) -> list[Any]:
+        if self.steps is not None:
+            node = data
+            for step in self.steps:
+                if isinstance(step, int):
+                    if not isinstance(node, list):
+                        break
+                    if step >= len(node):
+                        return []
+                    node = node[step]
+                elif not isinstance(node, dict):
+                    break
+                elif step not in node:
+                    return []
+                else:
+                    node = node[step]
+            else:
+                return [node]
+        return [match.value for match in self.expr.find(data)]
+
+    def update_or_create(self, data: Any, value: Any) -> Any:
+        if self.steps is not None and isinstance(data, dict):
+            node = data
+            for position, step in enumerate(self.steps[:-1]):
+                if isinstance(step, int):
+                    if not isinstance(node, list) or step >= len(node):
+                        break
+                    node = node[step]
+                elif not isinstance(node, dict):
+                    break
+                elif step in node:
+                    node = node[step]
+                elif any(isinstance(rest, int) for rest in self.steps[position:]):
+                    # Missing lists are created by jsonpath_ng.
+                    break
+                else:
+                    node[step] = node = {}
+            else:
+                last = self.steps[-1]
+                if isinstance(last, str) and isinstance(node, dict):
+                    node[last] = value
+                    return data
+                if isinstance(last, int) and isinstance(node, list) and last < len(node):
+                    node[last] = value
+                    return data
+        return self.expr.update_or_create(data, value)
+
+    def remove(self, data: Any, key: str = "") -> bool:
+        """Remove the values at this path from data, in place.
+
+        With a key, the key is removed from each matched dict, or the item at
+        that 1-based position from each matched list, instead. Returns whether
+        anything was removed.
+        """
+        matches = self.values(data)
+        if not matches:
+            return False
+        if key:
+            removed = False
+            for match in matches:
+                if isinstance(match, dict) and key in match:
+                    del match[key]
+                    removed = True
+                elif isinstance(match, list) and key.isdigit():
+                    index = int(key) - 1
+                    if 0 <= index < len(match):
+                        del match[index]
+                        removed = True
+            return removed
+        if self.steps is not None:
+            try:
+                parent = data
+                for step in self.steps[:-1]:
+                    parent = parent[step]
+                del parent[self.steps[-1]]
+                return True
+            except (KeyError, IndexError, TypeError):
+                # The path matched through jsonpath_ng, as in values().
+                pass
+        self.expr.filter(lambda _: True, data)
+        return True
+
+
+_SIMPLE_PATH = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*|\[\d+\])*")
+_SIMPLE_STEP = re.compile(r"([A-Za-z_]\w*)|\[(\d+)\]")
+
+
+def _simple_steps(jsonpath: str) -> tuple[str | int, ...] | None:
+    if not _SIMPLE_PATH.fullmatch(jsonpath):
+        return None
+    return tuple(
+        name if name else int(index)
+        for name, index in _SIMPLE_STEP.findall(jsonpath)
+    )
+
+
+@lru_cache(maxsize=_PATH_CACHE_SIZE)
+def compile_path(jsonpath: str) -> CompiledPath:
+    """Return the compiled form of a JSONPath string."""
+    return CompiledPath(jsonpath)
+
+
+def path_cache_info() -> Any:
+    """Return the lru_cache statistics of the compiled path cache."""
+    return compile_path.cache_info()
+
+
+def clear_path_cache() -> None:
+    convert_path.cache_clear()
+    compile_path.cache_clear()
+
+
+def _target_path(property_path: str, action: str) -> CompiledPath:
+    if action == "append" and property_path.endswith("()"):
+        property_path = property_path[:-2]
+    return compile_path(convert_path(property_path))
+
+
+class DTLDocument:
+    """Parsed JSON body of one IOP.Message.
+
+    ``dirty`` is set by every change and cleared by dumps(); the ObjectScript
+    side writes the body back only while it is set.
+    """
+
+    __slots__ = ("_data", "_text", "dirty")
+
+    def __init__(self, text: Any = "") -> None:
+        if text is not None and not isinstance(text, str):
+            from ..migration.utils import stream_to_utf8
+
+            text = bytes(stream_to_utf8(text)).decode("utf-8")
+        self._text = text or ""
+        self._data: Any = _UNPARSED
+        self.dirty = False
+
+    @property
+    def data(self) -> Any:
+        if self._data is _UNPARSED:
+            self._data = json.loads(self._text)
+        return self._data
+
+    def get_value(self, property_path: str) -> Any:
+        """Return the value at a path, a list when it matches several values,
+        or "" when it matches nothing.
+
+        Dicts and lists are returned as copies, so changing them does not
+        change the document behind the back of ``dirty``.
+        """
+        value = self._get(compile_path(convert_path(property_path)))
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+    def _get(self, path: CompiledPath) -> Any:
+        values = path.values(self.data)
+        if len(values) == 1:
+            return values[0]
+        if len(values) > 1:
+            return values
+        return ""
+
+    def set_value(
+        self,
+        value: Any,
+        property_path: str,
+        action: str = "set",
+        key: str = "",
+    ) -> None:
+        """Apply one DTL assign action ("set", "append", "remove", "insert")."""
+        if action not in _ACTIONS:
+            raise ValueError(f"Invalid action: {action}")
+        self._set(_target_path(property_path, action), value, action, key)
+
+    def _set(self, path: CompiledPath, value: Any, action: str, key: str) -> None:
+        if isinstance(value, (dict, list)):
+            # Values read from another document must not stay shared with it.
+            value = copy.deepcopy(value)
+        if self._data is _UNPARSED and not self._text:
+            self._data = {}
+        data = self.data
+
+        if action == "set":
+            data = path.update_or_create(data, value)
+        elif action == "remove":
+            if not path.remove(data, key):
+                return
+        else:
+            matches = path.values(data)
+            if not matches:
+                new = {key: value} if action == "insert" else [value]
+                data = path.update_or_create(data, new)
+            elif action == "insert":
+                # The dict or list is edited in place, as jsonpath_ng's
+                # update() with the same object did.
+                matches[0][key] = value
+            else:
+                matches[0].append(value)
+
+        self._data = data
+        self.dirty = True
+
+    def dumps(self) -> str:
+        """Serialize the document and mark it clean."""
+        self._text = json.dumps(self.data)
+        self.dirty = False
+        return self._text
+
+
+class CompiledTransform:
+    """A list of DTL operations with every path compiled up front.
+
+    Operations are ``(action, source path, target path, value[, key])``: the
+    value assigned is read from the source document at the source path, or
+    the literal value when the source path is empty. Actions are those of
+    DTLDocument.set_value().
+    """
+
+    __slots__ = ("operations", "_steps", "_reads_source")
+
+    def __init__(self, operations: list[Any]) -> None:
+        self.operations = operations
+        self._steps: list[tuple[CompiledPath | None, CompiledPath, Any, str, str]] = []
+        for number, operation in enumerate(operations, 1):
+            if not 4 <= len(operation) <= 5:
+                raise ValueError(
+                    f"Operation {number} must be (action, source path, "
+                    f"target path, value[, key]), got {operation!r}"
+                )
+            action, source_path, target_path, value, *rest = operation
+            key = rest[0] if rest else ""
+            if action not in _ACTIONS:
+                raise ValueError(f"Operation {number}: invalid action: {action}")
+            if not target_path:
+                raise ValueError(f"Operation {number}: target path cannot be empty")
+            if action == "insert" and not key:
+                raise ValueError(f"Operation {number}: key is required for insert")
+            source = compile_path(convert_path(source_path)) if source_path else None
+            self._steps.append(
+                (source, _target_path(target_path, action), value, action, key)
+            )
+        self._reads_source = any(step[0] is not None for step in self._steps)
+
+    def __call__(
+        self, target: DTLDocument, source: DTLDocument | None = None
+    ) -> DTLDocument:
+        # Checked before the first change so target is never left half done.
+        if self._reads_source and source is None:
+            raise ValueError("The transform reads a source document")
+        for source_path, target_path, value, action, key in self._steps:
+            if source_path is not None and source is not None:
+                value = source._get(source_path)
+            target._set(target_path, value, action, key)
+        return target
+
+
+# DTL class name -> (operations JSON, transform), least recently used first
+_TRANSFORMS: dict[str, tuple[str, CompiledTransform]] = {}
+
+
+def compile_transform(operations: Any, name: str = "") -> CompiledTransform:
+    """Compile a list of operations, or its JSON text.
+
+    With a name (the DTL class name), the compiled transform is kept and
+    reused for as long as the same operations JSON is passed under that name.
+    At most _TRANSFORM_CACHE_SIZE names are kept; the least recently used one
+    is dropped first.
+    """
+    if not isinstance(operations, str):
+        return CompiledTransform(operations)
+    if name:
+        cached = _TRANSFORMS.pop(name, None)
+        if cached is not None and cached[0] == operations:
+            _TRANSFORMS[name] = cached
+            return cached[1]
+    transform = CompiledTransform(json.loads(operations))
+    if name:
+        if len(_TRANSFORMS) >= _TRANSFORM_CACHE_SIZE:
+            del _TRANSFORMS[next(iter(_TRANSFORMS))]
+        _TRANSFORMS[name] = (operations, transform)
+    return transform
+
+
+def clear_transform_cache(name: str | None = None) -> None:
+    """Drop the compiled transform cached under name, or every one.
+
+    Changed operations replace a cached transform on their own; this only
+    frees the memory held by transforms that are no longer used.
+    """
+    if name is None:
+        _TRANSFORMS.clear()
+    else:
+        _TRANSFORMS.pop(name, None)
+
+
+def apply_transform(
+    target: DTLDocument,
+    source: DTLDocument | None,
+    operations: Any,
+    name: str = "",
+) -> DTLDocument:
+    """Apply a list of operations to target in one call; used by
+    IOP.Message.ApplyOperations()."""
+    return compile_transform(operations, name)(target, source or None)
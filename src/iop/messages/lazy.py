@@ -0,0 +1,157 @@
+"""Message bodies that are decoded on first use.
+
+A message class opts in with the ``LAZY_BODY`` class attribute::
+
+    @dataclass
+    class Bundle(Message):
+        LAZY_BODY = True
+        entries: list[dict] = None
+
+Receiving components then get a LazyMessage in place of the instance. It
+reports the message class through ``__class__`` (so ``isinstance()`` checks and
+handler dispatch work without decoding) and decodes the stored body the first
+time any attribute is read or written.
+
+Components can also receive every JSON, pickle and binary message lazily by
+setting ``LAZY_MESSAGES = True``. A lazy message that is sent on or returned
+without being modified is forwarded as its original IRIS body, so routing
+processes do not re-encode it. Assigning or deleting an attribute through the
+proxy marks the message as modified; a message that was only read is compared
+with a fresh decode of its body before it is forwarded, which also catches
+in-place changes such as appending to a list field.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any, NamedTuple, SupportsIndex
+
+_UNLOADED = object()
+
+
+class LazyMessageInfo(NamedTuple):
+    decoded: int
+    passed_through: int
+
+
+_COUNTERS_LOCK = threading.Lock()
+_decoded = 0
+_passed_through = 0
+
+
+class LazyMessage:
+    """Proxy for a message whose body has not been decoded yet."""
+
+    __slots__ = ("_iop_class", "_iop_loader", "_iop_target", "_iop_serial")
+
+    def __init__(
+        self, msg_class: type, loader: Callable[[], Any], serial: Any = None
+    ) -> None:
+        object.__setattr__(self, "_iop_class", msg_class)
+        object.__setattr__(self, "_iop_loader", loader)
+        object.__setattr__(self, "_iop_target", _UNLOADED)
+        object.__setattr__(self, "_iop_serial", serial)
+
+    @property
+    def __class__(self) -> type:  # type: ignore[override]
+        return object.__getattribute__(self, "_iop_class")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(materialize(self), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(materialize(self), name, value)
+        object.__setattr__(self, "_iop_serial", None)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(materialize(self), name)
+        object.__setattr__(self, "_iop_serial", None)
+
+    def __dir__(self) -> list[str]:
+        return dir(materialize(self))
+
+    def __repr__(self) -> str:
+        return repr(materialize(self))
+
+    def __str__(self) -> str:
+        return str(materialize(self))
+
+    def __eq__(self, other: Any) -> bool:
+        return materialize(self) == materialize(other)
+
+    def __hash__(self) -> int:
+        return hash(materialize(self))
+
+    def __iter__(self):
+        return iter(materialize(self))
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        # copy.copy() and pickle operate on the decoded message.
+        return materialize(self).__reduce_ex__(protocol)
+
+
+def is_lazy_message(message: Any) -> bool:
+    """Return True if message is a LazyMessage, decoded or not."""
+    return type(message) is LazyMessage
+
+
+def is_loaded(message: Any) -> bool:
+    """Return False only for a LazyMessage whose body is still undecoded."""
+    if type(message) is not LazyMessage:
+        return True
+    return object.__getattribute__(message, "_iop_target") is not _UNLOADED
+
+
+def materialize(message: Any) -> Any:
+    """Return the decoded message behind a LazyMessage.
+
+    Any other object is returned unchanged.
+    """
+    global _decoded
+
+    if type(message) is not LazyMessage:
+        return message
+    target = object.__getattribute__(message, "_iop_target")
+    if target is _UNLOADED:
+        target = object.__getattribute__(message, "_iop_loader")()
+        object.__setattr__(message, "_iop_target", target)
+        with _COUNTERS_LOCK:
+            _decoded += 1
+    return target
+
+
+def pass_through(message: Any) -> Any:
+    """Return the original IRIS body of an unmodified LazyMessage, else None."""
+    global _passed_through
+
+    if type(message) is not LazyMessage:
+        return None
+    serial = object.__getattribute__(message, "_iop_serial")
+    if serial is None:
+        return None
+    target = object.__getattribute__(message, "_iop_target")
+    if target is not _UNLOADED:
+        # The decoded message may have been changed in place. Messages
+        # without value equality always compare as changed.
+        if target != object.__getattribute__(message, "_iop_loader")():
+            object.__setattr__(message, "_iop_serial", None)
+            return None
+    with _COUNTERS_LOCK:
+        _passed_through += 1
+    return serial
+
+
+def lazy_message_info() -> LazyMessageInfo:
+    """Return how many lazy messages were decoded and passed through unchanged."""
+    with _COUNTERS_LOCK:
+        return LazyMessageInfo(_decoded, _passed_through)
+
+
+def reset_lazy_message_info() -> None:
+    """Reset the counters reported by lazy_message_info()."""
+    global _decoded, _passed_through
+
+    with _COUNTERS_LOCK:
+        _decoded = 0
+        _passed_through = 0
@@ -6,14 +6,22 @@ import importlib
 import inspect
 import json
 import pickle
+import struct
+import threading
+import weakref
 from dataclasses import is_dataclass
+from functools import lru_cache
+from types import ModuleType
 from typing import Any
 
 from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import from_json, to_json
 
-from ..migration import utils as _migration_utils
 from ..runtime import iris as _iris
+from ..runtime import streams as _streams
 from .base import _Message
+from .codecs import MessageCodec, get_codec
+from .lazy import LazyMessage, materialize
 
 
 class SerializationError(Exception):
@@ -32,14 +40,44 @@ class TempPydanticModel(BaseModel):
     model_config = {"arbitrary_types_allowed": True, "extra": "allow"}
 
 
+_CLASS_CACHE: dict[str, tuple[ModuleType, str, type]] = {}
+# Pickle classnames that could not be resolved; pickle loads those without
+# the LAZY_BODY check.
+_UNRESOLVED_PICKLE_CLASSES: set[str] = set()
+_DECODER_CACHE: weakref.WeakKeyDictionary[type, _DataclassDecoder] = (
+    weakref.WeakKeyDictionary()
+)
+# type -> _LEAF/_OBJECT/_LIST/_DICT; emptied when it reaches _VALUE_KINDS_SIZE
+_VALUE_KINDS: dict[type, int] = {}
+_VALUE_KINDS_SIZE = 1024
+_TYPE_ADAPTER_CACHE_SIZE = 1024
+_CACHE_LOCK = threading.Lock()
+
+_LEAF = 0
+_OBJECT = 1
+_LIST = 2
+_DICT = 3
+
+
+_PICKLE_FRAME = struct.Struct("!4sBIQ")
+_PICKLE_FRAME_MAGIC = b"IOPP"
+_PICKLE_FRAME_VERSION = 1
+_PICKLE_BUFFER_SIZE = struct.Struct("!Q")
+
+
 class MessageSerializer:
     """Handles message serialization and deserialization."""
 
+    # "binary" writes pickle protocol 5 bytes to IOP.PickleMessage.jbin;
+    # "base64" keeps the legacy text encoding in IOP.PickleMessage.jstr.
+    pickle_storage: str = "binary"
+
     @staticmethod
     def serialize(
         message: Any, use_pickle: bool = False, is_generator: bool = False
     ) -> Any:
         """Serializes a message to IRIS format."""
+        message = materialize(message)
         if use_pickle:
             return MessageSerializer._serialize_pickle(message, is_generator)
         return MessageSerializer._serialize_json(message, is_generator)
@@ -55,7 +93,10 @@ class MessageSerializer:
         msg.classname = f"{message.__class__.__module__}.{message.__class__.__name__}"
 
         if hasattr(msg, "buffer") and len(json_string) > msg.buffer:
-            msg.json = _migration_utils.string_to_stream(json_string, msg.buffer)
+            # Write in chunks of the message's buffer size, which IRIS strings
+            # can hold.
+            buffer = min(msg.buffer, _streams.IRIS_MAX_STRING_LENGTH)
+            msg.json = _streams.string_to_stream(_iris.get_iris(), json_string, buffer)
         else:
             msg.json = json_string
         return msg
@@ -64,22 +105,76 @@ class MessageSerializer:
     def _serialize_pickle(message: Any, is_generator: bool = False) -> Any:
         """Serializes a message to IRIS format using pickle."""
         message = remove_iris_id(message)
-        pickle_string = codecs.encode(pickle.dumps(message), "base64").decode()
         if is_generator:
             msg = _iris.get_iris().cls("IOP.Generator.Message.StartPickle")._New()
         else:
             msg = _iris.get_iris().cls("IOP.PickleMessage")._New()
         msg.classname = f"{message.__class__.__module__}.{message.__class__.__name__}"
-        msg.jstr = _migration_utils.string_to_stream(pickle_string)
+        if MessageSerializer.pickle_storage == "base64":
+            pickle_string = codecs.encode(pickle.dumps(message), "base64").decode()
+            msg.jstr = _streams.string_to_stream(_iris.get_iris(), pickle_string)
+        else:
+            msg.jbin = _streams.buffers_to_stream(_iris.get_iris(), pickle_frames(message))
         return msg
 
     @staticmethod
-    def deserialize(serial: Any, use_pickle: bool = False) -> Any:
-        if use_pickle:
-            msg = MessageSerializer._deserialize_pickle(serial)
+    def _serialize_binary(
+        message: Any, codec: MessageCodec, is_generator: bool = False
+    ) -> Any:
+        """Serializes a message to IRIS format using a binary codec."""
+        message = materialize(message)
+        payload = codec.encode(message)
+        if is_generator:
+            msg = _iris.get_iris().cls("IOP.Generator.Message.StartBinary")._New()
+        else:
+            msg = _iris.get_iris().cls("IOP.BinaryMessage")._New()
+        msg.classname = f"{message.__class__.__module__}.{message.__class__.__name__}"
+        msg.codec = codec.name
+        msg.data = _streams.bytes_to_stream(_iris.get_iris(), payload)
+        return msg
+
+    @staticmethod
+    def deserialize(
+        serial: Any,
+        use_pickle: bool = False,
+        use_binary: bool = False,
+        lazy: bool = False,
+    ) -> Any:
+        if use_binary:
+            decode = MessageSerializer._deserialize_binary
+        elif use_pickle:
+            decode = MessageSerializer._deserialize_pickle
         else:
-            msg = MessageSerializer._deserialize_json(serial)
+            decode = MessageSerializer._deserialize_json
+
+        msg_class = MessageSerializer._lazy_class(serial, use_pickle)
+        if msg_class is not None and (lazy or getattr(msg_class, "LAZY_BODY", False)):
+            return LazyMessage(
+                msg_class, lambda: MessageSerializer._load(decode, serial), serial
+            )
+        return MessageSerializer._load(decode, serial)
 
+    @staticmethod
+    def _lazy_class(serial: Any, use_pickle: bool) -> type | None:
+        classname = serial.classname
+        if not classname:
+            return None
+        if not use_pickle:
+            return MessageSerializer._resolve_class(classname)
+        if classname in _UNRESOLVED_PICKLE_CLASSES:
+            return None
+        try:
+            return MessageSerializer._resolve_class(classname)
+        except SerializationError:
+            # Pickle classnames omit nesting, so pickle itself may still be
+            # able to load the message.
+            with _CACHE_LOCK:
+                _UNRESOLVED_PICKLE_CLASSES.add(classname)
+            return None
+
+    @staticmethod
+    def _load(decode: Any, serial: Any) -> Any:
+        msg = decode(serial)
         try:
             iris_id = serial._Id()
             msg._iris_id = iris_id if iris_id else None
@@ -93,15 +188,49 @@ class MessageSerializer:
         if not serial.classname:
             raise SerializationError("JSON message malformed, must include classname")
 
+        msg_class = MessageSerializer._resolve_class(serial.classname)
+
+        if serial.type == "Stream":
+            # Large bodies are parsed from UTF-8 bytes so the payload is never
+            # held as one Python string.
+            json_data = _streams.stream_to_utf8(serial.json)
+            load_json = from_json
+        else:
+            json_data = serial.json
+            load_json = json.loads
+
         try:
-            module_name, class_name = MessageSerializer._parse_classname(
-                serial.classname
-            )
+            if issubclass(msg_class, BaseModel):
+                return msg_class.model_validate_json(json_data)
+            elif is_dataclass(msg_class):
+                return dataclass_from_dict(msg_class, load_json(json_data))
+            else:
+                raise SerializationError(
+                    f"Class {msg_class} must be a Pydantic model or dataclass"
+                )
+        except Exception as e:
+            raise SerializationError(f"Failed to deserialize JSON: {str(e)}") from e
+
+    @staticmethod
+    def _resolve_class(classname: str) -> type:
+        """Import and validate a JSON message class, caching the result.
+
+        Cached entries are checked against the owning module on every hit, so
+        a reloaded module transparently resolves to the new class.
+        """
+        cached = _CLASS_CACHE.get(classname)
+        if cached is not None:
+            module, class_name, msg_class = cached
+            if getattr(module, class_name, None) is msg_class:
+                return msg_class
+
+        try:
+            module_name, class_name = MessageSerializer._parse_classname(classname)
             module = importlib.import_module(module_name)
             msg_class = getattr(module, class_name)
         except (ModuleNotFoundError, AttributeError, ValueError) as e:
             raise MessageClassImportError(
-                f"Failed to load class {serial.classname}: {str(e)}"
+                f"Failed to load class {classname}: {str(e)}"
             ) from e
 
         if not isinstance(msg_class, type):
@@ -114,27 +243,36 @@ class MessageSerializer:
                 "or '@dataclass\nclass HelloMessage(Message): ...' (dataclass with Message)."
             )
 
-        json_string = (
-            _migration_utils.stream_to_string(serial.json)
-            if serial.type == "Stream"
-            else serial.json
-        )
+        with _CACHE_LOCK:
+            _CLASS_CACHE[classname] = (module, class_name, msg_class)
+        return msg_class
+
+    @staticmethod
+    def _deserialize_binary(serial: Any) -> Any:
+        if not serial.classname:
+            raise SerializationError(
+                "Binary message malformed, must include classname"
+            )
+
+        msg_class = MessageSerializer._resolve_class(serial.classname)
+        codec = get_codec(serial.codec)
+        payload = _streams.stream_to_bytes(serial.data)
 
         try:
-            if issubclass(msg_class, BaseModel):
-                return msg_class.model_validate_json(json_string)
-            elif is_dataclass(msg_class):
-                return dataclass_from_dict(msg_class, json.loads(json_string))
-            else:
-                raise SerializationError(
-                    f"Class {msg_class} must be a Pydantic model or dataclass"
-                )
+            return codec.decode(msg_class, payload)
         except Exception as e:
-            raise SerializationError(f"Failed to deserialize JSON: {str(e)}") from e
+            raise SerializationError(
+                f"Failed to deserialize {codec.name} message: {str(e)}"
+            ) from e
 
     @staticmethod
     def _deserialize_pickle(serial: Any) -> Any:
-        string = _migration_utils.stream_to_string(serial.jstr)
+        jbin = getattr(serial, "jbin", None)
+        if jbin is not None:
+            payload = _streams.stream_to_bytes(jbin)
+            if payload:
+                return unpickle_frames(payload)
+        string = _streams.stream_to_string(serial.jstr)
         return pickle.loads(codecs.decode(string.encode(), "base64"))
 
     @staticmethod
@@ -159,15 +297,74 @@ class MessageSerializer:
         if isinstance(obj, BaseModel):
             return obj.model_dump_json()
         elif is_dataclass(obj) and isinstance(obj, _Message):
-            return TempPydanticModel.model_validate(
-                dataclass_to_dict(obj)
-            ).model_dump_json()
+            return encode_dataclass_message(obj).decode()
         else:
             raise SerializationError(
                 f"Object {obj} must be a Pydantic model or dataclass Message"
             )
 
 
+def pickle_frames(message: Any) -> list[Any]:
+    """Pickle a message with protocol 5 into a list of buffers to write.
+
+    The first buffer holds the frame header and the pickle stream; each
+    out-of-band buffer (for example a NumPy array's data) follows as-is, so
+    large buffers are written without being copied into the pickle.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(message, protocol=5, buffer_callback=buffers.append)
+
+    raw_buffers = []
+    for buffer in buffers:
+        try:
+            raw_buffers.append(buffer.raw())
+        except BufferError:
+            # Non-contiguous buffer: fall back to a contiguous copy.
+            raw_buffers.append(memoryview(bytes(buffer)))
+
+    header = bytearray(
+        _PICKLE_FRAME.pack(
+            _PICKLE_FRAME_MAGIC, _PICKLE_FRAME_VERSION, len(raw_buffers), len(data)
+        )
+    )
+    for raw in raw_buffers:
+        header += _PICKLE_BUFFER_SIZE.pack(raw.nbytes)
+    return [header, data, *raw_buffers]
+
+
+def unpickle_frames(payload: bytes | bytearray) -> Any:
+    """Load a message written by pickle_frames().
+
+    Out-of-band buffers are handed to pickle as views on payload; pass a
+    bytearray to get writable buffers (for example writable NumPy arrays).
+    """
+    view = memoryview(payload)
+    try:
+        magic, version, count, size = _PICKLE_FRAME.unpack_from(view)
+        if magic != _PICKLE_FRAME_MAGIC or version != _PICKLE_FRAME_VERSION:
+            raise SerializationError(
+                "Pickle message payload has an unknown frame header"
+            )
+        offset = _PICKLE_FRAME.size
+        sizes = []
+        for _ in range(count):
+            sizes.append(_PICKLE_BUFFER_SIZE.unpack_from(view, offset)[0])
+            offset += _PICKLE_BUFFER_SIZE.size
+    except struct.error:
+        raise SerializationError("Pickle message payload is truncated") from None
+
+    data = view[offset : offset + size]
+    offset += size
+    buffers = []
+    for buffer_size in sizes:
+        buffers.append(view[offset : offset + buffer_size])
+        offset += buffer_size
+    if offset != len(view):
+        raise SerializationError("Pickle message payload size mismatch")
+
+    return pickle.loads(data, buffers=buffers)
+
+
 def remove_iris_id(message: Any) -> Any:
     message = copy.copy(message)
     try:
@@ -177,44 +374,171 @@ def remove_iris_id(message: Any) -> Any:
     return message
 
 
+def clear_serialization_cache(classname: str | None = None) -> None:
+    """Drop cached message classes, dataclass decoders and type adapters.
+
+    Call after hot-reloading message modules in place. Reloads through
+    importlib are also detected automatically on the next message.
+
+    Args:
+        classname: Fully qualified message classname to invalidate. When
+            omitted, every cache is cleared.
+    """
+    with _CACHE_LOCK:
+        if classname is not None:
+            cached = _CLASS_CACHE.pop(classname, None)
+            if cached is not None:
+                _DECODER_CACHE.pop(cached[2], None)
+                _VALUE_KINDS.pop(cached[2], None)
+            _UNRESOLVED_PICKLE_CLASSES.discard(classname)
+        else:
+            _CLASS_CACHE.clear()
+            _UNRESOLVED_PICKLE_CLASSES.clear()
+            _DECODER_CACHE.clear()
+            _VALUE_KINDS.clear()
+    _cached_type_adapter.cache_clear()
+
+
+@lru_cache(maxsize=_TYPE_ADAPTER_CACHE_SIZE)
+def _cached_type_adapter(field_type: Any) -> TypeAdapter:
+    return TypeAdapter(field_type)
+
+
+def _type_adapter(field_type: Any) -> TypeAdapter:
+    try:
+        return _cached_type_adapter(field_type)
+    except TypeError:
+        # Unhashable annotations cannot be cached.
+        return TypeAdapter(field_type)
+
+
+class _DataclassDecoder:
+    """Precomputed field layout used to rebuild a dataclass from a dict.
+
+    The class is held weakly so the decoder cache, keyed weakly by the same
+    class, lets reloaded message classes be collected.
+    """
+
+    def __init__(self, klass: type) -> None:
+        self._klass = weakref.ref(klass)
+        self.fields = [
+            (name, parameter.annotation, parameter.default)
+            for name, parameter in inspect.signature(klass).parameters.items()
+        ]
+
+    def decode(self, dikt: dict) -> Any:
+        field_dict = {}
+
+        for field_name, annotation, default in self.fields:
+            if field_name not in dikt:
+                if default is not inspect.Parameter.empty:
+                    field_dict[field_name] = default
+                continue
+
+            field_dict[field_name] = _decode_field(dikt[field_name], annotation)
+
+        # Create instance
+        klass = self._klass()
+        if klass is None:
+            raise SerializationError("Message class was garbage collected")
+        instance = klass(**field_dict)
+
+        # Add any extra fields not in the dataclass definition
+        for key, value in dikt.items():
+            if key not in field_dict:
+                setattr(instance, key, value)
+
+        return instance
+
+
+def _decode_field(value: Any, field_type: Any) -> Any:
+    if value is None:
+        return None
+    if is_dataclass(field_type):
+        return dataclass_from_dict(field_type, value)
+    if field_type is not inspect.Parameter.empty:
+        try:
+            return _type_adapter(field_type).validate_python(value)
+        except ValidationError:
+            return value
+    return value
+
+
+def _dataclass_decoder(klass: type) -> _DataclassDecoder:
+    decoder = _DECODER_CACHE.get(klass)
+    if decoder is None:
+        decoder = _DataclassDecoder(klass)
+        with _CACHE_LOCK:
+            _DECODER_CACHE[klass] = decoder
+    return decoder
+
+
 def dataclass_from_dict(klass: type | Any, dikt: dict) -> Any:
     """Converts a dictionary to a dataclass instance.
     Handles non attended fields and nested dataclasses."""
+    return _dataclass_decoder(klass).decode(dikt)
 
-    def process_field(value: Any, field_type: type) -> Any:
-        if value is None:
-            return None
-        if is_dataclass(field_type):
-            return dataclass_from_dict(field_type, value)
-        if field_type != inspect.Parameter.empty:
-            try:
-                return TypeAdapter(field_type).validate_python(value)
-            except ValidationError:
-                return value
-        return value
-
-    # Get field definitions from class signature
-    fields = inspect.signature(klass).parameters
-    field_dict = {}
-
-    # Process each field
-    for field_name, field_info in fields.items():
-        if field_name not in dikt:
-            if field_info.default != field_info.empty:
-                field_dict[field_name] = field_info.default
-            continue
 
-        field_dict[field_name] = process_field(dikt[field_name], field_info.annotation)
+def encode_dataclass_message(instance: Any) -> bytes:
+    """Encode a dataclass message to JSON bytes.
 
-    # Create instance
-    instance = klass(**field_dict)
+    Produces the same document as dataclass_to_dict() followed by a Pydantic
+    dump, including extra non-field attributes and nested dataclasses, without
+    building an intermediate model.
+    """
+    data = _json_ready_object(instance)
+    try:
+        # Match BaseModel.model_dump_json(), which writes inf/nan as null.
+        return to_json(data, inf_nan_mode="null")
+    except TypeError:
+        # pydantic-core releases without inf_nan_mode.
+        return to_json(data)
+
+
+def _value_kind(value: Any) -> int:
+    klass = type(value)
+    kind = _VALUE_KINDS.get(klass)
+    if kind is None:
+        if isinstance(value, type):
+            # Class objects: is_dataclass() depends on the value, not its type.
+            return _OBJECT if hasattr(value, "__dict__") else _LEAF
+        if is_dataclass(value):
+            kind = _OBJECT
+        elif isinstance(value, list):
+            kind = _LIST
+        elif isinstance(value, dict):
+            kind = _DICT
+        elif hasattr(value, "__dict__"):
+            kind = _OBJECT
+        else:
+            kind = _LEAF
+        with _CACHE_LOCK:
+            if len(_VALUE_KINDS) >= _VALUE_KINDS_SIZE:
+                _VALUE_KINDS.clear()
+            _VALUE_KINDS[klass] = kind
+    return kind
 
-    # Add any extra fields not in the dataclass definition
-    for key, value in dikt.items():
-        if key not in field_dict:
-            setattr(instance, key, value)
 
-    return instance
+def _json_ready_object(instance: Any) -> dict:
+    result = {}
+    for field, value in instance.__dict__.items():
+        if field == "_iris_id":
+            continue
+        kind = _value_kind(value)
+        if kind == _LEAF:
+            result[field] = value
+        elif kind == _OBJECT:
+            result[field] = _json_ready_object(value)
+        elif kind == _LIST:
+            result[field] = [
+                _json_ready_object(i) if is_dataclass(i) else i for i in value
+            ]
+        else:
+            result[field] = {
+                k: _json_ready_object(v) if is_dataclass(v) else v
+                for k, v in value.items()
+            }
+    return result
 
 
 def dataclass_to_dict(instance: Any) -> dict:
@@ -260,9 +584,25 @@ def serialize_message_generator(msg):
     return MessageSerializer.serialize(msg, use_pickle=False, is_generator=True)
 
 
-def deserialize_pickle_message(serial):
-    return MessageSerializer.deserialize(serial, use_pickle=True)
+def serialize_binary_message(msg, codec: MessageCodec | str):
+    if isinstance(codec, str):
+        codec = get_codec(codec)
+    return MessageSerializer._serialize_binary(msg, codec, is_generator=False)
+
+
+def serialize_binary_message_generator(msg, codec: MessageCodec | str):
+    if isinstance(codec, str):
+        codec = get_codec(codec)
+    return MessageSerializer._serialize_binary(msg, codec, is_generator=True)
+
+
+def deserialize_binary_message(serial, lazy: bool = False):
+    return MessageSerializer.deserialize(serial, use_binary=True, lazy=lazy)
+
+
+def deserialize_pickle_message(serial, lazy: bool = False):
+    return MessageSerializer.deserialize(serial, use_pickle=True, lazy=lazy)
 
 
-def deserialize_message(serial):
-    return MessageSerializer.deserialize(serial, use_pickle=False)
+def deserialize_message(serial, lazy: bool = False):
+    return MessageSerializer.deserialize(serial, use_pickle=False, lazy=lazy)
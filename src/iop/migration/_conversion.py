@@ -6,6 +6,20 @@ from typing import Any
 
 import xmltodict
 
+from ..runtime.streams import IRIS_MAX_STRING_LENGTH as IRIS_MAX_STRING_LENGTH
+from ..runtime.streams import IRIS_STREAM_BLOCK_SIZE as IRIS_STREAM_BLOCK_SIZE
+from ..runtime.streams import buffers_to_stream as buffers_to_stream
+from ..runtime.streams import bytes_to_stream as bytes_to_stream
+from ..runtime.streams import chunks_to_stream as chunks_to_stream
+from ..runtime.streams import get_stream_chunk_size as get_stream_chunk_size
+from ..runtime.streams import iter_stream_chunks as iter_stream_chunks
+from ..runtime.streams import iter_string_chunks as iter_string_chunks
+from ..runtime.streams import set_stream_chunk_size as set_stream_chunk_size
+from ..runtime.streams import stream_to_bytes as stream_to_bytes
+from ..runtime.streams import stream_to_string as stream_to_string
+from ..runtime.streams import stream_to_utf8 as stream_to_utf8
+from ..runtime.streams import string_to_stream as string_to_stream
+
 
 def dict_to_xml(data: dict[str, Any]) -> str:
     xml = xmltodict.unparse(data, pretty=True)
@@ -25,22 +39,6 @@ def xml_to_json(xml_string: str) -> str:
     return json.dumps(data)
 
 
-def stream_to_string(stream, buffer=1000000) -> str:
-    string = ""
-    stream.Rewind()
-    while not stream.AtEnd:
-        string += stream.Read(buffer)
-    return string
-
-
-def string_to_stream(iris, string: str, buffer=1000000):
-    stream = iris.cls("%Stream.GlobalCharacter")._New()
-    chunks = [string[i : i + buffer] for i in range(0, len(string), buffer)]
-    for chunk in chunks:
-        stream.Write(chunk)
-    return stream
-
-
 def guess_path(module: str, path: str) -> str:
     if not module:
         raise ValueError("Module name cannot be empty")
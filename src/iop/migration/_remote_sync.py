@@ -0,0 +1,140 @@
+"""File synchronisation for remote migrations.
+
+The client sends a manifest of relative file paths and SHA-256 digests; the
+server compares it with the package folder and answers which files are
+missing, which are stale and which it holds that the manifest does not list.
+Only missing and stale files are then uploaded, gzip-compressed and base64
+encoded inside the JSON body, together with the explicit list of files to
+delete.
+
+This module is imported both by the CLI and, through the IOP REST service,
+inside IRIS, so it only depends on the standard library.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import json
+import os
+from typing import Any
+
+MIGRATION_SUFFIXES = (".py", ".cls")
+FILE_ENCODING = "gzip+base64"
+MANIFEST_FEATURE = "migrate_manifest"
+# Characters read at a time from an IRIS stream; well below the IRIS maximum
+# string length.
+STREAM_READ_SIZE = 1_000_000
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def iter_migration_files(folder: str):
+    """Yield (relative posix path, absolute path) of the files to migrate."""
+    for dirpath, dirnames, filenames in os.walk(folder):
+        dirnames.sort()
+        for fname in sorted(filenames):
+            if not fname.endswith(MIGRATION_SUFFIXES):
+                continue
+            full = os.path.join(dirpath, fname)
+            yield os.path.relpath(full, folder).replace(os.sep, "/"), full
+
+
+def scan_folder(folder: str) -> dict[str, str]:
+    """Return ``{relative path: digest}`` for the migration files of folder."""
+    manifest: dict[str, str] = {}
+    if not os.path.isdir(folder):
+        return manifest
+    for rel, full in iter_migration_files(folder):
+        with open(full, "rb") as fh:
+            manifest[rel] = file_digest(fh.read())
+    return manifest
+
+
+def diff_manifest(folder: str, manifest: dict[str, str]) -> dict[str, list[str]]:
+    """Compare a client manifest with the files stored in folder."""
+    current = scan_folder(folder)
+    return {
+        "missing": sorted(name for name in manifest if name not in current),
+        "stale": sorted(
+            name
+            for name, digest in manifest.items()
+            if name in current and current[name] != digest
+        ),
+        "extra": sorted(name for name in current if name not in manifest),
+    }
+
+
+def encode_file(data: bytes) -> str:
+    return base64.b64encode(gzip.compress(data, mtime=0)).decode("ascii")
+
+
+def decode_file(data: str) -> bytes:
+    return gzip.decompress(base64.b64decode(data))
+
+
+def _target_path(folder: str, name: str) -> str:
+    root = os.path.realpath(folder)
+    path = os.path.realpath(os.path.join(root, name))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError(f"Refusing to write outside the package folder: {name}")
+    return path
+
+
+def apply_upload(
+    folder: str, files: list[dict[str, Any]], delete: list[str] | None = None
+) -> None:
+    """Write uploaded files into folder and remove the deleted ones.
+
+    Entries carry ``name`` and ``data``; data is decoded according to their
+    ``encoding`` (``gzip+base64``) or written as UTF-8 text when it is absent.
+    """
+    for entry in files:
+        apply_upload_entry(folder, entry["name"], entry.get("encoding"), entry["data"])
+    for name in delete or ():
+        remove_file(folder, name)
+
+
+def _read_stream(stream) -> str:
+    chunks = []
+    stream.Rewind()
+    while not stream.AtEnd:
+        chunk = stream.Read(STREAM_READ_SIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return "".join(chunks)
+
+
+def apply_upload_entry(folder: str, name: str, encoding: str | None, data) -> None:
+    """Write one uploaded file into folder.
+
+    ``data`` is a string or, when the REST service hands over an entry too
+    large for an IRIS string, a character stream read in chunks.
+    """
+    if not isinstance(data, str):
+        data = _read_stream(data)
+    path = _target_path(folder, name)
+    if encoding == FILE_ENCODING:
+        content = decode_file(data)
+    else:
+        content = data.encode("utf-8")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as fh:
+        fh.write(content)
+
+
+def remove_file(folder: str, name: str) -> None:
+    """Delete one file of folder, if it exists."""
+    path = _target_path(folder, name)
+    if os.path.isfile(path):
+        os.remove(path)
+
+
+def check_manifest_json(folder: str, manifest_json: str) -> str:
+    """JSON wrapper of diff_manifest() for the REST service."""
+    return json.dumps(diff_manifest(folder, json.loads(manifest_json)))
+
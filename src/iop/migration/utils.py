@@ -21,12 +21,36 @@ from ..production.validation import validate_production_entry
 from ..runtime import iris as _iris
 from ..runtime.environment import remove_sys_path, temporary_sys_path
 from . import _production_io, _registration, _settings
+from ._conversion import (
+    buffers_to_stream as _buffers_to_stream,
+)
+from ._conversion import (
+    bytes_to_stream as _bytes_to_stream,
+)
+from ._conversion import (
+    chunks_to_stream as _chunks_to_stream,
+)
+from ._conversion import (
+    get_stream_chunk_size as _get_stream_chunk_size,
+)
 from ._conversion import (
     guess_path as _guess_path,
 )
+from ._conversion import (
+    iter_stream_chunks as _iter_stream_chunks,
+)
+from ._conversion import (
+    set_stream_chunk_size as _set_stream_chunk_size,
+)
+from ._conversion import (
+    stream_to_bytes as _stream_to_bytes,
+)
 from ._conversion import (
     stream_to_string as _stream_to_string,
 )
+from ._conversion import (
+    stream_to_utf8 as _stream_to_utf8,
+)
 from ._conversion import (
     string_to_stream as _string_to_stream,
 )
@@ -992,14 +1016,46 @@ def xml_to_json(xml_string: str) -> str:
     return _xml_to_json(xml_string)
 
 
-def stream_to_string(stream, buffer=1000000) -> str:
+def stream_to_string(stream, buffer=None) -> str:
     return _stream_to_string(stream, buffer)
 
 
-def string_to_stream(string: str, buffer=1000000):
+def stream_to_utf8(stream, buffer=None) -> bytearray:
+    return _stream_to_utf8(stream, buffer)
+
+
+def iter_stream_chunks(stream, buffer=None):
+    return _iter_stream_chunks(stream, buffer)
+
+
+def string_to_stream(string: str, buffer=None):
     return _string_to_stream(_iris.get_iris(), string, buffer)
 
 
+def chunks_to_stream(chunks):
+    return _chunks_to_stream(_iris.get_iris(), chunks)
+
+
+def stream_to_bytes(stream, buffer=None) -> bytearray:
+    return _stream_to_bytes(stream, buffer)
+
+
+def bytes_to_stream(data: bytes, buffer=None):
+    return _bytes_to_stream(_iris.get_iris(), data, buffer)
+
+
+def buffers_to_stream(buffers, buffer=None):
+    return _buffers_to_stream(_iris.get_iris(), buffers, buffer)
+
+
+def get_stream_chunk_size() -> int:
+    return _get_stream_chunk_size()
+
+
+def set_stream_chunk_size(size: int) -> int:
+    return _set_stream_chunk_size(size)
+
+
 def guess_path(module: str, path: str) -> str:
     return _guess_path(module, path)
 
@@ -1,30 +1,69 @@
+"""Production declaration, planning and validation API.
+
+Names are imported from their submodule on first access (PEP 562), so
+components that only need target references do not load the whole package.
+"""
+
 from __future__ import annotations
 
-from .component import ComponentRef as ComponentRef
-from .declarations import ComponentItem as ComponentItem
-from .declarations import OperationItem as OperationItem
-from .declarations import ProcessItem as ProcessItem
-from .declarations import Route as Route
-from .declarations import ServiceItem as ServiceItem
-from .model import Production as Production
-from .planning import ProductionApplyResult as ProductionApplyResult
-from .planning import ProductionChangePlan as ProductionChangePlan
-from .planning import ProductionPlanOperation as ProductionPlanOperation
-from .planning import ProductionVerifyResult as ProductionVerifyResult
-from .runtime import resolve_target as resolve_target
-from .types import GraphEdge as GraphEdge
-from .types import GraphNode as GraphNode
-from .types import PersistentMessageRegistration as PersistentMessageRegistration
-from .types import ProductionDiff as ProductionDiff
-from .types import ProductionDiffEntry as ProductionDiffEntry
-from .types import ProductionGraph as ProductionGraph
-from .types import TargetSetting as TargetSetting
-from .types import TargetSettingRef as TargetSettingRef
-from .types import target as target
-from .validation import ProductionValidationError as ProductionValidationError
-from .validation import ProductionValidationIssue as ProductionValidationIssue
-from .validation import ProductionValidationReport as ProductionValidationReport
-from .validation import ProductionValidationWarning as ProductionValidationWarning
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .component import ComponentRef as ComponentRef
+    from .declarations import ComponentItem as ComponentItem
+    from .declarations import OperationItem as OperationItem
+    from .declarations import ProcessItem as ProcessItem
+    from .declarations import Route as Route
+    from .declarations import ServiceItem as ServiceItem
+    from .model import Production as Production
+    from .planning import ProductionApplyResult as ProductionApplyResult
+    from .planning import ProductionChangePlan as ProductionChangePlan
+    from .planning import ProductionPlanOperation as ProductionPlanOperation
+    from .planning import ProductionVerifyResult as ProductionVerifyResult
+    from .runtime import resolve_target as resolve_target
+    from .types import GraphEdge as GraphEdge
+    from .types import GraphNode as GraphNode
+    from .types import PersistentMessageRegistration as PersistentMessageRegistration
+    from .types import ProductionDiff as ProductionDiff
+    from .types import ProductionDiffEntry as ProductionDiffEntry
+    from .types import ProductionGraph as ProductionGraph
+    from .types import TargetSetting as TargetSetting
+    from .types import TargetSettingRef as TargetSettingRef
+    from .types import target as target
+    from .validation import ProductionValidationError as ProductionValidationError
+    from .validation import ProductionValidationIssue as ProductionValidationIssue
+    from .validation import ProductionValidationReport as ProductionValidationReport
+    from .validation import ProductionValidationWarning as ProductionValidationWarning
+
+# public name -> submodule defining it
+_LAZY_ATTRIBUTES = {
+    "ComponentRef": "component",
+    "ComponentItem": "declarations",
+    "OperationItem": "declarations",
+    "ProcessItem": "declarations",
+    "Route": "declarations",
+    "ServiceItem": "declarations",
+    "Production": "model",
+    "ProductionApplyResult": "planning",
+    "ProductionChangePlan": "planning",
+    "ProductionPlanOperation": "planning",
+    "ProductionVerifyResult": "planning",
+    "resolve_target": "runtime",
+    "GraphEdge": "types",
+    "GraphNode": "types",
+    "PersistentMessageRegistration": "types",
+    "ProductionDiff": "types",
+    "ProductionDiffEntry": "types",
+    "ProductionGraph": "types",
+    "TargetSetting": "types",
+    "TargetSettingRef": "types",
+    "target": "types",
+    "ProductionValidationError": "validation",
+    "ProductionValidationIssue": "validation",
+    "ProductionValidationReport": "validation",
+    "ProductionValidationWarning": "validation",
+}
 
 __all__ = [
     "ComponentRef",
@@ -53,3 +92,16 @@ __all__ = [
     "resolve_target",
     "target",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
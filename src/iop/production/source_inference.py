@@ -24,7 +24,7 @@ _PYTHON_REQUEST_METHODS = {
     "send_request_async_ng",
     "send_generator_request",
 }
-_PYTHON_MULTI_REQUEST_METHODS = {"send_multi_request_sync"}
+_PYTHON_MULTI_REQUEST_METHODS = {"send_multi_request_sync", "send_many_async_ng"}
 _OBJECTSCRIPT_STRING = r'"(?:""|[^"])*"'
 _OBJECTSCRIPT_CLASS_RE = re.compile(
     r"(?im)^\s*Class\s+(?P<class>[A-Za-z%][\w%]*(?:\.[A-Za-z%][\w%]*)*)\b"
@@ -407,7 +407,7 @@ def _python_multi_request_targets(
                 item.elts[0],
                 string_values,
                 call_name,
-                "sync",
+                _python_call_interaction(call_name),
             )
         )
     return targets
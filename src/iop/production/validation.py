@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import logging
+import time
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from .common import (
@@ -13,6 +15,8 @@ from .common import (
 from .import_ import _as_list, _production_payload, _split_settings
 from .types import TargetSetting
 
+_logger = logging.getLogger(__name__)
+
 _PRODUCTION_PUBLIC_FIELDS = {
     "name",
     "testing_enabled",
@@ -38,6 +42,10 @@ _PRODUCTION_DICT_KEYS = {
     "Item",
 }
 
+# Class names per dictionary query; keeps the IN (...) list well below the
+# IRIS SQL statement limits.
+_DICTIONARY_BATCH_SIZE = 500
+
 _PRODUCTION_SETTING_NAME_ALIASES = {
     **PRODUCTION_SETTING_NAMES,
     **{iris_name: iris_name for iris_name in PRODUCTION_SETTING_FIELDS_BY_IRIS},
@@ -72,6 +80,9 @@ class ProductionValidationIssue:
 class ProductionValidationReport:
     production_name: str
     issues: tuple[ProductionValidationIssue, ...] = ()
+    # Seconds spent in "dictionary" lookups against IRIS and in "total".
+    timings: dict[str, float] = field(default_factory=dict, compare=False)
+    dictionary_queries: int = field(default=0, compare=False)
 
     @property
     def has_issues(self) -> bool:
@@ -82,6 +93,8 @@ class ProductionValidationReport:
             "production": self.production_name,
             "has_issues": self.has_issues,
             "issues": [issue.to_dict() for issue in self.issues],
+            "timings": dict(self.timings),
+            "dictionary_queries": self.dictionary_queries,
         }
 
     def to_text(self) -> str:
@@ -112,8 +125,9 @@ def validate_production(
     strict: bool = False,
     warn: bool = True,
 ) -> ProductionValidationReport:
+    start = time.perf_counter()
     report = _build_production_object_report(production)
-    return _finalize_report(report, strict=strict, warn=warn)
+    return _finalize_report(_timed(report, start), strict=strict, warn=warn)
 
 
 def validate_production_entry(
@@ -122,11 +136,19 @@ def validate_production_entry(
     strict: bool = False,
     warn: bool = True,
 ) -> ProductionValidationReport:
+    start = time.perf_counter()
     if _is_production_object(production):
         report = _build_production_object_report(production)
     else:
         report = _build_production_dict_report(production)
-    return _finalize_report(report, strict=strict, warn=warn)
+    return _finalize_report(_timed(report, start), strict=strict, warn=warn)
+
+
+def _timed(
+    report: ProductionValidationReport, start: float
+) -> ProductionValidationReport:
+    timings = {**report.timings, "total": time.perf_counter() - start}
+    return replace(report, timings=timings)
 
 
 def _finalize_report(
@@ -150,12 +172,23 @@ def _build_production_object_report(production: Any) -> ProductionValidationRepo
     issues: list[ProductionValidationIssue] = []
     issues.extend(_unknown_public_attrs(production))
 
-    for item in getattr(production, "items", ()):
-        issues.extend(_validate_component_ref(item))
+    items = tuple(getattr(production, "items", ()))
+    dictionary = _IrisDictionary(_iris_module())
+    for item in items:
+        class_name = str(getattr(item, "class_name", "") or "")
+        if getattr(item, "host_settings", None):
+            dictionary.expect(class_name)
+        if getattr(item, "adapter_settings", None):
+            dictionary.expect(
+                str(getattr(item, "adapter_class_name", "") or ""),
+                host_class_name=class_name,
+            )
+    for item in items:
+        issues.extend(_validate_component_ref(item, dictionary))
 
     issues.extend(_validate_target_setting_values(production))
 
-    return ProductionValidationReport(production_name, tuple(issues))
+    return dictionary.report(production_name, issues)
 
 
 def _unknown_public_attrs(production: Any) -> list[ProductionValidationIssue]:
@@ -176,7 +209,9 @@ def _unknown_public_attrs(production: Any) -> list[ProductionValidationIssue]:
     return issues
 
 
-def _validate_component_ref(item: Any) -> list[ProductionValidationIssue]:
+def _validate_component_ref(
+    item: Any, dictionary: _IrisDictionary
+) -> list[ProductionValidationIssue]:
     issues: list[ProductionValidationIssue] = []
     item_name = str(getattr(item, "name", ""))
     component_class = getattr(item, "component_class", None)
@@ -190,6 +225,7 @@ def _validate_component_ref(item: Any) -> list[ProductionValidationIssue]:
             path_prefix=f"items.{item_name}.settings.Host",
             local_class=component_class,
             iris_class_name=class_name,
+            dictionary=dictionary,
         )
     )
 
@@ -214,6 +250,7 @@ def _validate_component_ref(item: Any) -> list[ProductionValidationIssue]:
             local_class=adapter_class,
             iris_class_name=adapter_class_name,
             host_class_name=class_name,
+            dictionary=dictionary,
         )
     )
     return issues
@@ -236,11 +273,27 @@ def _build_production_dict_report(data: Any) -> ProductionValidationReport:
         )
 
     issues.extend(_validate_production_settings(production_data.get("Setting")))
-    for item in _as_list(production_data.get("Item", [])):
-        if isinstance(item, dict):
-            issues.extend(_validate_dict_item(item))
+    items = [
+        item
+        for item in _as_list(production_data.get("Item", []))
+        if isinstance(item, dict)
+    ]
+    dictionary = _IrisDictionary(_iris_module())
+    for item in items:
+        class_ref = item.get("@ClassName", "")
+        if isinstance(class_ref, type):
+            continue
+        host_settings, adapter_settings, _other_settings = _split_settings(
+            item.get("Setting", [])
+        )
+        if host_settings:
+            dictionary.expect(str(class_ref or ""))
+        if adapter_settings:
+            dictionary.expect("", host_class_name=str(class_ref or ""))
+    for item in items:
+        issues.extend(_validate_dict_item(item, dictionary))
 
-    return ProductionValidationReport(str(production_name), tuple(issues))
+    return dictionary.report(str(production_name), issues)
 
 
 def _validate_production_settings(settings: Any) -> list[ProductionValidationIssue]:
@@ -279,7 +332,9 @@ def _validate_production_settings(settings: Any) -> list[ProductionValidationIss
     return issues
 
 
-def _validate_dict_item(item: dict[str, Any]) -> list[ProductionValidationIssue]:
+def _validate_dict_item(
+    item: dict[str, Any], dictionary: _IrisDictionary
+) -> list[ProductionValidationIssue]:
     item_name = str(item.get("@Name", ""))
     class_ref = item.get("@ClassName", "")
     local_class = class_ref if isinstance(class_ref, type) else None
@@ -293,6 +348,7 @@ def _validate_dict_item(item: dict[str, Any]) -> list[ProductionValidationIssue]
         path_prefix=f"items.{item_name}.settings.Host",
         local_class=local_class,
         iris_class_name=iris_class_name,
+        dictionary=dictionary,
     )
     issues.extend(
         _validate_settings(
@@ -301,6 +357,7 @@ def _validate_dict_item(item: dict[str, Any]) -> list[ProductionValidationIssue]
             local_class=None,
             iris_class_name="",
             host_class_name=iris_class_name,
+            dictionary=dictionary,
         )
     )
     return issues
@@ -313,6 +370,7 @@ def _validate_settings(
     local_class: type | None,
     iris_class_name: str,
     host_class_name: str = "",
+    dictionary: _IrisDictionary,
 ) -> list[ProductionValidationIssue]:
     if not settings:
         return []
@@ -325,12 +383,15 @@ def _validate_settings(
                 known_names=local_names,
             )
 
-    iris_target_class = iris_class_name or _adapter_class_name_from_host(host_class_name)
+    iris_target_class = iris_class_name or dictionary.adapter_class_name(
+        host_class_name
+    )
     if iris_target_class:
         report = _validate_names_with_iris_dictionary(
             settings,
             path_prefix=path_prefix,
             iris_class_name=iris_target_class,
+            dictionary=dictionary,
         )
         if report is not None:
             return report
@@ -428,36 +489,168 @@ def _validate_names_with_iris_dictionary(
     *,
     path_prefix: str,
     iris_class_name: str,
+    dictionary: _IrisDictionary,
 ) -> list[ProductionValidationIssue] | None:
-    iris = _iris_module()
-    if iris is None or not _iris_class_exists(iris, iris_class_name):
+    property_names = dictionary.property_names(iris_class_name)
+    if property_names is None:
         return None
 
     issues: list[ProductionValidationIssue] = []
     for setting_name in sorted(settings):
-        if _iris_property_exists(iris, iris_class_name, setting_name):
+        if setting_name in property_names:
             continue
         alias = SETTING_NAME_ALIASES.get(setting_name)
-        if alias and _iris_property_exists(iris, iris_class_name, alias):
+        if alias and alias in property_names:
             issues.append(_setting_alias_issue(path_prefix, setting_name, alias))
             continue
         issues.append(_unknown_setting_issue(path_prefix, setting_name))
     return issues
 
 
-def _adapter_class_name_from_host(host_class_name: str) -> str:
-    if not host_class_name:
-        return ""
-    iris = _iris_module()
-    if iris is None:
-        return ""
-    try:
-        parameter = iris._Dictionary.CompiledParameter._OpenId(
-            f"{host_class_name}||ADAPTER"
+class _IrisDictionary:
+    """Compiled class metadata read from IRIS for one validation run.
+
+    Classes announced with expect() are loaded together on the first lookup:
+    one query for the ADAPTER parameter of the host classes, and one for the
+    compiled properties of every class, instead of an object open per
+    setting. Lookups of other classes load them on demand.
+    """
+
+    def __init__(self, iris: Any) -> None:
+        self.iris = iris
+        self.queries = 0
+        self.seconds = 0.0
+        self._use_sql = iris is not None and hasattr(iris, "sql")
+        self._expected: set[str] = set()
+        self._expected_hosts: set[str] = set()
+        self._adapters: dict[str, str] = {}
+        # class name -> compiled property names, None when the class is unknown
+        self._properties: dict[str, frozenset[str] | None] = {}
+
+    def expect(self, class_name: str, *, host_class_name: str = "") -> None:
+        """Announce a class to look up, or the adapter of host_class_name
+        when class_name is empty."""
+        if class_name:
+            self._expected.add(class_name)
+        elif host_class_name:
+            self._expected_hosts.add(host_class_name)
+
+    def adapter_class_name(self, host_class_name: str) -> str:
+        if not host_class_name or self.iris is None:
+            return ""
+        if host_class_name not in self._adapters:
+            self._load({host_class_name})
+        return self._adapters.get(host_class_name, "")
+
+    def property_names(self, class_name: str) -> frozenset[str] | None:
+        if self.iris is None:
+            return None
+        if class_name not in self._properties:
+            self._load(set(), {class_name})
+        return self._properties.get(class_name)
+
+    def report(
+        self, production_name: str, issues: list[ProductionValidationIssue]
+    ) -> ProductionValidationReport:
+        return ProductionValidationReport(
+            production_name,
+            tuple(issues),
+            timings={"dictionary": self.seconds},
+            dictionary_queries=self.queries,
+        )
+
+    def _load(self, hosts: set[str], classes: set[str] | None = None) -> None:
+        start = time.perf_counter()
+        hosts = (hosts | self._expected_hosts) - set(self._adapters)
+        classes = (classes or set()) | self._expected
+        self._expected_hosts.clear()
+        self._expected.clear()
+        try:
+            if hosts:
+                self._adapters.update(self._fetch_adapters(hosts))
+            classes |= {name for name in self._adapters.values() if name}
+            classes -= set(self._properties)
+            if classes:
+                self._properties.update(self._fetch_properties(classes))
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def _fetch_adapters(self, hosts: set[str]) -> dict[str, str]:
+        adapters = dict.fromkeys(hosts, "")
+        if self._use_sql:
+            try:
+                for parent, default in self._query(
+                    "SELECT parent, _Default FROM %Dictionary.CompiledParameter "
+                    "WHERE Name = 'ADAPTER' AND parent IN ({})",
+                    hosts,
+                ):
+                    if parent in adapters:
+                        adapters[parent] = str(default or "")
+                return adapters
+            except Exception as exc:
+                self._stop_using_sql(exc)
+        for host in hosts:
+            try:
+                parameter = self.iris._Dictionary.CompiledParameter._OpenId(
+                    f"{host}||ADAPTER"
+                )
+                adapters[host] = str(getattr(parameter, "Default", "") or "")
+            except Exception:
+                pass
+        return adapters
+
+    def _fetch_properties(self, classes: set[str]) -> dict[str, frozenset[str] | None]:
+        if self._use_sql:
+            try:
+                found: dict[str, set[str]] = {}
+                for parent, name in self._query(
+                    "SELECT c.Name, p.Name FROM %Dictionary.CompiledClass c "
+                    "LEFT JOIN %Dictionary.CompiledProperty p ON p.parent = c.ID "
+                    "WHERE c.Name IN ({})",
+                    classes,
+                ):
+                    names = found.setdefault(parent, set())
+                    if name:
+                        names.add(str(name))
+                return {
+                    name: frozenset(found[name]) if name in found else None
+                    for name in classes
+                }
+            except Exception as exc:
+                self._stop_using_sql(exc)
+        return {name: self._open_properties(name) for name in classes}
+
+    def _stop_using_sql(self, exc: Exception) -> None:
+        self._use_sql = False
+        _logger.warning(
+            "Reading the IRIS class dictionary with SQL failed (%s); "
+            "opening class definitions one by one instead.",
+            exc,
         )
-        return str(getattr(parameter, "Default", "") or "")
-    except Exception:
-        return ""
+
+    def _query(self, sql: str, names: set[str]) -> list[tuple[str, Any]]:
+        ordered = sorted(names)
+        rows: list[tuple[str, Any]] = []
+        for offset in range(0, len(ordered), _DICTIONARY_BATCH_SIZE):
+            chunk = ordered[offset : offset + _DICTIONARY_BATCH_SIZE]
+            statement = self.iris.sql.prepare(sql.format(", ".join("?" * len(chunk))))
+            self.queries += 1
+            rows.extend((str(row[0]), row[1]) for row in statement.execute(*chunk))
+        return rows
+
+    def _open_properties(self, class_name: str) -> frozenset[str] | None:
+        # Without SQL, one class definition open still lists every property.
+        try:
+            compiled_class = self.iris._Dictionary.CompiledClass
+            if not compiled_class._ExistsId(class_name):
+                return None
+            properties = compiled_class._OpenId(class_name).Properties
+            return frozenset(
+                str(properties.GetAt(index).Name)
+                for index in range(1, properties.Count() + 1)
+            )
+        except Exception:
+            return None
 
 
 def _iris_module() -> Any:
@@ -468,24 +661,6 @@ def _iris_module() -> Any:
     return iris
 
 
-def _iris_class_exists(iris: Any, class_name: str) -> bool:
-    try:
-        return bool(iris._Dictionary.CompiledClass._ExistsId(class_name))
-    except Exception:
-        return False
-
-
-def _iris_property_exists(iris: Any, class_name: str, property_name: str) -> bool:
-    try:
-        return bool(
-            iris._Dictionary.CompiledProperty._ExistsId(
-                f"{class_name}||{property_name}"
-            )
-        )
-    except Exception:
-        return False
-
-
 def _setting_alias_issue(
     path_prefix: str,
     setting_name: str,
@@ -0,0 +1,56 @@
+"""Version numbers for classes that may be patched or reloaded at runtime.
+
+Used by the caches of component settings and dispatch tables, which must be
+rebuilt when a class or one of its bases changes.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import weakref
+
+_VERSIONS: weakref.WeakKeyDictionary[type, tuple[tuple, int]] = (
+    weakref.WeakKeyDictionary()
+)
+_VERSIONS_LOCK = threading.Lock()
+_next_version = itertools.count(1).__next__
+
+
+def _class_state(klass: type) -> tuple:
+    # Base, attribute name and attribute identities of the MRO. Only ids are
+    # kept, so a cached state never keeps the class or its values alive.
+    mro = klass.__mro__[:-1]
+    namespaces = [base.__dict__ for base in mro]
+    return (
+        tuple(map(id, mro)),
+        tuple(itertools.chain.from_iterable(namespaces)),
+        tuple(
+            map(
+                id,
+                itertools.chain.from_iterable(
+                    [namespace.values() for namespace in namespaces]
+                ),
+            )
+        ),
+    )
+
+
+def class_version(klass: type) -> int:
+    """Return a number that changes whenever klass or one of its bases does.
+
+    Rebinding, adding or deleting an attribute anywhere in the MRO, or
+    reloading the class, yields a new number. Compare versions of the same
+    class only.
+    """
+    state = _class_state(klass)
+    with _VERSIONS_LOCK:
+        entry = _VERSIONS.get(klass)
+        if entry is not None and entry[0] == state:
+            return entry[1]
+        version = _next_version()
+        try:
+            _VERSIONS[klass] = (state, version)
+        except TypeError:
+            pass
+        return version
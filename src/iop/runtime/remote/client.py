@@ -1,13 +1,75 @@
 from __future__ import annotations
 
-from typing import Any
+import logging
+import threading
+import time
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_DEFAULT_TIMEOUT = 30
+_DEFAULT_POOL_SIZE = 10
+_DEFAULT_RETRIES = 3
+_DEFAULT_BACKOFF = 0.5
+# Only read-only requests are resent after a read error or a gateway error;
+# the server may already have acted on a POST, PUT or DELETE (PUT /migrate
+# uploads and compiles), so those are only retried when the connection failed.
+_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_RETRY_STATUSES = (502, 503, 504)
+
+_logger = logging.getLogger(__name__)
+
+
+class EndpointTiming(NamedTuple):
+    calls: int
+    total_seconds: float
+    max_seconds: float
+
+
+def _new_session(remote_settings: dict[str, Any], verify: bool) -> requests.Session:
+    """Build the keep-alive session shared by every call of one client.
+
+    ``pool_size`` bounds the connections kept open per host, ``retries`` and
+    ``retry_backoff`` configure the retry of connection errors, and of read
+    errors and gateway errors (502/503/504) for read-only methods.
+    """
+    retries = int(remote_settings.get("retries", _DEFAULT_RETRIES))
+    pool_size = int(remote_settings.get("pool_size", _DEFAULT_POOL_SIZE))
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=float(remote_settings.get("retry_backoff", _DEFAULT_BACKOFF)),
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=_RETRY_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.auth = (
+        remote_settings.get("username", ""),
+        remote_settings.get("password", ""),
+    )
+    session.verify = verify
+    return session
 
 
 class _RemoteClient:
-    """Small HTTP client for the IOP REST API."""
+    """Small HTTP client for the IOP REST API.
+
+    All calls go through one pooled ``requests.Session``, so the CLI, log
+    polling, migration uploads and the Atelier setup reuse open connections
+    instead of paying a TCP/TLS handshake per request.
+    """
 
     def __init__(self, remote_settings: dict[str, Any]) -> None:
         self._url = remote_settings["url"].rstrip("/")
@@ -18,8 +80,71 @@ class _RemoteClient:
         )
         self._namespace: str = remote_settings.get("namespace", "USER")
         self._verify: bool = remote_settings.get("verify_ssl", True)
+        self._timeout: float = remote_settings.get("timeout", _DEFAULT_TIMEOUT)
         if not self._verify:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        self._session = _new_session(remote_settings, self._verify)
+        self._timings: dict[str, EndpointTiming] = {}
+        self._timings_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> _RemoteClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _request(
+        self, method: str, url: str, timeout: float | None = None, **kwargs: Any
+    ) -> requests.Response:
+        """Send one request through the session and record its duration."""
+        send = getattr(self._session, method.lower())
+        start = time.perf_counter()
+        try:
+            return send(url, timeout=timeout or self._timeout, **kwargs)
+        finally:
+            self._record_timing(method, url, time.perf_counter() - start)
+
+    def _record_timing(self, method: str, url: str, elapsed: float) -> None:
+        path = urlsplit(url).path
+        if path.startswith(self._base_path):
+            path = path[len(self._base_path) :] or "/"
+        key = f"{method.upper()} {path}"
+        with self._timings_lock:
+            calls, total, longest = self._timings.get(key, EndpointTiming(0, 0.0, 0.0))
+            self._timings[key] = EndpointTiming(
+                calls + 1, total + elapsed, max(longest, elapsed)
+            )
+        _logger.debug("%s took %.3fs", key, elapsed)
+
+    @property
+    def _base_path(self) -> str:
+        return urlsplit(self._base).path
+
+    def request_timings(self) -> dict[str, EndpointTiming]:
+        """Return call count and durations per ``"METHOD /path"`` endpoint.
+
+        Paths of the IOP API are relative to ``/api/iop``; other paths, such
+        as Atelier documents, are kept in full.
+        """
+        with self._timings_lock:
+            return dict(self._timings)
+
+    def request_summary(self) -> str:
+        """Return request_timings() as one line for CLI summaries."""
+        timings = self.request_timings()
+        if not timings:
+            return "No HTTP requests sent."
+        calls = sum(timing.calls for timing in timings.values())
+        seconds = sum(timing.total_seconds for timing in timings.values())
+        slowest, timing = max(timings.items(), key=lambda item: item[1].max_seconds)
+        return (
+            f"{calls} HTTP requests in {seconds:.2f}s, "
+            f"slowest {slowest} ({timing.max_seconds:.2f}s)"
+        )
 
     @staticmethod
     def _raise_for_status(resp: requests.Response) -> None:
@@ -38,49 +163,33 @@ class _RemoteClient:
 
     def _get(self, path: str, params: dict | None = None) -> Any:
         p = {"namespace": self._namespace, **(params or {})}
-        resp = requests.get(
-            f"{self._base}{path}",
-            params=p,
-            auth=self._auth,
-            verify=self._verify,
-            timeout=30,
-        )
+        resp = self._request("GET", f"{self._base}{path}", params=p)
         self._raise_for_status(resp)
         return resp.json()
 
     def _post(self, path: str, body: dict | None = None) -> Any:
-        resp = requests.post(
+        resp = self._request(
+            "POST",
             f"{self._base}{path}",
             json=(body or {}),
             params={"namespace": self._namespace},
-            auth=self._auth,
-            verify=self._verify,
-            timeout=30,
         )
         self._raise_for_status(resp)
         return resp.json()
 
     def _put(self, path: str, body: dict | None = None) -> Any:
-        resp = requests.put(
+        resp = self._request(
+            "PUT",
             f"{self._base}{path}",
             json=(body or {}),
             params={"namespace": self._namespace},
-            auth=self._auth,
-            verify=self._verify,
-            timeout=30,
         )
         self._raise_for_status(resp)
         return resp.json()
 
     def _delete(self, path: str, params: dict | None = None) -> Any:
         p = {"namespace": self._namespace, **(params or {})}
-        resp = requests.delete(
-            f"{self._base}{path}",
-            params=p,
-            auth=self._auth,
-            verify=self._verify,
-            timeout=30,
-        )
+        resp = self._request("DELETE", f"{self._base}{path}", params=p)
         self._raise_for_status(resp)
         return resp.json()
 
@@ -2,17 +2,72 @@ from __future__ import annotations
 
 import importlib.util
 import os
+import time
+from typing import NamedTuple
 
 import requests
 
+from ...migration._remote_sync import (
+    FILE_ENCODING,
+    MANIFEST_FEATURE,
+    encode_file,
+    file_digest,
+    iter_migration_files,
+)
+
+
+class MigrationUploadSummary(NamedTuple):
+    files: int
+    uploaded: int
+    deleted: int
+    total_bytes: int
+    sent_bytes: int
+    seconds: float
+
+    @property
+    def saved_bytes(self) -> int:
+        return max(self.total_bytes - self.sent_bytes, 0)
+
+
+def _supports_manifest(client) -> bool:
+    """Return whether the server answers manifest requests on /migrate.
+
+    Older servers replace the whole package folder on every upload, so a
+    manifest-only request would empty it; they are sent everything instead.
+    """
+    try:
+        version = client._get("/version")
+    except (requests.exceptions.RequestException, ValueError):
+        return False
+    return isinstance(version, dict) and MANIFEST_FEATURE in (
+        version.get("features") or ()
+    )
+
+
+def _put_migrate(client, payload: dict) -> requests.Response:
+    resp = client._request(
+        "PUT",
+        f"{client._base}/migrate",
+        json=payload,
+        params={"namespace": client._namespace},
+    )
+    client._raise_for_status(resp)
+    return resp
+
 
 def upload_migration(
     client,
     path: str,
     *,
     strict_production_validation: bool = False,
-) -> None:
-    """Upload .py and .cls files from *path*'s folder to remote IRIS."""
+) -> MigrationUploadSummary:
+    """Upload .py and .cls files from *path*'s folder to remote IRIS.
+
+    Servers that support it first receive a manifest of content hashes and
+    only get the files they are missing or hold an older version of,
+    gzip-compressed, along with the files to delete.
+    """
+    start = time.perf_counter()
     folder = os.path.dirname(path)
 
     package = "python"
@@ -27,31 +82,55 @@ def upload_migration(
     except Exception:
         pass
 
-    body: list[dict] = []
-    settings_file = os.path.basename(path)
-    for dirpath, _, filenames in os.walk(folder):
-        for fname in sorted(filenames):
-            if not (fname.endswith(".py") or fname.endswith(".cls")):
-                continue
-            full = os.path.join(dirpath, fname)
-            rel = os.path.relpath(full, folder).replace(os.sep, "/")
-            with open(full, encoding="utf-8") as fh:
-                body.append({"name": rel, "data": fh.read()})
+    contents: dict[str, bytes] = {}
+    for rel, full in iter_migration_files(folder):
+        with open(full, "rb") as fh:
+            contents[rel] = fh.read()
+    total_bytes = sum(len(data) for data in contents.values())
 
     payload = {
         "namespace": client._namespace,
         "package": package,
         "remote_folder": remote_folder,
-        "settings_file": settings_file,
+        "settings_file": os.path.basename(path),
         "strict_production_validation": bool(strict_production_validation),
-        "body": body,
     }
-    resp = requests.put(
-        f"{client._base}/migrate",
-        json=payload,
-        params={"namespace": client._namespace},
-        auth=client._auth,
-        verify=client._verify,
-        timeout=30,
+
+    if _supports_manifest(client):
+        manifest = {name: file_digest(data) for name, data in contents.items()}
+        diff = _put_migrate(client, {**payload, "manifest": manifest}).json()
+        changed = sorted(set(diff.get("missing", ())) | set(diff.get("stale", ())))
+        delete = list(diff.get("extra", ()))
+        body = [
+            {
+                "name": name,
+                "encoding": FILE_ENCODING,
+                "data": encode_file(contents[name]),
+            }
+            for name in changed
+        ]
+        payload.update(incremental=True, delete=delete)
+    else:
+        delete = []
+        body = [
+            {"name": name, "data": data.decode("utf-8")}
+            for name, data in contents.items()
+        ]
+
+    _put_migrate(client, {**payload, "body": body})
+    summary = MigrationUploadSummary(
+        files=len(contents),
+        uploaded=len(body),
+        deleted=len(delete),
+        total_bytes=total_bytes,
+        sent_bytes=sum(len(entry["data"]) for entry in body),
+        seconds=time.perf_counter() - start,
     )
-    client._raise_for_status(resp)
+    print(
+        f"Uploaded {summary.uploaded} of {summary.files} files "
+        f"({summary.sent_bytes} of {summary.total_bytes} bytes, "
+        f"{summary.saved_bytes} saved), deleted {summary.deleted}, "
+        f"in {summary.seconds:.2f}s"
+    )
+    print(client.request_summary())
+    return summary
@@ -1,26 +1,32 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.resources
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 
+_DEFAULT_UPLOAD_WORKERS = 8
+_EXTENDS = re.compile(
+    r"^Class\s+[\w.%]+\s+Extends\s+(?:\(([^)]*)\)|([\w.%]+))", re.MULTILINE
+)
 
-def setup_remote_classes(client, path: str | None = None) -> None:
-    """Upload and compile IOP .cls files to remote IRIS via the Atelier REST API."""
-    paths_to_upload: list[str] = []
-    if path is None:
-        try:
-            paths_to_upload.append(str(importlib.resources.files("iop").joinpath("cls")))
-        except ModuleNotFoundError:
-            pass
-    else:
-        paths_to_upload.append(path)
 
-    atelier_base = f"{client._url}/api/atelier/v1"
-    doc_names: list[str] = []
+def _content_digest(lines: list[str]) -> str:
+    # Trailing blank lines and line endings are not significant once IRIS
+    # has stored the document.
+    normalized = [line.rstrip("\r") for line in lines]
+    while normalized and not normalized[-1].strip():
+        normalized.pop()
+    return hashlib.sha256("\n".join(normalized).encode("utf-8")).hexdigest()
 
-    for cls_root in paths_to_upload:
+
+def _collect_documents(paths: list[str]) -> dict[str, list[str]]:
+    documents: dict[str, list[str]] = {}
+    for cls_root in paths:
         for dirpath, _, filenames in os.walk(cls_root):
             for fname in sorted(filenames):
                 if not fname.endswith(".cls"):
@@ -32,38 +38,130 @@ def setup_remote_classes(client, path: str | None = None) -> None:
                     .replace("/", ".")
                 )
                 with open(full_path, encoding="utf-8") as fh:
-                    content = fh.read().splitlines()
-                resp = requests.put(
-                    f"{atelier_base}/{client._namespace}/doc/{doc_name}",
-                    json={"enc": False, "content": content},
-                    params={"ignoreConflict": "1"},
-                    auth=client._auth,
-                    verify=client._verify,
-                    timeout=30,
-                )
-                client._raise_for_status(resp)
-                doc_names.append(doc_name)
-                print(f"Uploaded: {doc_name}")
+                    documents[doc_name] = fh.read().splitlines()
+    return documents
+
+
+def _remote_digests(client, atelier_base: str, doc_names: list[str]) -> dict[str, str]:
+    """Return the digest of every document that is compiled on the server.
+
+    Documents the server reports as not up to date (``upd`` is false, for
+    example after a failed compile) are left out, so they are uploaded and
+    compiled again. Any failure means nothing is known about the server, so
+    every document is uploaded.
+    """
+    try:
+        resp = client._request(
+            "POST", f"{atelier_base}/{client._namespace}/docs", json=doc_names
+        )
+        client._raise_for_status(resp)
+        entries = resp.json().get("result", {}).get("content", [])
+    except (requests.exceptions.RequestException, ValueError, AttributeError):
+        return {}
+    return {
+        entry["name"]: _content_digest(entry["content"])
+        for entry in entries
+        if isinstance(entry, dict)
+        and not entry.get("status")
+        and entry.get("upd", True)
+        and isinstance(entry.get("content"), list)
+    }
+
+
+def _dependents(documents: dict[str, list[str]], changed: set[str]) -> set[str]:
+    """Return changed plus every local class that extends one of them."""
+    parents: dict[str, set[str]] = {}
+    for doc_name, lines in documents.items():
+        match = _EXTENDS.search("\n".join(lines))
+        if match:
+            names = (match.group(1) or match.group(2)).split(",")
+            parents[doc_name] = {name.strip() + ".cls" for name in names}
+
+    closure = set(changed)
+    grew = True
+    while grew:
+        grew = False
+        for doc_name, bases in parents.items():
+            if doc_name not in closure and bases & closure:
+                closure.add(doc_name)
+                grew = True
+    return closure
+
 
-    if not doc_names:
+def setup_remote_classes(
+    client, path: str | None = None, max_workers: int = _DEFAULT_UPLOAD_WORKERS
+) -> None:
+    """Upload and compile IOP .cls files to remote IRIS via the Atelier REST API.
+
+    Documents whose content already matches the server and that are compiled
+    there are skipped; the others are uploaded by up to max_workers concurrent requests and compiled
+    together with the local classes that extend them.
+    """
+    paths_to_upload: list[str] = []
+    if path is None:
+        try:
+            paths_to_upload.append(str(importlib.resources.files("iop").joinpath("cls")))
+        except ModuleNotFoundError:
+            pass
+    else:
+        paths_to_upload.append(path)
+
+    atelier_base = f"{client._url}/api/atelier/v1"
+    documents = _collect_documents(paths_to_upload)
+    if not documents:
         raise RuntimeError("No .cls files found to upload.")
 
-    resp = requests.post(
-        f"{atelier_base}/{client._namespace}/action/compile",
-        json=doc_names,
-        params={"flags": "cuk"},
-        auth=client._auth,
-        verify=client._verify,
-        timeout=120,
+    start = time.perf_counter()
+    remote = _remote_digests(client, atelier_base, list(documents))
+    changed = sorted(
+        doc_name
+        for doc_name, content in documents.items()
+        if remote.get(doc_name) != _content_digest(content)
+    )
+
+    def upload(doc_name: str) -> str:
+        resp = client._request(
+            "PUT",
+            f"{atelier_base}/{client._namespace}/doc/{doc_name}",
+            json={"enc": False, "content": documents[doc_name]},
+            params={"ignoreConflict": "1"},
+        )
+        client._raise_for_status(resp)
+        return doc_name
+
+    if changed:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = [pool.submit(upload, doc_name) for doc_name in changed]
+            for future in as_completed(futures):
+                print(f"Uploaded: {future.result()}")
+    upload_seconds = time.perf_counter() - start
+
+    to_compile = sorted(_dependents(documents, set(changed)))
+    start = time.perf_counter()
+    if to_compile:
+        resp = client._request(
+            "POST",
+            f"{atelier_base}/{client._namespace}/action/compile",
+            json=to_compile,
+            params={"flags": "cuk"},
+            timeout=120,
+        )
+        client._raise_for_status(resp)
+        result = resp.json()
+        for line in result.get("console", []):
+            if line:
+                print(line)
+        errors = result.get("status", {}).get("errors", [])
+        if errors:
+            raise RuntimeError(f"Compilation errors: {errors}")
+    compile_seconds = time.perf_counter() - start
+
+    print(
+        f"\nUploaded {len(changed)}, skipped {len(documents) - len(changed)} "
+        f"unchanged, compiled {len(to_compile)} .cls files "
+        f"(upload {upload_seconds:.2f}s, compile {compile_seconds:.2f}s)."
     )
-    client._raise_for_status(resp)
-    result = resp.json()
-    for line in result.get("console", []):
-        if line:
-            print(line)
-    errors = result.get("status", {}).get("errors", [])
-    if errors:
-        raise RuntimeError(f"Compilation errors: {errors}")
+    print(client.request_summary())
     print(
         "\n.cls files uploaded and compiled successfully."
         "\nNext step: ensure the 'iop' Python package is installed on the IRIS server:"
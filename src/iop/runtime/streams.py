@@ -0,0 +1,119 @@
+"""Chunked conversion between Python strings/bytes and IRIS streams.
+
+Kept free of heavy imports: message serialization uses it on every message.
+"""
+
+from __future__ import annotations
+
+import io
+
+# %Stream.GlobalCharacter and %Stream.GlobalBinary store their data in
+# global nodes of this many characters/bytes.
+IRIS_STREAM_BLOCK_SIZE = 32000
+# Longest string an IRIS process can hold; every chunk passes through one.
+IRIS_MAX_STRING_LENGTH = 3_641_144
+_stream_chunk_size = 30 * IRIS_STREAM_BLOCK_SIZE
+
+
+def get_stream_chunk_size() -> int:
+    return _stream_chunk_size
+
+
+def set_stream_chunk_size(size: int) -> int:
+    """Set the default chunk size for stream reads and writes.
+
+    Sizes of at least one IRIS stream block are rounded down to a whole number
+    of blocks so every write fills complete global nodes. Sizes above the IRIS
+    maximum string length are rejected. Returns the size actually used.
+    """
+    global _stream_chunk_size
+    if size <= 0:
+        raise ValueError("Stream chunk size must be positive")
+    if size > IRIS_MAX_STRING_LENGTH:
+        raise ValueError(
+            f"Stream chunk size must not exceed {IRIS_MAX_STRING_LENGTH} characters"
+        )
+    if size >= IRIS_STREAM_BLOCK_SIZE:
+        size -= size % IRIS_STREAM_BLOCK_SIZE
+    _stream_chunk_size = size
+    return size
+
+
+def iter_stream_chunks(stream, buffer=None):
+    """Yield the content of an IRIS stream from the start, one chunk at a time."""
+    buffer = buffer or _stream_chunk_size
+    stream.Rewind()
+    while not stream.AtEnd:
+        chunk = stream.Read(buffer)
+        if not chunk:
+            break
+        yield chunk
+
+
+def stream_to_string(stream, buffer=None) -> str:
+    out = io.StringIO()
+    for chunk in iter_stream_chunks(stream, buffer):
+        out.write(chunk)
+    return out.getvalue()
+
+
+def stream_to_utf8(stream, buffer=None) -> bytearray:
+    """Read a character stream into one UTF-8 encoded buffer.
+
+    Only one decoded chunk is held as a Python string at a time, which keeps
+    non-ASCII payloads at their UTF-8 size instead of a wide string plus the
+    UTF-8 copy a JSON parser would make of it.
+    """
+    data = bytearray()
+    for chunk in iter_stream_chunks(stream, buffer):
+        data += chunk.encode("utf-8", "surrogatepass")
+    return data
+
+
+def iter_string_chunks(string: str, buffer=None):
+    buffer = buffer or _stream_chunk_size
+    for i in range(0, len(string), buffer):
+        yield string[i : i + buffer]
+
+
+def string_to_stream(iris, string: str, buffer=None):
+    return chunks_to_stream(iris, iter_string_chunks(string, buffer))
+
+
+def chunks_to_stream(iris, chunks):
+    """Write an iterable of strings to a new character stream."""
+    stream = iris.cls("%Stream.GlobalCharacter")._New()
+    for chunk in chunks:
+        stream.Write(chunk)
+    return stream
+
+
+def stream_to_bytes(stream, buffer=None) -> bytearray:
+    """Read a binary stream into one mutable buffer."""
+    data = bytearray()
+    for chunk in iter_stream_chunks(stream, buffer):
+        if isinstance(chunk, str):
+            # Embedded Python hands binary stream data back as one
+            # character per byte.
+            chunk = chunk.encode("latin-1")
+        data += chunk
+    return data
+
+
+def bytes_to_stream(iris, data, buffer=None):
+    return buffers_to_stream(iris, (data,), buffer)
+
+
+def buffers_to_stream(iris, buffers, buffer=None):
+    """Write a sequence of bytes-like objects to one binary stream.
+
+    Each buffer is written in slices of at most ``buffer`` bytes, so large
+    buffers are never concatenated in memory first.
+    """
+    buffer = buffer or _stream_chunk_size
+    stream = iris.cls("%Stream.GlobalBinary")._New()
+    for data in buffers:
+        view = memoryview(data).cast("B")
+        for i in range(0, len(view), buffer):
+            stream.Write(bytes(view[i : i + buffer]))
+    return stream
@@ -26,6 +26,19 @@ class MyPydanticPickleMessage(PydanticPickleMessage):
     message: str = None
 
 
+@dataclass
+class MyBinaryMessage(Message):
+    CODEC = "msgpack"
+
+    message: str = None
+
+
+class MyPydanticBinaryMessage(PydanticMessage):
+    CODEC = "msgpack"
+
+    message: str = None
+
+
 class MyPersistentMessage(PersistentMessage):
     message: str = Field(default="")
 
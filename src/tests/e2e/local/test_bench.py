@@ -4,6 +4,11 @@ import time
 import timeit
 
 from iop import Production
+from iop.messages.serialization import (
+    serialize_binary_message,
+    serialize_message,
+    serialize_pickle_message,
+)
 from iop.migration import utils as migration_utils
 from iop.runtime.local import _LocalDirector
 
@@ -180,6 +185,30 @@ class TestBenchIoP:
             "message_type": "msg.MyPydanticPickleMessage",
             "use_json": True,
         },
+        {
+            "name": "Python BP to Python BO with Binary Message",
+            "component": "Python.BenchIoPProcess",
+            "message_type": "msg.MyBinaryMessage",
+            "use_json": True,
+        },
+        {
+            "name": "Python BP to ObjetScript BO with Binary Message",
+            "component": "Python.BenchIoPProcess.To.Cls",
+            "message_type": "msg.MyBinaryMessage",
+            "use_json": True,
+        },
+        {
+            "name": "Python BP to Python BO with Pydantic Binary Message",
+            "component": "Python.BenchIoPProcess",
+            "message_type": "msg.MyPydanticBinaryMessage",
+            "use_json": True,
+        },
+        {
+            "name": "Python BP to ObjetScript BO with Pydantic Binary Message",
+            "component": "Python.BenchIoPProcess.To.Cls",
+            "message_type": "msg.MyPydanticBinaryMessage",
+            "use_json": True,
+        },
     ]
 
     @classmethod
@@ -230,6 +259,38 @@ class TestBenchIoP:
         for test_case in self.TEST_CASES:
             self.run_benchmark(test_case)
 
+    def test_stored_message_size(self):
+        msg_module = sys.modules["msg"]
+        cases = [
+            ("Message, short body", msg_module.MyBinaryMessage(message="test")),
+            ("Message, 10KB body", msg_module.MyBinaryMessage(message="x" * 10_000)),
+            (
+                "PydanticMessage, 10KB body",
+                msg_module.MyPydanticBinaryMessage(message="x" * 10_000),
+            ),
+        ]
+        for name, message in cases:
+            json_serial = serialize_message(message)
+            pickle_serial = serialize_pickle_message(message)
+            binary_serial = serialize_binary_message(message, "msgpack")
+            json_size = (
+                json_serial.json.Size
+                if json_serial.type == "Stream"
+                else len(json_serial.json.encode())
+            )
+            sizes = {
+                "json": json_size,
+                "pickle": pickle_serial.jbin.Size,
+                "msgpack": binary_serial.data.Size,
+            }
+            self.results.append(
+                (
+                    f"Stored size ({name})",
+                    ", ".join(f"{key}={value}" for key, value in sizes.items()),
+                )
+            )
+            assert sizes["msgpack"] < sizes["pickle"]
+
     @classmethod
     def teardown_class(cls):
         try:
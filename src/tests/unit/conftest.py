@@ -17,6 +17,16 @@ for import_path in UNIT_IMPORT_PATHS:
         sys.path.append(path)
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless they are selected explicitly with ``-m benchmark``."""
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmark (run with -m benchmark)")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 class _FakeStream:
     __module__ = "iris"
 
@@ -40,6 +50,16 @@ class _FakeStream:
         self._value += value
 
 
+class _FakeBinaryStream(_FakeStream):
+    def __init__(self):
+        self._value = b""
+        self._position = 0
+
+    @property
+    def Size(self):
+        return len(self._value)
+
+
 class _FakeMessage:
     __module__ = "iris"
     buffer = 1_000_000
@@ -50,6 +70,7 @@ class _FakeMessage:
         self._json = ""
         self.type = "String"
         self.jstr = _FakeStream()
+        self.jbin = _FakeBinaryStream()
 
     @property
     def json(self):
@@ -74,6 +95,8 @@ class _FakeClass:
     def _New(self):
         if self._iris_classname == "%Stream.GlobalCharacter":
             return _FakeStream()
+        if self._iris_classname == "%Stream.GlobalBinary":
+            return _FakeBinaryStream()
         return _FakeMessage(self._iris_classname)
 
     def __getattr__(self, name):
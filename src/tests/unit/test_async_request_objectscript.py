@@ -32,3 +32,24 @@ def test_async_response_poll_requeues_unmatched_responses():
 
     assert "if 'tFound" in method
     assert "Ens.Queue).EnQueue(tResponseHeader)" in method
+
+
+def _dispatch_collect_responses() -> str:
+    source = COMMON_CLASS.read_text(encoding="utf-8")
+    match = re.search(
+        r"Method dispatchCollectResponses\(.*?\n\}\n",
+        source,
+        flags=re.DOTALL,
+    )
+    assert match is not None
+    return match.group(0)
+
+
+def test_response_demultiplexer_drains_a_queue_snapshot_for_all_pending_requests():
+    method = _dispatch_collect_responses()
+
+    assert "GetCount(pQueueName)" in method
+    assert "DeQueue(pQueueName,.tResponseHeader,0," in method
+    assert 'pPending."__contains__"(tKey)' in method
+    assert "Ens.Queue).EnQueue(tResponseHeader)" in method
+    assert 'pResponses."__setitem__"(tKey,tResponse)' in method
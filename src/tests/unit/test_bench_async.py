@@ -0,0 +1,167 @@
+"""Async request micro-benchmarks — no live IRIS instance required.
+
+Compares the shared response demultiplexer with the previous per-request
+polling of the return queue for send_request_async_ng() fan-outs, and a
+bounded send_many_async_ng() fan-out with sequential send_request_sync()
+calls to targets that take a fixed time to answer. They are skipped by
+default; run them with ``-m benchmark`` and ``-s`` to see the numbers:
+
+    pytest src/tests/unit/test_bench_async.py -m benchmark -s
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from iop.components.business_host import _BusinessHost
+from iop.runtime import iris as runtime_iris
+
+pytestmark = pytest.mark.benchmark
+
+
+class BenchReturnQueue:
+    """Shared return queue that answers every request in reverse order."""
+
+    def __init__(self):
+        self.queue = []
+        self.sent = 0
+        self.dequeues = 0
+
+    def dispatchSendRequestAsyncNG(
+        self, target, request, timeout, description, header_id, queue_name, end_time
+    ):
+        self.sent += 1
+        header_id.value = self.sent
+        queue_name.value = "SyncCall"
+        return 1
+
+    def answer_all(self):
+        self.queue.extend((header_id, None) for header_id in range(self.sent, 0, -1))
+
+    def dispatchCollectResponses(self, queue_name, pending, responses, errors):
+        for _ in range(len(self.queue)):
+            self.dequeues += 1
+            header_id, body = self.queue.pop(0)
+            if str(header_id) in pending:
+                responses[str(header_id)] = body
+            else:
+                self.queue.append((header_id, body))
+        return 1
+
+    def dispatchIsRequestDone(self, timeout, end_time, queue_name, header_id, response):
+        for _ in range(len(self.queue)):
+            self.dequeues += 1
+            found_id, body = self.queue.pop(0)
+            if found_id == header_id:
+                response.value = body
+                return 2
+            self.queue.append((found_id, body))
+        return 1
+
+
+async def _legacy_request(queue, header_id):
+    # Previous AsyncRequest loop: every request sleeps 100ms and scans the
+    # whole shared queue for its own response.
+    response = runtime_iris.get_iris().ref()
+    while True:
+        await asyncio.sleep(0.1)
+        if queue.dispatchIsRequestDone(-1, 0, "SyncCall", header_id, response) == 2:
+            return response.value
+
+
+async def _fan_out(host, count, legacy):
+    queue = host.iris_handle
+    if legacy:
+        for _ in range(count):
+            queue.sent += 1
+        tasks = [_legacy_request(queue, i) for i in range(1, count + 1)]
+    else:
+        tasks = [host.send_request_async_ng("target", None) for _ in range(count)]
+    gathered = asyncio.gather(*tasks)
+    while queue.sent < count:
+        await asyncio.sleep(0)
+    queue.answer_all()
+    return await gathered
+
+
+class TestBenchResponseDemultiplexer:
+    @pytest.mark.parametrize("count", [100, 1_000])
+    def test_fan_out_report(self, count):
+        results = {}
+        for legacy in (True, False):
+            host = _BusinessHost()
+            host.iris_handle = BenchReturnQueue()
+            start = time.perf_counter()
+            responses = asyncio.run(_fan_out(host, count, legacy))
+            elapsed = time.perf_counter() - start
+            assert len(responses) == count
+            results[legacy] = (elapsed, host.iris_handle.dequeues)
+
+        (legacy_time, legacy_dequeues), (time_, dequeues) = results[True], results[False]
+        print(
+            f"async fan-out ({count} requests): "
+            f"legacy={legacy_time:.3f}s/{legacy_dequeues} dequeues "
+            f"demultiplexed={time_:.3f}s/{dequeues} dequeues"
+        )
+        assert dequeues == count
+        assert dequeues < legacy_dequeues
+
+
+class LatencyTarget:
+    """Targets that answer every request after a fixed latency."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.sent = {}
+
+    def dispatchSendRequestSync(self, target, request, timeout, description):
+        time.sleep(self.latency)
+        return None
+
+    def dispatchSendRequestAsyncNG(
+        self, target, request, timeout, description, header_id, queue_name, end_time
+    ):
+        header_id.value = len(self.sent) + 1
+        queue_name.value = "SyncCall"
+        self.sent[str(header_id.value)] = time.monotonic() + self.latency
+        return 1
+
+    def dispatchCollectResponses(self, queue_name, pending, responses, errors):
+        now = time.monotonic()
+        for key in pending:
+            if self.sent[key] <= now:
+                responses[key] = None
+        return 1
+
+
+async def _send_many(host, count, max_in_flight):
+    pairs = (("target", None) for _ in range(count))
+    return [
+        result
+        async for result in host.send_many_async_ng(pairs, max_in_flight=max_in_flight)
+    ]
+
+
+class TestBenchSendMany:
+    def test_send_many_vs_sequential_sync_report(self):
+        count, latency, max_in_flight = 200, 0.005, 50
+        host = _BusinessHost()
+        host.iris_handle = LatencyTarget(latency)
+
+        start = time.perf_counter()
+        for _ in range(count):
+            host.send_request_sync("target", None)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = asyncio.run(_send_many(host, count, max_in_flight))
+        fan_out = time.perf_counter() - start
+
+        print(
+            f"fan-out ({count} requests, {latency * 1000:.0f}ms each): "
+            f"sequential send_request_sync={sequential:.3f}s "
+            f"send_many_async_ng(max_in_flight={max_in_flight})={fan_out:.3f}s"
+        )
+        assert sorted(index for index, _, _, _ in results) == list(range(count))
+        assert fan_out < sequential
@@ -0,0 +1,282 @@
+"""Serialization micro-benchmarks — no live IRIS instance required.
+
+Benchmarks that replace an implementation check that the optimized path
+produces the same result as the previous one before reporting both timings.
+They are skipped by default; run them with ``-m benchmark`` and ``-s`` to see
+the numbers:
+
+    pytest src/tests/unit/test_bench_serialization.py -m benchmark -s
+"""
+
+import codecs
+import json
+import pickle
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+
+import pytest
+
+from iop import Message, PydanticMessage
+from iop.messages.codecs import get_codec
+from iop.messages.lazy import materialize
+from iop.messages.serialization import (
+    TempPydanticModel,
+    dataclass_from_dict,
+    dataclass_to_dict,
+    deserialize_message,
+    encode_dataclass_message,
+    pickle_frames,
+    serialize_message,
+    unpickle_frames,
+)
+from iop.migration import _conversion
+
+pytestmark = pytest.mark.benchmark
+
+
+@dataclass
+class BenchInner(Message):
+    value: int = 0
+    label: str = "inner"
+
+
+@dataclass
+class BenchSmall(Message):
+    text: str = "hello"
+    number: int = 42
+
+
+@dataclass
+class BenchNested(Message):
+    inner: BenchInner = None
+    small: BenchSmall = None
+    tags: dict = None
+
+
+@dataclass
+class BenchList(Message):
+    items: list = None
+
+
+class BenchEntry(PydanticMessage):
+    text: str = ""
+    number: int = 0
+
+
+class BenchBundle(PydanticMessage):
+    entries: list[BenchEntry] = []
+
+
+class BenchLazyBundle(BenchBundle):
+    LAZY_BODY = True
+
+
+def _legacy_encode(message):
+    return TempPydanticModel.model_validate(
+        dataclass_to_dict(message)
+    ).model_dump_json()
+
+
+def _report(name, legacy, optimized):
+    print(
+        f"{name}: legacy={legacy:.6f}s optimized={optimized:.6f}s "
+        f"speedup={legacy / optimized:.2f}x"
+    )
+
+
+def _legacy_stream_to_string(stream, buffer):
+    string = ""
+    stream.Rewind()
+    while not stream.AtEnd:
+        string += stream.Read(buffer)
+    return string
+
+
+def _legacy_string_to_stream(iris, string, buffer):
+    stream = iris.cls("%Stream.GlobalCharacter")._New()
+    chunks = [string[i : i + buffer] for i in range(0, len(string), buffer)]
+    for chunk in chunks:
+        stream.Write(chunk)
+    return stream
+
+
+class TestBenchDataclassEncoder:
+    CASES = [
+        ("small", lambda: BenchSmall(), 2000),
+        (
+            "nested",
+            lambda: BenchNested(
+                inner=BenchInner(value=1),
+                small=BenchSmall(),
+                tags={"a": BenchInner(value=2), "b": "plain"},
+            ),
+            2000,
+        ),
+        (
+            "list-heavy",
+            lambda: BenchList(
+                items=[BenchInner(value=i) for i in range(500)] + list(range(500))
+            ),
+            50,
+        ),
+    ]
+
+    @pytest.mark.parametrize("name,factory,number", CASES)
+    def test_encoder_matches_and_reports(self, name, factory, number):
+        message = factory()
+        message.extra = "not a field"
+
+        assert encode_dataclass_message(message).decode() == _legacy_encode(message)
+
+        legacy = timeit.timeit(lambda: _legacy_encode(message), number=number)
+        optimized = timeit.timeit(
+            lambda: encode_dataclass_message(message), number=number
+        )
+        _report(f"dataclass encoder ({name})", legacy, optimized)
+        assert optimized > 0
+
+
+class TestBenchMessageCodecs:
+    """Throughput and stored size of the JSON, pickle and msgpack formats."""
+
+    @staticmethod
+    def _json_round_trip(message):
+        payload = encode_dataclass_message(message)
+        dataclass_from_dict(type(message), json.loads(payload))
+        return len(payload)
+
+    @staticmethod
+    def _pickle_round_trip(message):
+        payload = codecs.encode(pickle.dumps(message), "base64")
+        pickle.loads(codecs.decode(payload, "base64"))
+        return len(payload)
+
+    @staticmethod
+    def _msgpack_round_trip(message):
+        codec = get_codec("msgpack")
+        payload = codec.encode(message)
+        codec.decode(type(message), payload)
+        return len(payload)
+
+    @pytest.mark.parametrize("name,factory,number", TestBenchDataclassEncoder.CASES)
+    def test_codecs_report(self, name, factory, number):
+        message = factory()
+        paths = {
+            "json": self._json_round_trip,
+            "pickle": self._pickle_round_trip,
+            "msgpack": self._msgpack_round_trip,
+        }
+
+        for path, round_trip in paths.items():
+            size = round_trip(message)
+            elapsed = timeit.timeit(lambda: round_trip(message), number=number)
+            print(
+                f"codec {path} ({name}): {number / elapsed:.0f} msg/s, "
+                f"{size} bytes stored"
+            )
+            assert size > 0
+
+
+class TestBenchPickleStorage:
+    """Base64 text versus raw protocol 5 bytes for PickleMessage bodies."""
+
+    @staticmethod
+    def _base64_round_trip(message):
+        payload = codecs.encode(pickle.dumps(message), "base64")
+        pickle.loads(codecs.decode(payload, "base64"))
+        return len(payload)
+
+    @staticmethod
+    def _binary_round_trip(message):
+        payload = bytearray()
+        for frame in pickle_frames(message):
+            payload += frame
+        unpickle_frames(payload)
+        return len(payload)
+
+    @pytest.mark.parametrize("size", [1_000, 1_000_000])
+    def test_pickle_storage_report(self, size):
+        message = BenchList(items=[bytes(size)])
+        number = 200 if size < 100_000 else 10
+
+        legacy_size = self._base64_round_trip(message)
+        binary_size = self._binary_round_trip(message)
+        legacy = timeit.timeit(lambda: self._base64_round_trip(message), number=number)
+        binary = timeit.timeit(lambda: self._binary_round_trip(message), number=number)
+        _report(f"pickle storage ({size} bytes)", legacy, binary)
+        print(f"pickle storage ({size} bytes): {legacy_size} -> {binary_size} bytes")
+        assert binary_size < legacy_size
+
+
+class TestBenchStreamChunks:
+    """Chunked stream reads and writes against the unit-test fake stream."""
+
+    @pytest.mark.parametrize("size", [100_000, 10_000_000])
+    def test_stream_round_trip_report(self, fake_iris_runtime, size):
+        text = "x" * size
+        buffer = _conversion.IRIS_STREAM_BLOCK_SIZE
+        number = 20 if size < 1_000_000 else 3
+        stream = _conversion.string_to_stream(fake_iris_runtime, text, buffer)
+
+        legacy_read = timeit.timeit(
+            lambda: _legacy_stream_to_string(stream, buffer), number=number
+        )
+        read = timeit.timeit(
+            lambda: _conversion.stream_to_string(stream, buffer), number=number
+        )
+        _report(f"stream read ({size} chars)", legacy_read, read)
+        assert _conversion.stream_to_string(stream, buffer) == text
+
+        legacy_write = timeit.timeit(
+            lambda: _legacy_string_to_stream(fake_iris_runtime, text, buffer),
+            number=number,
+        )
+        write = timeit.timeit(
+            lambda: _conversion.string_to_stream(fake_iris_runtime, text, buffer),
+            number=number,
+        )
+        _report(f"stream write ({size} chars)", legacy_write, write)
+        assert read > 0 and write > 0
+
+
+def _peak_memory(func):
+    tracemalloc.start()
+    try:
+        result = func()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class TestBenchJsonStreamMemory:
+    """Peak memory of decoding a large stream-backed IOP.Message body."""
+
+    @pytest.mark.parametrize("size", [100, 1_000])
+    def test_json_stream_memory_report(self, fake_iris_runtime, size):
+        entries = [
+            BenchEntry(text="€" + "x" * 10_000, number=i) for i in range(size)
+        ]
+        body = BenchBundle(entries=entries).model_dump_json()
+        serial = serialize_message(BenchBundle())
+        serial.json = _conversion.string_to_stream(fake_iris_runtime, body)
+        lazy_serial = serialize_message(BenchLazyBundle())
+        lazy_serial.classname = f"{__name__}.BenchLazyBundle"
+        lazy_serial.json = serial.json
+
+        legacy, legacy_peak = _peak_memory(
+            lambda: BenchBundle.model_validate_json(
+                _conversion.stream_to_string(serial.json)
+            )
+        )
+        streamed, streamed_peak = _peak_memory(lambda: deserialize_message(serial))
+        lazy, lazy_peak = _peak_memory(lambda: deserialize_message(lazy_serial))
+
+        assert streamed == legacy
+        assert materialize(lazy).entries == legacy.entries
+        print(
+            f"json stream decode ({len(body)} chars): legacy peak={legacy_peak} "
+            f"utf8 peak={streamed_peak} lazy peak before access={lazy_peak}"
+        )
+        assert streamed_peak < legacy_peak
+        assert lazy_peak < streamed_peak
@@ -1,5 +1,9 @@
 """Unit tests for _BusinessHost — no live IRIS instance required."""
 import asyncio
+import importlib
+import os
+import sys
+from inspect import getsource
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,8 +15,10 @@ from fixtures.message import (
     SimpleMessageNotMessage,
 )
 
+from iop.components import business_host as business_host_module
 from iop.components.business_host import _BusinessHost
-from iop.messages.dispatch import dispatch_serializer
+from iop.messages.dispatch import dispatch_message, dispatch_serializer
+from iop.messages.serialization import serialize_message
 
 
 @pytest.fixture
@@ -22,24 +28,61 @@ def business_host():
     return bh
 
 
+class FakeReturnQueue:
+    """IRIS host side of send_request_async_ng with one shared return queue."""
+
+    def __init__(self, inproc=False):
+        self.inproc = inproc
+        self.queue = []
+        self.sent = []
+        self.dequeues = 0
+
+    def dispatchSendRequestAsyncNG(
+        self, target, request, timeout, description, header_id, queue_name, end_time
+    ):
+        if self.inproc:
+            return serialize_message(MyResponse(value=f"inproc {target}"))
+        header_id.value = len(self.sent) + 1
+        queue_name.value = "SyncCall"
+        self.sent.append((header_id.value, target))
+        return 1
+
+    def reply(self, header_id, value):
+        self.queue.append((header_id, serialize_message(MyResponse(value=value))))
+
+    def dispatchCollectResponses(self, queue_name, pending, responses, errors):
+        for _ in range(len(self.queue)):
+            self.dequeues += 1
+            header_id, body = self.queue.pop(0)
+            if str(header_id) in pending:
+                if body is None:
+                    errors[str(header_id)] = "Error message received: failed"
+                else:
+                    responses[str(header_id)] = body
+            else:
+                self.queue.append((header_id, body))
+        return 1
+
+
+async def _until_sent(queue, count):
+    while len(queue.sent) < count:
+        await asyncio.sleep(0)
+
+
 class TestBusinessHostAsync:
     @pytest.mark.asyncio
-    @patch('iop.components.async_request._iris.get_iris')
-    @patch('iop.components.async_request.dispatch_serializer')
-    @patch('iop.components.async_request.dispatch_deserializer')
-    async def test_send_request_async_ng(
-        self, mock_deserializer, mock_serializer, mock_get_iris, business_host
-    ):
-        mock_get_iris.return_value.ref.return_value = MagicMock(value=None)
-        mock_serializer.return_value = MagicMock()
-        business_host.iris_handle.dispatchSendRequestAsyncNG = MagicMock()
-        business_host.iris_handle.dispatchIsRequestDone.return_value = 2
-        mock_deserializer.return_value = MyResponse(value='test')
+    async def test_send_request_async_ng(self, business_host):
+        business_host.iris_handle = FakeReturnQueue()
 
-        result = await business_host.send_request_async_ng('test', SimpleMessage(integer=1, string='test'))
+        task = asyncio.ensure_future(
+            business_host.send_request_async_ng(
+                'test', SimpleMessage(integer=1, string='test')
+            )
+        )
+        await _until_sent(business_host.iris_handle, 1)
+        business_host.iris_handle.reply(1, 'test')
 
-        assert result == MyResponse(value='test')
-        mock_deserializer.assert_called_once()
+        assert await asyncio.wait_for(task, timeout=1) == MyResponse(value='test')
 
     @pytest.mark.asyncio
     @patch(
@@ -60,24 +103,205 @@ class TestBusinessHostAsync:
         mock_get_iris.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch('iop.components.async_request._iris.get_iris')
-    @patch('iop.components.async_request.dispatch_serializer')
-    @patch('iop.components.async_request.dispatch_deserializer')
-    async def test_send_request_async_ng_only_deserializes_matching_response(
-        self, mock_deserializer, mock_serializer, mock_get_iris, business_host
+    async def test_send_request_async_ng_resolves_responses_by_header_id(
+        self, business_host
     ):
-        mock_get_iris.return_value.ref.return_value = MagicMock(value=None)
-        mock_serializer.return_value = MagicMock()
-        business_host.iris_handle.dispatchIsRequestDone.side_effect = [1, 1, 2]
-        mock_deserializer.return_value = MyResponse(value='matched')
+        queue = FakeReturnQueue()
+        business_host.iris_handle = queue
+        queue.reply(99, 'someone else')
+
+        tasks = [
+            asyncio.ensure_future(
+                business_host.send_request_async_ng(
+                    f'target{i}', SimpleMessage(integer=i, string='test')
+                )
+            )
+            for i in range(3)
+        ]
+        await _until_sent(queue, 3)
+        for header_id, target in reversed(queue.sent):
+            queue.reply(header_id, target)
+
+        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+        assert results == [MyResponse(value=f'target{i}') for i in range(3)]
+        assert [header_id for header_id, _ in queue.queue] == [99]
+
+    @pytest.mark.asyncio
+    async def test_send_request_async_ng_raises_error_responses(self, business_host):
+        queue = FakeReturnQueue()
+        business_host.iris_handle = queue
+        task = asyncio.ensure_future(
+            business_host.send_request_async_ng('test', SimpleMessage(integer=1, string='test'))
+        )
+        await _until_sent(queue, 1)
+        queue.queue.append((1, None))
+
+        with pytest.raises(RuntimeError, match='Error message received'):
+            await asyncio.wait_for(task, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_send_request_async_ng_times_out(self, business_host):
+        business_host.iris_handle = FakeReturnQueue()
+
+        with pytest.raises(RuntimeError, match='Timed out'):
+            await asyncio.wait_for(
+                business_host.send_request_async_ng(
+                    'test', SimpleMessage(integer=1, string='test'), timeout=0.05
+                ),
+                timeout=1,
+            )
+
+    @pytest.mark.asyncio
+    async def test_send_request_async_ng_returns_inproc_responses(self, business_host):
+        business_host.iris_handle = FakeReturnQueue(inproc=True)
 
         result = await business_host.send_request_async_ng(
             'test', SimpleMessage(integer=1, string='test')
         )
 
-        assert result == MyResponse(value='matched')
-        assert business_host.iris_handle.dispatchIsRequestDone.call_count == 3
-        mock_deserializer.assert_called_once_with(None)
+        assert result == MyResponse(value='inproc test')
+
+
+    @pytest.mark.asyncio
+    async def test_send_many_async_ng_limits_requests_in_flight(self, business_host):
+        queue = FakeReturnQueue()
+        business_host.iris_handle = queue
+        pairs = [(f'target{i}', SimpleMessage(integer=i, string='test')) for i in range(5)]
+        results = []
+
+        async def consume():
+            async for result in business_host.send_many_async_ng(pairs, max_in_flight=2):
+                results.append(result)
+
+        task = asyncio.ensure_future(consume())
+        answered = set()
+        while not task.done():
+            await asyncio.sleep(0.001)
+            waiting = [sent for sent in queue.sent if sent[0] not in answered]
+            assert len(waiting) <= 2
+            if waiting:
+                # Answer the newest request first.
+                header_id, target = waiting[-1]
+                answered.add(header_id)
+                queue.reply(header_id, target)
+        await task
+
+        assert sorted(results) == [
+            (i, f'target{i}', MyResponse(value=f'target{i}'), 1) for i in range(5)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_send_many_async_ng_yields_errors_with_status(self, business_host):
+        queue = FakeReturnQueue()
+        business_host.iris_handle = queue
+        fan_out = business_host.send_many_async_ng(
+            [('ok', SimpleMessage(integer=1, string='test')),
+             ('failing', SimpleMessage(integer=2, string='test'))]
+        )
+
+        first = asyncio.ensure_future(fan_out.__anext__())
+        await _until_sent(queue, 2)
+        queue.queue.append((2, None))
+        index, target, error, status = await asyncio.wait_for(first, timeout=1)
+        assert (index, target, status) == (1, 'failing', 0)
+        assert isinstance(error, RuntimeError)
+
+        queue.reply(1, 'ok')
+        assert await asyncio.wait_for(fan_out.__anext__(), timeout=1) == (
+            0, 'ok', MyResponse(value='ok'), 1
+        )
+        with pytest.raises(StopAsyncIteration):
+            await fan_out.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_send_many_async_ng_overall_timeout_cancels_requests(
+        self, business_host
+    ):
+        queue = FakeReturnQueue()
+        business_host.iris_handle = queue
+        pairs = [('test', SimpleMessage(integer=i, string='test')) for i in range(3)]
+
+        with pytest.raises(TimeoutError):
+            async for _ in business_host.send_many_async_ng(pairs, overall_timeout=0.05):
+                pass
+
+        await asyncio.sleep(0)
+        assert len(queue.sent) == 3
+        business_host._iop_response_demux.poll()
+        assert business_host._iop_response_demux.pending == {}
+
+    @pytest.mark.asyncio
+    async def test_send_many_async_ng_cancels_requests_on_early_exit(
+        self, business_host
+    ):
+        queue = FakeReturnQueue()
+        business_host.iris_handle = queue
+        pairs = [('test', SimpleMessage(integer=i, string='test')) for i in range(10)]
+        fan_out = business_host.send_many_async_ng(pairs, max_in_flight=3)
+
+        first = asyncio.ensure_future(fan_out.__anext__())
+        await _until_sent(queue, 3)
+        queue.reply(2, 'test')
+        assert (await asyncio.wait_for(first, timeout=1))[0] == 1
+        await fan_out.aclose()
+        await asyncio.sleep(0)
+
+        assert len(queue.sent) == 3
+        business_host._iop_response_demux.poll()
+        assert business_host._iop_response_demux.pending == {}
+
+    @pytest.mark.asyncio
+    async def test_send_many_async_ng_validates_arguments(self, business_host):
+        business_host.iris_handle = FakeReturnQueue()
+
+        with pytest.raises(ValueError, match='max_in_flight'):
+            await business_host.send_many_async_ng([], max_in_flight=0).__anext__()
+        with pytest.raises(TypeError, match='tuples'):
+            await business_host.send_many_async_ng(['test']).__anext__()
+
+
+class AsyncHost(_BusinessHost):
+    async def on_message(self, request):
+        if self.__dict__.get("client") is None:
+            self.client = asyncio.get_running_loop()
+        return self.client is asyncio.get_running_loop()
+
+    def on_tear_down(self):
+        self.client = None
+
+
+class TestBusinessHostEventLoop:
+    def test_async_handlers_share_one_event_loop(self):
+        host = AsyncHost()
+
+        assert dispatch_message(host, "first") is True
+        assert dispatch_message(host, "second") is True
+        assert host.run_async(asyncio.sleep(0, "done")) == "done"
+        assert host._event_loop is host.client
+
+    def test_tear_down_closes_event_loop_and_cancels_tasks(self):
+        host = AsyncHost()
+        dispatch_message(host, "first")
+        loop = host._event_loop
+
+        async def start_background_task():
+            return asyncio.ensure_future(asyncio.sleep(60))
+
+        task = host.run_async(start_background_task())
+        host._dispatch_on_tear_down(MagicMock())
+
+        assert task.cancelled()
+        assert loop.is_closed()
+        assert host._event_loop is None
+
+    def test_run_async_reopens_loop_after_tear_down(self):
+        host = AsyncHost()
+        dispatch_message(host, "first")
+        host._dispatch_on_tear_down(MagicMock())
+
+        assert dispatch_message(host, "again") is True
+        assert not host._event_loop.is_closed()
 
 
 class TestGeneratorRequest:
@@ -150,3 +374,49 @@ class TestBusinessService:
             "Python.Target",
             "Python.GeneratorTarget",
         }
+
+    def test_connection_discovery_parses_each_class_once(self, monkeypatch):
+        parsed = []
+        monkeypatch.setattr(
+            business_host_module,
+            "getsource",
+            lambda klass: parsed.append(klass) or getsource(klass),
+        )
+
+        class Service(_BusinessHost):
+            target = "Python.Default"
+
+            def on_message(self, request):
+                self.send_request_sync("Python.Audit", request)
+                return self.send_request_sync(self.target, request)
+
+        other = Service()
+        other.target = "Python.Other"
+
+        assert Service().on_get_connections() == ["Python.Audit", "Python.Default"]
+        assert other.on_get_connections() == ["Python.Audit", "Python.Other"]
+        assert parsed == [Service]
+
+    def test_connection_discovery_rereads_changed_source(self, tmp_path, monkeypatch):
+        module_file = tmp_path / "connection_service.py"
+        source = (
+            "from iop.components.business_host import _BusinessHost\n"
+            "class Service(_BusinessHost):\n"
+            "    def on_message(self, request):\n"
+            "        return self.send_request_sync('Python.Before', request)\n"
+        )
+        module_file.write_text(source)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        module = importlib.import_module("connection_service")
+        try:
+            assert module.Service().on_get_connections() == ["Python.Before"]
+
+            module_file.write_text(source.replace("Before", "After"))
+            stat = module_file.stat()
+            os.utime(
+                module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000)
+            )
+
+            assert module.Service().on_get_connections() == ["Python.After"]
+        finally:
+            sys.modules.pop("connection_service", None)
@@ -1,9 +1,12 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 from fixtures.message import SimpleMessage
 
 from iop.components.business_process import _BusinessProcess
+from iop.messages.lazy import lazy_message_info, reset_lazy_message_info
+from iop.messages.serialization import serialize_message
 
 
 @pytest.fixture
@@ -93,24 +96,163 @@ def test_send_request_async_response_required_boolean_conversion(process):
     assert args[3] == completion_key, "Completion key should be passed correctly"
     assert args[4] == description, "Description should be passed correctly"
 
+class FakeProcessHost:
+    """IRIS side of IOP.BusinessProcess persistentProperties."""
+
+    def __init__(self, stored=None, host_id=""):
+        self.stored = dict(stored or {})
+        self.writes = []
+        self.host_id = host_id
+
+    def _Id(self):
+        return self.host_id
+
+    def getPersistentProperties(self, values):
+        values.update(self.stored)
+        return 1
+
+    def setPersistentProperties(self, values):
+        self.writes.append(list(values))
+        self.stored.update(zip(values[::2], values[1::2]))
+        return 1
+
+
+class ProcessWithProperties(_BusinessProcess):
+    PERSISTENT_PROPERTY_LIST = ["test_prop", "counts", "missing"]
+    test_prop = "test_value"
+    counts = None
+    missing = "default"
+
+
 def test_persistent_properties():
     # Test persistent property handling
-    class ProcessWithProperties(_BusinessProcess):
-        PERSISTENT_PROPERTY_LIST = ["test_prop"]
-        test_prop = "test_value"
-
     process = ProcessWithProperties()
-    mock_host = MagicMock()
-    
+    host = FakeProcessHost()
+
     # Test save properties
-    process._save_persistent_properties(mock_host)
-    mock_host.setPersistentProperty.assert_called_once_with("test_prop", "test_value")
-    
+    process._save_persistent_properties(host)
+    assert len(host.writes) == 1
+    assert host.stored["test_prop"] == "test_value"
+
     # Test restore properties
-    mock_host.getPersistentProperty.return_value = "restored_value"
-    process._restore_persistent_properties(mock_host)
+    host.stored["test_prop"] = "restored_value"
+    process._restore_persistent_properties(host)
     assert process.test_prop == "restored_value"
 
+
+def test_persistent_properties_only_write_changes():
+    process = ProcessWithProperties()
+    host = FakeProcessHost({"test_prop": "restored"})
+
+    process._restore_persistent_properties(host)
+    process._save_persistent_properties(host)
+    # Only the properties never stored before are written.
+    assert host.writes == [["counts", host.stored["counts"], "missing", "default"]]
+
+    process._restore_persistent_properties(host)
+    process._save_persistent_properties(host)
+    assert len(host.writes) == 1
+
+    process.test_prop = "changed"
+    process._save_persistent_properties(host)
+    assert host.writes[-1] == ["test_prop", "changed"]
+
+
+def test_persistent_properties_snapshot_survives_new_host_wrappers():
+    process = ProcessWithProperties()
+    first = FakeProcessHost({"test_prop": "restored"}, host_id="1")
+    process._restore_persistent_properties(first)
+    process._save_persistent_properties(first)
+
+    # IRIS may hand each callback a different wrapper for the same host.
+    second = FakeProcessHost(first.stored, host_id="1")
+    process._save_persistent_properties(second)
+
+    assert second.writes == []
+
+
+class NumericProcess(_BusinessProcess):
+    PERSISTENT_PROPERTY_LIST = ["enabled", "ratio", "total"]
+    enabled = True
+    ratio = 0.5
+    total = 2.0
+
+
+def test_persistent_properties_ignore_iris_numeric_round_trips():
+    process = NumericProcess()
+    host = FakeProcessHost()
+    process._save_persistent_properties(host)
+
+    # IRIS returns booleans and whole floats as integers.
+    host.stored.update(enabled=1, total=2)
+    process._restore_persistent_properties(host)
+    process.enabled = True
+    process.total = 2.0
+    process._save_persistent_properties(host)
+
+    assert len(host.writes) == 1
+
+
+def test_persistent_properties_keep_defaults_when_not_stored():
+    process = ProcessWithProperties()
+
+    process._restore_persistent_properties(FakeProcessHost({"test_prop": "stored"}))
+
+    assert process.test_prop == "stored"
+    assert process.missing == "default"
+
+
+def test_persistent_properties_store_container_values():
+    process = ProcessWithProperties()
+    host = FakeProcessHost()
+    process.counts = {"ok": 2, "failed": [1, None]}
+    process._save_persistent_properties(host)
+    assert isinstance(host.stored["counts"], str)
+
+    process.counts["ok"] = 3
+    process._save_persistent_properties(host)
+    assert host.writes[-1][0] == "counts"
+
+    restored = ProcessWithProperties()
+    restored._restore_persistent_properties(host)
+    assert restored.counts == {"ok": 3, "failed": [1, None]}
+
+
+def test_persistent_properties_distinguish_equal_scalars():
+    process = ProcessWithProperties()
+    host = FakeProcessHost()
+    process.test_prop = 1
+    process._save_persistent_properties(host)
+
+    process.test_prop = "1"
+    process._save_persistent_properties(host)
+
+    assert host.writes[-1] == ["test_prop", "1"]
+
+
+def test_persistent_properties_warn_once_for_unsupported_values():
+    process = ProcessWithProperties()
+    process.log_warning = MagicMock()
+    host = FakeProcessHost()
+    process.test_prop = object()
+
+    process._save_persistent_properties(host)
+    process._save_persistent_properties(host)
+
+    process.log_warning.assert_called_once()
+    assert "test_prop" not in host.stored
+
+
+def test_persistent_properties_track_changes_per_host():
+    process = ProcessWithProperties()
+    first, second = FakeProcessHost(), FakeProcessHost()
+
+    process._save_persistent_properties(first)
+    process._save_persistent_properties(second)
+
+    assert second.stored == first.stored
+
+
 def test_dispatch_methods(process):
     mock_host = MagicMock()
     mock_host.port=0
@@ -129,6 +271,18 @@ def test_dispatch_methods(process):
     process._dispatch_on_tear_down(mock_host)
 
 
+def test_tear_down_closes_event_loop_even_when_on_tear_down_fails(process):
+    process.run_async(asyncio.sleep(0))
+    loop = process._event_loop
+    process.on_tear_down = MagicMock(side_effect=RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        process._dispatch_on_tear_down(MagicMock())
+
+    assert loop.is_closed()
+    assert process._event_loop is None
+
+
 def test_default_dispatch_does_not_register_framework_methods(process):
     logs = []
     mock_host = MagicMock()
@@ -145,3 +299,20 @@ def test_reply(process):
     response = SimpleMessage(integer=1, string='test')
     process.reply(response)
     process.iris_handle.dispatchReply.assert_called_once()
+
+
+def test_lazy_messages_are_forwarded_without_reencoding():
+    class Router(_BusinessProcess):
+        LAZY_MESSAGES = True
+
+        def on_message(self, request):
+            return request
+
+    reset_lazy_message_info()
+    serial = serialize_message(SimpleMessage(integer=1, string="test"))
+    router = Router()
+    router.iris_handle = MagicMock()
+
+    assert router._dispatch_on_request(MagicMock(), serial) is serial
+    assert lazy_message_info() == (0, 1)
+    assert "LAZY_MESSAGES" not in [prop[0] for prop in Router._get_properties()]
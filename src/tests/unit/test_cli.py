@@ -629,7 +629,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         resp.raise_for_status = MagicMock()
         return resp
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_status_uses_remote_director(self, mock_get):
         mock_get.return_value = self._mock_resp(
             {"production": "MyProd", "status": "running"}
@@ -641,7 +641,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         self.assertIn("running", out.getvalue())
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_queue_uses_remote_director(self, mock_get):
         mock_get.return_value = self._mock_resp(
             {"production": "MyProd", "items": [{"item": "FileInput", "count": 2}]}
@@ -656,7 +656,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         self.assertIn("/queues", args[0])
         self.assertEqual(kwargs["params"]["production"], "MyProd")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_uses_remote_director(self, mock_get):
         data = {"MyApp.Production": {"Status": "Stopped"}}
         mock_get.return_value = self._mock_resp(data)
@@ -666,11 +666,11 @@ class TestCLIRemoteMode(unittest.TestCase):
                     main(["-l"])
         self.assertIn("MyApp.Production", out.getvalue())
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_stop_uses_remote_director(self, mock_post):
         mock_post.return_value = self._mock_resp({"status": "stopped"})
         # get_default_production needs a GET mock too
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = self._mock_resp({"production": "MyApp.Production"})
             with patch.dict(os.environ, self._BASE_ENV, clear=True):
                 with patch("sys.stdout", new=StringIO()):
@@ -680,7 +680,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         args, _ = mock_post.call_args
         self.assertIn("/stop", args[0])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_restart_uses_remote_director(self, mock_post):
         mock_post.return_value = self._mock_resp({"status": "restarted"})
         with patch.dict(os.environ, self._BASE_ENV, clear=True):
@@ -690,7 +690,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         args, _ = mock_post.call_args
         self.assertIn("/restart", args[0])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_kill_uses_remote_director(self, mock_post):
         mock_post.return_value = self._mock_resp({"status": "killed"})
         with patch.dict(os.environ, self._BASE_ENV, clear=True):
@@ -699,7 +699,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         args, _ = mock_post.call_args
         self.assertIn("/kill", args[0])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_update_uses_remote_director(self, mock_post):
         mock_post.return_value = self._mock_resp({"status": "updated"})
         with patch.dict(os.environ, self._BASE_ENV, clear=True):
@@ -708,7 +708,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         args, _ = mock_post.call_args
         self.assertIn("/update", args[0])
 
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_unbind_uses_remote_director(self, mock_delete):
         mock_delete.return_value = self._mock_resp({"status": "unbound"})
         with patch.dict(os.environ, self._BASE_ENV, clear=True):
@@ -721,7 +721,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         self.assertIn("/binding", args[0])
         self.assertEqual(kwargs["params"]["class"], "Python.WrongOperation")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_bindings_uses_remote_director(self, mock_get):
         mock_get.return_value = self._mock_resp(
             [{"class": "Python.WrongOperation", "used": False, "used_by": []}]
@@ -736,7 +736,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         self.assertIn("/bindings", args[0])
         self.assertEqual(kwargs["params"]["unused"], 1)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_test_uses_remote_director(self, mock_post):
         mock_post.return_value = self._mock_resp(
             {"classname": "Python.MyMsg", "body": '{"answer": 42}'}
@@ -751,7 +751,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         self.assertIn("/test", args[0])
         self.assertEqual(kwargs["json"]["target"], "Python.MyOp")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_namespace_flag_overrides_env(self, mock_get):
         mock_get.return_value = self._mock_resp(
             {"production": "P", "status": "running"}
@@ -783,7 +783,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         mock_director.status_production.return_value = {"status": "stopped"}
         env = {**self._BASE_ENV}
         with patch.dict(os.environ, env, clear=True):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.get") as mock_get:
                 with patch("sys.stdout", new=StringIO()):
                     with self.assertRaises(SystemExit):
                         main(["-x", "--force-local"])
@@ -804,7 +804,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         try:
             env = {**self._BASE_ENV}
             with patch.dict(os.environ, env, clear=True):
-                with patch("requests.put") as mock_put:
+                with patch("requests.Session.put") as mock_put:
                     with patch(
                         "iop.runtime.local._LocalDirector.migrate"
                     ) as mock_migrate:
@@ -819,7 +819,7 @@ class TestCLIRemoteMode(unittest.TestCase):
     # -m settings.py with REMOTE_SETTINGS auto-enables remote mode
     # ------------------------------------------------------------------
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_migrate_settings_file_remote_settings_enables_remote(self, mock_post):
         """When the settings file has REMOTE_SETTINGS, remote director is used."""
         mock_post.return_value = self._mock_resp({"status": "ok"})
@@ -852,7 +852,7 @@ class TestCLIRemoteMode(unittest.TestCase):
     # --remote-settings / -R flag
     # ------------------------------------------------------------------
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_remote_settings_flag_activates_remote_mode(self, mock_get):
         """--remote-settings/-R enables remote mode without any env var."""
         mock_get.return_value = self._mock_resp(
@@ -877,7 +877,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         finally:
             os.unlink(path)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_remote_settings_short_flag(self, mock_get):
         """Short -R flag works identically to --remote-settings."""
         mock_get.return_value = self._mock_resp(
@@ -896,7 +896,7 @@ class TestCLIRemoteMode(unittest.TestCase):
         finally:
             os.unlink(path)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_remote_settings_flag_overrides_iop_settings_env(self, mock_get):
         """--remote-settings takes priority over IOP_SETTINGS env var."""
         mock_get.return_value = self._mock_resp(
@@ -928,7 +928,7 @@ class TestCLIRemoteMode(unittest.TestCase):
             path = f.name
         try:
             with patch.dict(os.environ, {}, clear=True):
-                with patch("requests.get") as mock_get:
+                with patch("requests.Session.get") as mock_get:
                     with patch(
                         "iop.runtime.local._LocalDirector.status_production",
                         return_value={"status": "stopped"},
@@ -0,0 +1,155 @@
+"""Unit tests for binary message codecs — no live IRIS instance required."""
+
+import datetime
+import decimal
+import uuid
+from dataclasses import dataclass
+
+import pytest
+
+from iop import Message, PydanticMessage
+from iop.messages import codecs
+from iop.messages.codecs import CodecError, MessageCodec, get_codec, register_codec
+from iop.messages.dispatch import dispatch_deserializer, dispatch_serializer
+from iop.messages.serialization import SerializationError
+
+
+@dataclass
+class BinaryMessage(Message):
+    CODEC = "msgpack"
+
+    text: str = ""
+    number: int = 0
+    data: bytes = b""
+    when: datetime.date = None
+    amount: decimal.Decimal = None
+    items: list = None
+
+
+class BinaryPydanticMessage(PydanticMessage):
+    CODEC = "msgpack"
+
+    text: str = ""
+    uid: uuid.UUID = None
+    values: list[float] = []
+
+
+@pytest.fixture(params=["builtin", "msgpack"])
+def packer(request, monkeypatch):
+    if request.param == "builtin":
+        monkeypatch.setattr(codecs, "_msgpack", None)
+    elif codecs._msgpack is None:
+        pytest.skip("msgpack is not installed")
+    return request.param
+
+
+def test_dataclass_message_round_trip(packer):
+    msg = BinaryMessage(
+        text="héllo",
+        number=-70000,
+        data=b"\x00\xff" * 300,
+        when=datetime.date(2024, 2, 29),
+        amount=decimal.Decimal("3.14"),
+        items=[1, 2.5, None, True, {"nested": ["x"] * 20}],
+    )
+    msg.extra = "kept"
+
+    serial = dispatch_serializer(msg)
+
+    assert serial._IsA("IOP.BinaryMessage")
+    assert serial.codec == "msgpack"
+    result = dispatch_deserializer(serial)
+    assert result == msg
+    assert result.extra == "kept"
+
+
+def test_pydantic_message_round_trip(packer):
+    msg = BinaryPydanticMessage(text="x" * 70000, uid=uuid.uuid4(), values=[1.5])
+
+    result = dispatch_deserializer(dispatch_serializer(msg))
+
+    assert result == msg
+
+
+def test_builtin_packer_matches_msgpack_wire_format(monkeypatch):
+    msgpack = pytest.importorskip("msgpack")
+    data = {"a": [1, -1, 2**40, -(2**40), 1.5, "s" * 40, b"b" * 300, None, False]}
+    monkeypatch.setattr(codecs, "_msgpack", None)
+
+    packed = get_codec("msgpack").pack(data)
+
+    assert msgpack.unpackb(packed, raw=False) == data
+
+
+@pytest.mark.parametrize("value", [2**64, -(2**63) - 1])
+def test_integers_outside_msgpack_range_are_rejected(packer, value):
+    with pytest.raises(OverflowError):
+        get_codec("msgpack").pack({"n": value})
+
+
+def test_decode_rejects_truncated_payload(monkeypatch):
+    monkeypatch.setattr(codecs, "_msgpack", None)
+    codec = get_codec("msgpack")
+    payload = codec.encode(BinaryMessage(text="abc"))
+
+    with pytest.raises(CodecError):
+        codec.decode(BinaryMessage, payload[:-1])
+
+
+def test_binary_message_with_unknown_codec_fails():
+    serial = dispatch_serializer(BinaryMessage(text="abc"))
+    serial.codec = "missing"
+
+    with pytest.raises(CodecError, match="Unknown message codec 'missing'"):
+        dispatch_deserializer(serial)
+
+
+def test_reserved_codec_names_cannot_be_registered():
+    class JsonCodec(MessageCodec):
+        name = "json"
+
+        def pack(self, data):
+            return b""
+
+        def unpack(self, payload):
+            return None
+
+    with pytest.raises(ValueError):
+        register_codec(JsonCodec())
+
+
+def test_incomplete_codec_cannot_be_registered():
+    class PackOnlyCodec(MessageCodec):
+        name = "test-pack-only"
+
+        def pack(self, data):
+            return b""
+
+    with pytest.raises(TypeError):
+        register_codec(PackOnlyCodec())
+
+
+def test_custom_codec_can_be_registered():
+    class ReprCodec(MessageCodec):
+        name = "test-repr"
+
+        def pack(self, data):
+            return repr(data).encode()
+
+        def unpack(self, payload):
+            import ast
+
+            return ast.literal_eval(payload.decode())
+
+    @dataclass
+    class ReprMessage(Message):
+        CODEC = "test-repr"
+        text: str = ""
+
+    register_codec(ReprCodec())
+    serial = dispatch_serializer(ReprMessage(text="abc"))
+
+    assert serial.codec == "test-repr"
+    with pytest.raises(SerializationError):
+        # Local classes cannot be imported back from their classname.
+        dispatch_deserializer(serial)
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import decimal
 import uuid
@@ -9,12 +10,21 @@ import pytest
 from iop.messages.base import _Message as Message
 from iop.messages.base import _PydanticMessage as PydanticMessage
 from iop.messages.dispatch import (
+    clear_dispatch_cache,
     create_dispatch,
+    dispatch_cache_info,
     dispatch_deserializer,
     dispatch_message,
     dispatch_serializer,
     handler,
 )
+from iop.messages.lazy import (
+    LazyMessage,
+    is_loaded,
+    lazy_message_info,
+    materialize,
+    reset_lazy_message_info,
+)
 from iop.messages.serialization import (
     dataclass_from_dict,
     deserialize_message,
@@ -22,6 +32,7 @@ from iop.messages.serialization import (
     serialize_message,
     serialize_pickle_message,
 )
+from iop.runtime.class_version import class_version
 
 
 class SimpleModel(PydanticMessage):
@@ -462,3 +473,287 @@ def test_handler_is_exported_from_iop():
     from iop import handler as exported_handler
 
     assert exported_handler is handler
+
+
+def test_dispatch_table_is_cached_per_class():
+    class Host:
+        def on_message(self, request):
+            return "fallback"
+
+        def handle_message(self, request: MessageTest):
+            return "handled"
+
+    before = dispatch_cache_info()
+    first = Host()
+    second = Host()
+    create_dispatch(first)
+    create_dispatch(second)
+    after = dispatch_cache_info()
+
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + 1
+    assert first.DISPATCH == second.DISPATCH
+    assert first.DISPATCH is not second.DISPATCH
+    assert dispatch_message(second, MessageTest(text="test", number=1)) == "handled"
+
+
+def test_dispatch_cache_invalidated_when_class_changes():
+    class Host:
+        def on_message(self, request):
+            return "fallback"
+
+    create_dispatch(Host())
+
+    def handle_message(self, request: MessageTest):
+        return "handled"
+
+    Host.handle_message = handle_message
+    host = Host()
+    create_dispatch(host)
+
+    assert host.DISPATCH == [
+        (f"{MessageTest.__module__}.{MessageTest.__name__}", "handle_message")
+    ]
+
+
+def test_class_version_tracks_base_changes_without_keeping_classes_alive():
+    import gc
+    import weakref
+
+    class Base:
+        def handle(self):
+            pass
+
+    class Host(Base):
+        pass
+
+    version = class_version(Host)
+    assert class_version(Host) == version
+
+    Base.handle = lambda self: None
+    assert class_version(Host) != version
+
+    ref = weakref.ref(Host)
+    del Host
+    gc.collect()
+    assert ref() is None
+
+
+def test_dispatch_cache_replays_duplicate_warnings():
+    logs = []
+
+    class Host:
+        def on_message(self, request):
+            return "fallback"
+
+        def first(self, request: MessageTest):
+            return "first"
+
+        def second(self, request: MessageTest):
+            return "second"
+
+        def log_warning(self, message):
+            logs.append(message)
+
+    create_dispatch(Host())
+    create_dispatch(Host())
+
+    assert len(logs) == 2
+    assert logs[0] == logs[1]
+
+
+def test_clear_dispatch_cache_forces_rebuild():
+    class Host:
+        def on_message(self, request):
+            return "fallback"
+
+    create_dispatch(Host())
+    clear_dispatch_cache(Host)
+    before = dispatch_cache_info()
+    create_dispatch(Host())
+
+    assert dispatch_cache_info().misses == before.misses + 1
+
+
+@dataclass
+class DerivedMessageTest(MessageTest):
+    pass
+
+
+def test_dispatch_message_falls_back_to_registered_base_message():
+    class Host:
+        def on_message(self, request):
+            return "fallback"
+
+        def handle_message(self, request: MessageTest):
+            return "base"
+
+    host = Host()
+    create_dispatch(host)
+
+    assert dispatch_message(host, DerivedMessageTest(text="test", number=1)) == "base"
+
+
+def test_dispatch_message_prefers_exact_message_over_base():
+    class Host:
+        def on_message(self, request):
+            return "fallback"
+
+        def handle_base(self, request: MessageTest):
+            return "base"
+
+        def handle_derived(self, request: DerivedMessageTest):
+            return "derived"
+
+    host = Host()
+    create_dispatch(host)
+
+    assert (
+        dispatch_message(host, DerivedMessageTest(text="test", number=1))
+        == "derived"
+    )
+    assert dispatch_message(host, MessageTest(text="test", number=1)) == "base"
+
+
+def test_dispatch_message_rebuilds_index_when_dispatch_is_replaced():
+    message = f"{MessageTest.__module__}.{MessageTest.__name__}"
+
+    class Host:
+        DISPATCH = [(message, "first")]
+
+        def on_message(self, request):
+            return "fallback"
+
+        def first(self, request):
+            return "first"
+
+        def second(self, request):
+            return "second"
+
+    host = Host()
+    assert dispatch_message(host, MessageTest(text="test", number=1)) == "first"
+
+    host.DISPATCH = [(message, "second")]
+    assert dispatch_message(host, MessageTest(text="test", number=1)) == "second"
+
+
+def test_dispatch_message_keeps_first_native_iris_match():
+    class NativeStringRequest:
+        __module__ = "iris"
+
+    request = NativeStringRequest()
+    setattr(request, "%ClassName", lambda full=1: "Ens.StringRequest")
+
+    class Host:
+        DISPATCH = [
+            ("iris.Ens.StringRequest", "prefixed"),
+            ("Ens.StringRequest", "plain"),
+        ]
+
+        def on_message(self, request):
+            return "fallback"
+
+        def prefixed(self, request):
+            return "prefixed"
+
+        def plain(self, request):
+            return "plain"
+
+    assert dispatch_message(Host(), request) == "prefixed"
+
+
+def test_dispatch_message_runs_async_handlers():
+    class Host:
+        async def on_message(self, request):
+            await asyncio.sleep(0)
+            return "fallback"
+
+        async def handle_message(self, request: MessageTest):
+            await asyncio.sleep(0)
+            return "typed"
+
+    host = Host()
+    create_dispatch(host)
+
+    assert dispatch_message(host, MessageTest(text="test", number=1)) == "typed"
+    assert dispatch_message(host, "other") == "fallback"
+
+
+def test_dispatch_message_routes_lazy_messages_without_decoding():
+    class Host:
+        def on_message(self, request):
+            return "fallback"
+
+        def handle_base(self, request: MessageTest):
+            return "base"
+
+    def loader():
+        raise AssertionError("body decoded during routing")
+
+    request = LazyMessage(DerivedMessageTest, loader)
+    host = Host()
+    create_dispatch(host)
+
+    assert dispatch_message(host, request) == "base"
+    assert not is_loaded(request)
+
+
+@pytest.mark.parametrize(
+    "serialize",
+    [serialize_message, serialize_pickle_message],
+)
+def test_lazy_dispatch_passes_undecoded_messages_through(serialize):
+    reset_lazy_message_info()
+    serial = serialize(MessageTest(text="test", number=1))
+
+    request = dispatch_deserializer(serial, lazy=True)
+
+    assert type(request) is LazyMessage
+    assert isinstance(request, MessageTest)
+    assert dispatch_serializer(request) is serial
+    assert lazy_message_info() == (0, 1)
+
+
+def test_lazy_dispatch_reencodes_decoded_messages():
+    reset_lazy_message_info()
+    serial = serialize_message(MessageTest(text="test", number=1))
+    request = dispatch_deserializer(serial, lazy=True)
+
+    request.number = 2
+    forwarded = dispatch_serializer(request)
+
+    assert forwarded is not serial
+    assert deserialize_message(forwarded).number == 2
+    assert lazy_message_info() == (1, 0)
+
+
+def test_lazy_dispatch_passes_read_but_unchanged_messages_through():
+    reset_lazy_message_info()
+    serial = serialize_message(MessageTest(text="test", number=1))
+    request = dispatch_deserializer(serial, lazy=True)
+
+    assert request.number == 1
+
+    assert dispatch_serializer(request) is serial
+    assert lazy_message_info() == (1, 1)
+
+
+def test_lazy_dispatch_reencodes_messages_changed_in_place():
+    serial = serialize_message(MessageTest(text="test", number=1))
+    request = dispatch_deserializer(serial, lazy=True)
+
+    materialize(request).number = 2
+    forwarded = dispatch_serializer(request)
+
+    assert forwarded is not serial
+    assert deserialize_message(forwarded).number == 2
+
+
+def test_lazy_dispatch_reencodes_generator_requests():
+    serial = serialize_message(MessageTest(text="test", number=1))
+    request = dispatch_deserializer(serial, lazy=True)
+
+    started = dispatch_serializer(request, is_generator=True)
+
+    assert started._iris_classname == "IOP.Generator.Message.Start"
+    assert is_loaded(request)
@@ -0,0 +1,282 @@
+"""DTL property path access — no live IRIS instance required.
+
+The benchmark compares DTLDocument with the previous IOP.Message behaviour,
+which parsed the body, converted and compiled the path for every
+GetValueAt/SetValueAt and serialized the body after every assignment. It is
+skipped by default; run it with ``-m benchmark`` and ``-s`` to see the numbers:
+
+    pytest src/tests/unit/test_dtl.py -m benchmark -s
+"""
+
+import json
+import time
+
+import pytest
+from jsonpath_ng import parse
+
+from iop.messages import dtl
+from iop.messages.dtl import DTLDocument, convert_path
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("post.Title", "post.Title"),
+        ("list_str()", "list_str[*]"),
+        ("list_post(2).Title", "list_post[1].Title"),
+        ("list(2)(1)", "list[1][0]"),
+        ("items(*)", "items[*]"),
+    ],
+)
+def test_convert_path_matches_objectscript(path, expected):
+    assert convert_path(path) == expected
+
+
+@pytest.mark.parametrize(
+    "body,path,expected",
+    [
+        ('{"string":"Foo", "integer":42}', "string", "Foo"),
+        ('{"post":{"Title":"Foo"}, "list_post":[{"Title":"Bar"},{"Title":"Foo"}]}', "list_post(2).Title", "Foo"),
+        ('{"list_str":["Foo","Bar"]}', "list_str()", ["Foo", "Bar"]),
+        ('{"list_str":["Foo","Bar"]}', "list_str", ["Foo", "Bar"]),
+        ('{"list":["Foo",["Bar","Baz"]]}', "list(2)(2)", "Baz"),
+        ('{"string":"Foo"}', "missing", ""),
+    ],
+)
+def test_get_value(body, path, expected):
+    assert DTLDocument(body).get_value(path) == expected
+
+
+@pytest.mark.parametrize(
+    "body,path,value,action,key,expected",
+    [
+        ('{"string":"Foo", "integer":42}', "string", "Bar", "set", "", {"string": "Bar", "integer": 42}),
+        ("", "post.Title", "Bar", "set", "", {"post": {"Title": "Bar"}}),
+        ("{}", "post()", "Bar", "append", "", {"post": ["Bar"]}),
+        ('{"post":["Foo"]}', "post()", "Bar", "append", "", {"post": ["Foo", "Bar"]}),
+        ("{}", "meta", "1", "insert", "a", {"meta": {"a": "1"}}),
+        ('{"meta":{"a":"1"}}', "meta", "2", "insert", "b", {"meta": {"a": "1", "b": "2"}}),
+    ],
+)
+def test_set_value(body, path, value, action, key, expected):
+    doc = DTLDocument(body)
+
+    doc.set_value(value, path, action, key)
+
+    assert doc.dirty
+    assert json.loads(doc.dumps()) == expected
+    assert not doc.dirty
+
+
+def test_document_is_parsed_once_and_written_on_dumps(monkeypatch):
+    loads = []
+    real_loads = json.loads
+    monkeypatch.setattr(dtl.json, "loads", lambda text: loads.append(text) or real_loads(text))
+    doc = DTLDocument('{"a": 1}')
+
+    for index in range(10):
+        doc.set_value(index, f"items({index + 1})")
+        doc.get_value("a")
+
+    assert len(loads) == 1
+    assert json.loads(doc.dumps())["items"] == list(range(10))
+
+
+def test_values_copied_between_documents_are_not_shared():
+    source = DTLDocument('{"post": {"Title": "Foo"}}')
+    target = DTLDocument("{}")
+
+    target.set_value(source.get_value("post"), "copy")
+    target.set_value("Bar", "copy.Title")
+
+    assert source.get_value("post.Title") == "Foo"
+
+
+def test_get_value_returns_copies_of_containers():
+    doc = DTLDocument('{"post": {"tags": ["a"]}, "items": [{"id": 1}, {"id": 2}]}')
+
+    doc.get_value("post")["tags"].append("b")
+    doc.get_value("items()")[0]["id"] = 3
+
+    assert doc.get_value("post.tags") == ["a"]
+    assert doc.get_value("items(1).id") == 1
+    assert not doc.dirty
+
+
+@pytest.mark.parametrize(
+    "path,key,expected",
+    [
+        ("a", "", {"b": [{"c": 1}, {"c": 2}]}),
+        ("b(1).c", "", {"a": 1, "b": [{}, {"c": 2}]}),
+        ("b(2)", "", {"a": 1, "b": [{"c": 1}]}),
+        ("b().c", "", {"a": 1, "b": [{}, {}]}),
+        ("b(1)", "c", {"a": 1, "b": [{}, {"c": 2}]}),
+        ("b", "1", {"a": 1, "b": [{"c": 2}]}),
+    ],
+)
+def test_remove(path, key, expected):
+    doc = DTLDocument('{"a": 1, "b": [{"c": 1}, {"c": 2}]}')
+
+    doc.set_value("", path, "remove", key)
+
+    assert doc.dirty
+    assert json.loads(doc.dumps()) == expected
+
+
+def test_remove_of_missing_value_leaves_document_clean():
+    doc = DTLDocument('{"a": {"b": 1}}')
+
+    doc.set_value("", "x.y", "remove")
+    doc.set_value("", "a", "remove", "missing")
+
+    assert not doc.dirty
+    assert doc.dumps() == '{"a": {"b": 1}}'
+
+
+def test_compiled_paths_are_cached():
+    dtl.clear_path_cache()
+    doc = DTLDocument('{"a": {"b": 1}}')
+
+    for _ in range(5):
+        doc.get_value("a.b")
+
+    info = dtl.path_cache_info()
+    assert (info.misses, info.hits) == (1, 4)
+
+
+def test_apply_transform_runs_operations_in_one_call():
+    source = DTLDocument(
+        '{"post": {"Title": "Foo"}, "list_str": ["a", "b"], "name": "x"}'
+    )
+    target = DTLDocument("")
+    operations = json.dumps(
+        [
+            ["set", "post", "post", None],
+            ["set", "list_str(2)", "last", None],
+            ["append", "name", "names()", None],
+            ["append", "", "names()", "literal"],
+            ["insert", "post.Title", "meta", None, "title"],
+        ]
+    )
+
+    dtl.apply_transform(target, source, operations, "Demo.Transform")
+
+    assert json.loads(target.dumps()) == {
+        "post": {"Title": "Foo"},
+        "last": "b",
+        "names": ["x", "literal"],
+        "meta": {"title": "Foo"},
+    }
+
+
+def test_compiled_transform_is_cached_by_name_until_operations_change():
+    dtl.clear_transform_cache()
+    operations = json.dumps([["set", "", "a", 1]])
+
+    first = dtl.compile_transform(operations, "Demo.Transform")
+    assert dtl.compile_transform(operations, "Demo.Transform") is first
+    assert dtl.compile_transform(operations, "Other.Transform") is not first
+
+    changed = dtl.compile_transform(json.dumps([["set", "", "a", 2]]), "Demo.Transform")
+    assert changed is not first
+    assert json.loads(changed(DTLDocument("{}")).dumps()) == {"a": 2}
+
+
+def test_transform_cache_is_bounded(monkeypatch):
+    dtl.clear_transform_cache()
+    monkeypatch.setattr(dtl, "_TRANSFORM_CACHE_SIZE", 2)
+    operations = json.dumps([["set", "", "a", 1]])
+
+    first = dtl.compile_transform(operations, "First")
+    dtl.compile_transform(operations, "Second")
+    dtl.compile_transform(operations, "First")
+    dtl.compile_transform(operations, "Third")
+
+    assert list(dtl._TRANSFORMS) == ["First", "Third"]
+    assert dtl.compile_transform(operations, "First") is first
+    dtl.clear_transform_cache()
+
+
+@pytest.mark.parametrize(
+    "operation,message",
+    [
+        (["copy", "", "a", 1], "invalid action"),
+        (["set", "", "", 1], "target path cannot be empty"),
+        (["insert", "", "a", 1], "key is required"),
+        (["set", "a"], "must be"),
+    ],
+)
+def test_compile_transform_rejects_invalid_operations(operation, message):
+    with pytest.raises(ValueError, match=message):
+        dtl.compile_transform([operation])
+
+
+def test_transform_removes_values():
+    transform = dtl.compile_transform(
+        [["remove", "", "a", None], ["remove", "", "b", None, "c"]]
+    )
+
+    result = transform(DTLDocument('{"a": 1, "b": {"c": 2, "d": 3}}'))
+
+    assert json.loads(result.dumps()) == {"b": {"d": 3}}
+
+
+def test_transform_without_source_leaves_target_unchanged():
+    transform = dtl.compile_transform([["set", "", "a", 1], ["set", "b", "c", None]])
+    target = DTLDocument("{}")
+
+    with pytest.raises(ValueError, match="source document"):
+        transform(target)
+
+    assert not target.dirty
+    assert target.dumps() == "{}"
+
+
+def _legacy_set(text, value, path):
+    data = json.loads(text)
+    data = parse(convert_path.__wrapped__(path)).update_or_create(data, value)
+    return json.dumps(data)
+
+
+def _legacy_get(text, path):
+    matches = parse(convert_path.__wrapped__(path)).find(json.loads(text))
+    return matches[0].value if matches else ""
+
+
+@pytest.mark.benchmark
+class TestBenchDTL:
+    def test_dtl_report(self):
+        body = json.dumps(
+            {"items": [{"id": i, "name": f"item-{i}", "tags": ["a", "b"]} for i in range(2_000)]}
+        )
+        paths = [f"target.field{i}" for i in range(100)]
+
+        start = time.perf_counter()
+        text = body
+        for path in paths:
+            value = _legacy_get(text, "items(1).name")
+            text = _legacy_set(text, value, path)
+        legacy = time.perf_counter() - start
+
+        dtl.clear_path_cache()
+        start = time.perf_counter()
+        doc = DTLDocument(body)
+        for path in paths:
+            doc.set_value(doc.get_value("items(1).name"), path)
+        cached_text = doc.dumps()
+        cached = time.perf_counter() - start
+
+        transform = dtl.compile_transform(
+            [["set", "items(1).name", path, None] for path in paths]
+        )
+        start = time.perf_counter()
+        batch_text = transform(DTLDocument(body), DTLDocument(body)).dumps()
+        batch = time.perf_counter() - start
+
+        print(
+            f"DTL ({len(paths) * 2} accesses, {len(body) // 1024}KB body): "
+            f"legacy={legacy:.3f}s cached={cached:.3f}s batch={batch:.3f}s"
+        )
+        assert json.loads(cached_text) == json.loads(text)
+        assert json.loads(batch_text) == json.loads(text)
+        assert cached < legacy
@@ -1,7 +1,13 @@
+import pickle
+from unittest.mock import Mock, patch
+
 import pytest
-from iop.components.generator_request import _GeneratorRequest
+from iop.components import generator_request
+from iop.components.business_host import _BusinessHost
+from iop.components.generator_request import _collect_batch, _GeneratorRequest
 from iop import PydanticMessage
-from unittest.mock import Mock, patch
+from iop.messages.dispatch import dispatch_deserializer
+from iop.runtime import iris as runtime_iris
 
 def test_generator_request_initialization():
     # Mock host and request
@@ -76,4 +82,139 @@ def test_generator_request_none_response():
     
     # Test iteration should stop on None response
     responses = list(generator)
-    assert len(responses) == 0
\ No newline at end of file
+    assert len(responses) == 0
+
+class _Row(PydanticMessage):
+    value: int
+
+
+def _producer(items):
+    producer = _BusinessHost()
+    producer._gen = iter(items)
+    return producer
+
+
+def _connect(producer, consumer):
+    # Route the consumer's synchronous calls to the producer like IRIS does.
+    def send_request_sync(target, request, timeout=-1, description=None):
+        if request._IsA("IOP.Generator.Message.Poll"):
+            return dispatch_deserializer(producer._dispatch_generator_poll(request))
+        return runtime_iris.get_iris().IOP.Generator.Message.Ack._New()
+
+    consumer.send_request_sync = Mock(side_effect=send_request_sync)
+
+
+def _batched_request(consumer, **kwargs):
+    return _GeneratorRequest(consumer, "test_target", _Row(value=0), **kwargs)
+
+
+def test_batched_generator_request_unpacks_batches():
+    producer = _producer(_Row(value=i) for i in range(7))
+    consumer = Mock()
+    _connect(producer, consumer)
+
+    responses = list(_batched_request(consumer, batch_size=3))
+
+    assert responses == [_Row(value=i) for i in range(7)]
+    # Start, then three polls; the last batch reports the end of the generator.
+    assert consumer.send_request_sync.call_count == 4
+    poll = consumer.send_request_sync.call_args_list[1].args[1]
+    assert (poll.BatchSize, poll.MaxBytes, poll.MaxSeconds) == (3, 0, 0.0)
+
+
+def test_collect_batch_respects_byte_and_time_budgets(monkeypatch):
+    batch, gen = _collect_batch(iter(range(100)), 100, max_bytes=20)
+    assert len(batch.items) < 100 and sum(map(len, batch.items)) >= 20
+    assert next(gen) == len(batch.items)
+
+    now = [0.0]
+
+    def tick():
+        now[0] += 1.0
+        return now[0]
+
+    monkeypatch.setattr(generator_request.time, "monotonic", tick)
+    batch, _ = _collect_batch(iter(range(100)), 100, max_seconds=3)
+    assert [pickle.loads(item) for item in batch.items] == [0, 1, 2]
+    assert not batch.done
+
+
+def test_collect_batch_sends_iris_objects_on_their_own():
+    native = runtime_iris.get_iris().cls("Ens.StringRequest")._New()
+    batch, gen = _collect_batch(iter([1, native, 2]), 10)
+    assert [pickle.loads(item) for item in batch.items] == [1]
+
+    item, gen = _collect_batch(gen, 10)
+    assert item is native
+
+    batch, gen = _collect_batch(gen, 10)
+    assert [pickle.loads(item) for item in batch.items] == [2]
+    assert batch.done
+
+
+def test_unbatched_poll_returns_single_items():
+    producer = _producer([_Row(value=1), _Row(value=2)])
+    poll = runtime_iris.get_iris().IOP.Generator.Message.Poll._New()
+
+    assert dispatch_deserializer(producer._dispatch_generator_poll()) == _Row(value=1)
+    assert dispatch_deserializer(producer._dispatch_generator_poll(poll)) == _Row(value=2)
+
+
+def test_collect_batch_sends_unpicklable_items_on_their_own():
+    unpicklable = lambda: None  # noqa: E731
+    batch, gen = _collect_batch(iter([1, unpicklable, 2]), 10)
+    assert [pickle.loads(item) for item in batch.items] == [1]
+
+    item, gen = _collect_batch(gen, 10)
+    assert item is unpicklable
+
+
+def _prefetching_consumer(producer):
+    consumer = Mock()
+    _connect(producer, consumer)
+    queue = {}
+
+    def send_async(target, request, timeout, description, header_id, queue_name, end_time):
+        header_id.value = len(queue) + 1
+        queue_name.value = "SyncCall"
+        queue[header_id.value] = producer._dispatch_generator_poll(request)
+        return 1
+
+    def is_done(timeout, end_time, queue_name, header_id, response):
+        response.value = queue.pop(header_id)
+        return 2
+
+    consumer.iris_handle.dispatchSendRequestAsyncNG.side_effect = send_async
+    consumer.iris_handle.dispatchIsRequestDone.side_effect = is_done
+    return consumer, queue
+
+
+def test_prefetching_generator_request_polls_ahead():
+    producer = _producer(_Row(value=i) for i in range(4))
+    consumer, queue = _prefetching_consumer(producer)
+    generator = _batched_request(consumer, batch_size=2, prefetch=True)
+
+    assert next(generator) == _Row(value=0)
+    # The second batch was requested before the first one was consumed.
+    assert consumer.iris_handle.dispatchSendRequestAsyncNG.call_count == 1
+    assert list(generator) == [_Row(value=i) for i in range(1, 4)]
+    assert consumer.send_request_sync.call_count == 2
+    assert queue == {}
+
+
+def test_generator_request_rejects_invalid_batch_size():
+    with pytest.raises(ValueError, match="batch_size"):
+        _GeneratorRequest(Mock(), "test_target", _Row(value=0), batch_size=0)
+
+
+def test_closing_a_prefetching_generator_request_collects_the_pending_poll():
+    producer = _producer(_Row(value=i) for i in range(6))
+    consumer, queue = _prefetching_consumer(producer)
+
+    with _batched_request(consumer, batch_size=2, prefetch=True) as generator:
+        assert next(generator) == _Row(value=0)
+        assert len(queue) == 1
+
+    assert queue == {}
+    assert consumer.iris_handle.dispatchIsRequestDone.call_count == 1
+    assert list(generator) == []
@@ -0,0 +1,106 @@
+"""Import-time regression checks for the iop package.
+
+Each case runs in a fresh interpreter with ``python -X importtime`` and checks
+which modules were loaded and how long the top-level import took.
+"""
+
+import inspect
+import os
+import pydoc
+import subprocess
+import sys
+
+import pytest
+
+import iop
+
+_SRC = os.path.dirname(os.path.dirname(os.path.abspath(iop.__file__)))
+
+# Microseconds; generous so that slow CI machines stay green while an eager
+# import of the whole package (hundreds of milliseconds) still fails.
+_IMPORT_IOP_BUDGET_US = 50_000
+
+_HEAVY_MODULES = (
+    "iop.migration",
+    "iop.production.model",
+    "iop.production.planning",
+    "iop.production.validation",
+    "iop.runtime.director",
+    "iop.runtime.remote",
+    "requests",
+    "xmltodict",
+)
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Return {module: cumulative microseconds} for a fresh interpreter."""
+    path = [_SRC, os.environ.get("PYTHONPATH", "")]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, path)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times.setdefault(name.strip(), int(cumulative))
+    return times
+
+
+def _loaded_heavy_modules(times: dict[str, int]) -> list[str]:
+    return sorted(
+        name
+        for name in times
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in _HEAVY_MODULES)
+    )
+
+
+def test_import_iop_is_lazy():
+    times = _import_times("import iop")
+
+    assert times["iop"] < _IMPORT_IOP_BUDGET_US
+    assert not any(name.startswith("iop.") for name in times)
+    assert "pydantic" not in times
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from iop import BusinessOperation",
+        "from iop import BusinessProcess, BusinessService, InboundAdapter",
+        "from iop import Message, PydanticMessage, setting, handler",
+    ],
+)
+def test_component_imports_skip_heavy_modules(statement):
+    assert _loaded_heavy_modules(_import_times(statement)) == []
+
+
+def test_lazy_names_resolve_to_their_defining_module():
+    assert set(iop.__all__) <= set(dir(iop))
+    for name in iop.__all__:
+        assert getattr(iop, name) is not None
+    assert iop.BusinessOperation.__module__ == "iop"
+    with pytest.raises(AttributeError):
+        iop.NotAName  # noqa: B018
+
+
+def test_public_classes_render_help():
+    for name in iop.__all__:
+        value = getattr(iop, name)
+        if isinstance(value, type):
+            assert name in pydoc.render_doc(value)
+
+
+def test_source_of_director_utils_and_subclasses_is_available():
+    class LocalProcess(iop.BusinessProcess):
+        def on_request(self, request):
+            return request
+
+    assert "class Director" in inspect.getsource(iop.Director)
+    assert "class Utils" in inspect.getsource(iop.Utils)
+    assert "def on_request" in inspect.getsource(LocalProcess)
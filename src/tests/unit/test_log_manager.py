@@ -0,0 +1,179 @@
+"""Unit tests for IRIS logging — no live IRIS instance required."""
+
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from iop.components import log_manager
+from iop.components.business_operation import _BusinessOperation
+from iop.components.log_manager import (
+    BufferedIRISLogHandler,
+    IRISLogHandler,
+    LogManager,
+)
+
+
+@pytest.fixture
+def iris(monkeypatch):
+    iris = MagicMock()
+    monkeypatch.setattr(log_manager._iris, "get_iris", lambda: iris)
+    return iris
+
+
+def _logged(iris):
+    return [call.args for call in iris.cls.return_value.Log.call_args_list]
+
+
+def _record(message, level=logging.INFO, *args):
+    record = logging.LogRecord("Op", level, __file__, 1, message, args, None)
+    record.class_name = "Op"
+    record.method_name = "on_message"
+    return record
+
+
+def test_get_logger_uses_buffered_handler_when_sized():
+    assert type(LogManager.get_logger("Op").handlers[0]) is IRISLogHandler
+
+    handler = LogManager.get_logger("Op", buffer_size=10).handlers[0]
+    assert isinstance(handler, BufferedIRISLogHandler)
+    assert handler.capacity == 10
+
+
+def test_buffered_handler_flushes_when_full(iris):
+    handler = BufferedIRISLogHandler(capacity=2)
+
+    handler.handle(_record("one"))
+    assert _logged(iris) == []
+
+    handler.handle(_record("two"))
+    assert _logged(iris) == [
+        (4, "Op", "on_message", "one"),
+        (4, "Op", "on_message", "two"),
+    ]
+    iris.cls.assert_called_once_with("Ens.Util.Log")
+
+
+def test_buffered_handler_flushes_on_error_records(iris):
+    handler = BufferedIRISLogHandler(capacity=100)
+
+    handler.handle(_record("context"))
+    handler.handle(_record("failed", logging.ERROR))
+
+    assert [entry[3] for entry in _logged(iris)] == ["context", "failed"]
+
+
+def test_buffered_handler_flushes_old_records(iris, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(log_manager.time, "monotonic", lambda: now[0])
+    handler = BufferedIRISLogHandler(capacity=100, flush_interval=1.0)
+
+    handler.handle(_record("first"))
+    now[0] = 100.5
+    handler.handle(_record("second"))
+    assert _logged(iris) == []
+
+    now[0] = 101.0
+    handler.handle(_record("third"))
+    assert len(_logged(iris)) == 3
+
+
+def test_buffered_handler_formats_messages_when_logged(iris):
+    handler = BufferedIRISLogHandler(capacity=100)
+    items = ["a"]
+
+    handler.handle(_record("items=%s", logging.INFO, items))
+    items.append("b")
+    handler.close()
+
+    assert _logged(iris) == [(4, "Op", "on_message", "items=['a']")]
+
+
+class TracingOperation(_BusinessOperation):
+    LOG_BUFFER_SIZE = 50
+
+    def on_message(self, request):
+        self.trace("received")
+        self.log_info("handled")
+
+
+def test_component_logs_caller_name_and_flushes_on_tear_down(iris):
+    operation = TracingOperation()
+
+    operation.on_message(None)
+    assert _logged(iris) == []
+
+    operation._dispatch_on_tear_down(MagicMock())
+    assert _logged(iris) == [
+        (5, "TracingOperation", "on_message", "received"),
+        (4, "TracingOperation", "on_message", "handled"),
+    ]
+
+
+def test_trace_is_skipped_when_trace_events_are_disabled(iris):
+    operation = TracingOperation()
+    operation.iris_handle = MagicMock()
+    operation.iris_handle.IsTraceEnabled.return_value = 0
+
+    operation.on_message(None)
+    operation.on_message(None)
+    operation._flush_logs()
+
+    assert [entry[3] for entry in _logged(iris)] == ["handled", "handled"]
+    operation.iris_handle.IsTraceEnabled.assert_called_once_with()
+
+
+def test_settings_exclude_logging_options():
+    names = [prop[0] for prop in TracingOperation._get_properties()]
+
+    assert "LOG_BUFFER_SIZE" not in names
+    assert "LOG_FLUSH_INTERVAL" not in names
+
+
+def test_component_flushes_logs_when_a_callback_returns(iris):
+    operation = TracingOperation()
+    operation._dispatch_on_init(MagicMock())
+
+    operation._dispatch_on_message(None)
+
+    assert [entry[3] for entry in _logged(iris)] == ["received", "handled"]
+
+
+def test_buffered_handler_flushes_without_a_lock(iris):
+    handler = BufferedIRISLogHandler(capacity=100)
+    handler.handle(_record("queued"))
+    handler.lock = None
+
+    handler.flush()
+
+    assert _logged(iris) == [(4, "Op", "on_message", "queued")]
+
+
+def test_trace_check_is_retried_until_the_host_is_set(iris):
+    operation = TracingOperation()
+    operation.on_message(None)
+
+    operation.iris_handle = MagicMock()
+    operation.iris_handle.IsTraceEnabled.return_value = 0
+    operation.on_message(None)
+    operation._flush_logs()
+
+    assert [entry[3] for entry in _logged(iris)] == ["received", "handled", "handled"]
+
+
+class FailingOperation(TracingOperation):
+    def on_message(self, request):
+        self.log_info("handled")
+        raise ValueError("callback failed")
+
+
+def test_failed_flush_does_not_hide_the_callback_error(iris):
+    operation = FailingOperation()
+    operation._dispatch_on_init(MagicMock())
+    iris.cls.return_value.Log.side_effect = RuntimeError("log unavailable")
+
+    with pytest.raises(ValueError, match="callback failed"):
+        operation._dispatch_on_message(None)
+
+    message = iris.cls.return_value.WriteToConsoleLog.call_args.args[0]
+    assert "log unavailable" in message
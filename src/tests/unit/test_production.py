@@ -2,7 +2,9 @@ import ast
 import copy
 import inspect
 import json
+import logging
 import os
+import sys
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
@@ -30,6 +32,7 @@ from iop import (
 )
 from iop.components.business_host import _BusinessHost
 from iop.migration import utils as migration_utils
+from iop.production import source_inference
 
 
 @dataclass
@@ -652,6 +655,30 @@ class FilterPostRoutingRule:
     ]["interaction"] == "sync"
 
 
+def test_python_source_inference_reads_fan_out_targets():
+    class_node = ast.parse(
+        """
+class FanOutProcess:
+    async def on_message(self, request):
+        self.send_multi_request_sync([("Python.Audit", request)])
+        async for result in self.send_many_async_ng(
+            [("Python.Left", request), (self.target, request)]
+        ):
+            pass
+"""
+    ).body[0]
+
+    connections = {
+        connection.target: connection
+        for connection in source_inference._python_class_connections(class_node)
+    }
+
+    assert sorted(connections) == ["", "Python.Audit", "Python.Left"]
+    assert connections["Python.Audit"].interaction == "sync"
+    assert connections["Python.Left"].interaction == "async"
+    assert connections[""].detail == "send_many_async_ng self.target"
+
+
 def test_production_from_dict_prefers_python_host_setting_over_source_default(
     tmp_path,
     monkeypatch,
@@ -1698,6 +1725,136 @@ def test_production_validate_warns_process_adapter_settings():
     assert report.issues[0].path == "items.Process.settings.Adapter"
 
 
+class _DictionaryIris:
+    """Fake iris module answering %Dictionary queries from a class table."""
+
+    def __init__(self, classes, adapters):
+        self.classes = classes
+        self.adapters = adapters
+        self.statements = []
+        self.sql = self
+        self._Dictionary = None
+
+    def prepare(self, sql):
+        self.statements.append(sql)
+        iris = self
+
+        class Statement:
+            def execute(self, *names):
+                if "CompiledParameter" in sql:
+                    return [
+                        [name, iris.adapters[name]]
+                        for name in names
+                        if name in iris.adapters
+                    ]
+                return [
+                    [name, prop]
+                    for name in names
+                    if name in iris.classes
+                    for prop in iris.classes[name] or [None]
+                ]
+
+        return Statement()
+
+
+def _dict_production(item_count):
+    return {
+        "Production": {
+            "@Name": "Demo.Production",
+            "Item": [
+                {
+                    "@Name": f"Item{index}",
+                    "@ClassName": "Demo.Service" if index % 2 else "Demo.Missing",
+                    "Setting": [
+                        {"@Target": "Host", "@Name": "Limit", "#text": "1"},
+                        {"@Target": "Host", "@Name": "Unknown", "#text": "1"},
+                        {"@Target": "Adapter", "@Name": "Port", "#text": "1"},
+                    ],
+                }
+                for index in range(item_count)
+            ],
+        }
+    }
+
+
+def test_production_dict_validation_loads_iris_dictionary_in_bulk(monkeypatch):
+    from iop.production.validation import validate_production_entry
+
+    iris = _DictionaryIris(
+        classes={"Demo.Service": ["Limit"], "Demo.Adapter": ["Port"]},
+        adapters={"Demo.Service": "Demo.Adapter"},
+    )
+    monkeypatch.setitem(sys.modules, "iris", iris)
+
+    report = validate_production_entry(_dict_production(600), warn=False)
+
+    assert len(iris.statements) == 2
+    assert report.dictionary_queries == 2
+    assert [issue.path for issue in report.issues] == [
+        f"items.Item{index}.settings.Host.Unknown" for index in range(1, 600, 2)
+    ]
+    assert set(report.timings) == {"dictionary", "total"}
+    assert report.timings["dictionary"] <= report.timings["total"]
+    assert report.to_dict()["dictionary_queries"] == 2
+
+
+def test_production_dict_validation_opens_classes_without_sql(monkeypatch):
+    from iop.production.validation import validate_production_entry
+
+    properties = MagicMock()
+    properties.Count.return_value = 1
+    properties.GetAt.return_value.Name = "Limit"
+    iris = MagicMock(spec=["_Dictionary"])
+    iris._Dictionary.CompiledClass._ExistsId.side_effect = (
+        lambda name: name == "Demo.Service"
+    )
+    iris._Dictionary.CompiledClass._OpenId.return_value.Properties = properties
+    iris._Dictionary.CompiledParameter._OpenId.return_value.Default = ""
+    monkeypatch.setitem(sys.modules, "iris", iris)
+
+    report = validate_production_entry(_dict_production(10), warn=False)
+
+    assert [issue.path for issue in report.issues] == [
+        f"items.Item{index}.settings.Host.Unknown" for index in range(1, 10, 2)
+    ]
+    assert report.dictionary_queries == 0
+    iris._Dictionary.CompiledClass._OpenId.assert_called_once_with("Demo.Service")
+
+
+def test_production_dict_validation_skips_adapter_lookup_without_adapter_settings(
+    monkeypatch,
+):
+    from iop.production.validation import validate_production_entry
+
+    iris = _DictionaryIris(classes={"Demo.Service": ["Limit"]}, adapters={})
+    monkeypatch.setitem(sys.modules, "iris", iris)
+    data = _dict_production(4)
+    for item in data["Production"]["Item"]:
+        item["Setting"] = item["Setting"][:2]
+
+    validate_production_entry(data, warn=False)
+
+    assert len(iris.statements) == 1
+    assert "CompiledParameter" not in iris.statements[0]
+
+
+def test_production_dict_validation_logs_sql_fallback(monkeypatch, caplog):
+    from iop.production.validation import validate_production_entry
+
+    iris = MagicMock(spec=["_Dictionary", "sql"])
+    iris.sql.prepare.side_effect = RuntimeError("no SQL privilege")
+    iris._Dictionary.CompiledClass._ExistsId.return_value = False
+    iris._Dictionary.CompiledParameter._OpenId.return_value.Default = ""
+    monkeypatch.setitem(sys.modules, "iris", iris)
+
+    with caplog.at_level(logging.WARNING, logger="iop.production.validation"):
+        report = validate_production_entry(_dict_production(2), warn=False)
+
+    assert report.dictionary_queries == 0
+    assert iris.sql.prepare.call_count == 1
+    assert ["no SQL privilege" in message for message in caplog.messages] == [True]
+
+
 def test_component_ref_exposes_adapter_class_name_without_serializing_it():
     prod = Production("Demo.Production")
     service = prod.service("FileInput", FileService)
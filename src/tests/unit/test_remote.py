@@ -9,6 +9,7 @@ from io import StringIO
 from unittest.mock import MagicMock, patch
 
 import requests
+import urllib3
 
 from iop.runtime.remote import (
     _load_remote_settings_from_file,
@@ -16,6 +17,7 @@ from iop.runtime.remote import (
     _RemoteDirector,
     get_remote_settings,
 )
+from iop.runtime.remote.migration import upload_migration
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -408,14 +410,14 @@ class TestHttpHelpers(unittest.TestCase):
     def setUp(self):
         self.d = _make_director()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_includes_namespace(self, mock_get):
         mock_get.return_value = _mock_response({"ok": True})
         self.d._get("/status")
         _, kwargs = mock_get.call_args
         self.assertEqual(kwargs["params"]["namespace"], "USER")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_merges_extra_params(self, mock_get):
         mock_get.return_value = _mock_response([])
         self.d._get("/log", {"top": 5})
@@ -423,7 +425,7 @@ class TestHttpHelpers(unittest.TestCase):
         self.assertEqual(kwargs["params"]["top"], 5)
         self.assertEqual(kwargs["params"]["namespace"], "USER")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_post_includes_namespace(self, mock_post):
         mock_post.return_value = _mock_response({"status": "ok"})
         self.d._post("/stop")
@@ -431,14 +433,14 @@ class TestHttpHelpers(unittest.TestCase):
         self.assertEqual(kwargs["params"]["namespace"], "USER")
         self.assertNotIn("namespace", kwargs["json"])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_post_merges_extra_body(self, mock_post):
         mock_post.return_value = _mock_response({"status": "ok"})
         self.d._post("/start", {"production": "MyProd"})
         _, kwargs = mock_post.call_args
         self.assertEqual(kwargs["json"]["production"], "MyProd")
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_put_includes_namespace(self, mock_put):
         mock_put.return_value = _mock_response({"production": "P"})
         self.d._put("/default", {"production": "P"})
@@ -446,7 +448,7 @@ class TestHttpHelpers(unittest.TestCase):
         self.assertEqual(kwargs["params"]["namespace"], "USER")
         self.assertNotIn("namespace", kwargs["json"])
 
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_includes_namespace(self, mock_delete):
         mock_delete.return_value = _mock_response({"status": "ok"})
         self.d._delete("/binding", {"class": "Python.WrongOperation"})
@@ -454,7 +456,7 @@ class TestHttpHelpers(unittest.TestCase):
         self.assertEqual(kwargs["params"]["namespace"], "USER")
         self.assertEqual(kwargs["params"]["class"], "Python.WrongOperation")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_raises_on_error_status(self, mock_get):
         resp = _mock_response({}, status_code=500)
         resp.ok = False
@@ -465,6 +467,98 @@ class TestHttpHelpers(unittest.TestCase):
             self.d._get("/status")
 
 
+class TestPooledSession(unittest.TestCase):
+
+    def test_session_carries_auth_and_verify(self):
+        d = _make_director(verify_ssl=False)
+        self.assertEqual(d._session.auth, ("admin", "password"))
+        self.assertFalse(d._session.verify)
+
+    def test_adapter_pool_and_retry_settings(self):
+        d = _make_director(pool_size=4, retries=5, retry_backoff=0.1)
+        adapter = d._session.get_adapter("https://iris:8080/api/iop/status")
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertEqual(adapter.max_retries.backoff_factor, 0.1)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertIn("GET", adapter.max_retries.allowed_methods)
+        self.assertNotIn("POST", adapter.max_retries.allowed_methods)
+
+    def test_put_is_not_resent_after_a_read_error(self):
+        d = _make_director(retries=3)
+        adapter = d._session.get_adapter("https://iris:8080/api/iop/migrate")
+        retry = adapter.max_retries
+        error = urllib3.exceptions.ReadTimeoutError(None, "/migrate", "timed out")
+
+        with self.assertRaises(urllib3.exceptions.ReadTimeoutError):
+            retry.increment(method="PUT", url="/api/iop/migrate", error=error)
+        self.assertIsNotNone(
+            retry.increment(method="GET", url="/api/iop/status", error=error)
+        )
+
+    @patch("requests.Session.get")
+    def test_calls_reuse_one_session(self, mock_get):
+        mock_get.return_value = _mock_response({"production": "P"})
+        d = _make_director(timeout=5)
+        d.get_default_production()
+        d.get_default_production()
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], 5)
+
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_request_timings_per_endpoint(self, mock_get, mock_post):
+        mock_get.return_value = _mock_response([])
+        mock_post.return_value = _mock_response({})
+        d = _make_director()
+        d._get_log_entries(top=10)
+        d._get_log_entries(since_id=3)
+        d.stop_production()
+
+        timings = d.request_timings()
+        self.assertEqual(set(timings), {"GET /log", "POST /stop"})
+        self.assertEqual(timings["GET /log"].calls, 2)
+        self.assertGreaterEqual(
+            timings["GET /log"].total_seconds, timings["GET /log"].max_seconds
+        )
+
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_request_summary_reports_count_and_slowest_endpoint(
+        self, mock_get, mock_post
+    ):
+        mock_get.return_value = _mock_response([])
+        mock_post.return_value = _mock_response({})
+        d = _make_director()
+        self.assertEqual(d.request_summary(), "No HTTP requests sent.")
+
+        d._get_log_entries(top=10)
+        d._record_timing("POST", d._base + "/stop", 5.0)
+
+        self.assertRegex(
+            d.request_summary(),
+            r"^2 HTTP requests in 5\.\d\ds, slowest POST /stop \(5\.00s\)$",
+        )
+
+    @patch("requests.Session.post")
+    @patch("requests.Session.put")
+    def test_setup_uploads_through_session(self, mock_put, mock_post):
+        mock_put.return_value = _mock_response({})
+        mock_post.return_value = _mock_response({"console": [], "status": {}})
+        d = _make_director()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "Demo"))
+            with open(os.path.join(tmp, "Demo", "Item.cls"), "w", encoding="utf-8") as f:
+                f.write("Class Demo.Item {}\n")
+            with patch("sys.stdout", new=StringIO()):
+                d.setup(tmp)
+
+        self.assertTrue(mock_put.call_args.args[0].endswith("/USER/doc/Demo.Item.cls"))
+        self.assertEqual(mock_post.call_args.kwargs["json"], ["Demo.Item.cls"])
+        self.assertEqual(mock_post.call_args.kwargs["timeout"], 120)
+        self.assertIn("PUT /api/atelier/v1/USER/doc/Demo.Item.cls", d.request_timings())
+
+
 # ---------------------------------------------------------------------------
 # Production lifecycle
 # ---------------------------------------------------------------------------
@@ -474,40 +568,40 @@ class TestProductionLifecycle(unittest.TestCase):
     def setUp(self):
         self.d = _make_director()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_default_production(self, mock_get):
         mock_get.return_value = _mock_response({"production": "MyApp.Production"})
         result = self.d.get_default_production()
         self.assertEqual(result, "MyApp.Production")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_default_production_empty(self, mock_get):
         mock_get.return_value = _mock_response({"production": ""})
         result = self.d.get_default_production()
         self.assertEqual(result, "Not defined")
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_set_default_production(self, mock_put):
         mock_put.return_value = _mock_response({"production": "NewProd"})
         self.d.set_default_production("NewProd")
         _, kwargs = mock_put.call_args
         self.assertEqual(kwargs["json"]["production"], "NewProd")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_productions(self, mock_get):
         data = {"MyApp.Production": {"Status": "Running"}}
         mock_get.return_value = _mock_response(data)
         result = self.d.list_productions()
         self.assertEqual(result, data)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_status_production(self, mock_get):
         data = {"production": "MyApp.Production", "status": "running"}
         mock_get.return_value = _mock_response(data)
         result = self.d.status_production()
         self.assertEqual(result["status"], "running")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_status_production_fills_name_when_missing(self, mock_get):
         # First call returns status with no production name; second returns default
         mock_get.side_effect = [
@@ -517,49 +611,49 @@ class TestProductionLifecycle(unittest.TestCase):
         result = self.d.status_production()
         self.assertEqual(result["production"], "Default.Prod")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_start_production_named(self, mock_post):
         mock_post.return_value = _mock_response({"status": "started"})
         self.d.start_production("MyApp.Production")
         _, kwargs = mock_post.call_args
         self.assertEqual(kwargs["json"]["production"], "MyApp.Production")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_start_production_default(self, mock_post):
         mock_post.return_value = _mock_response({"status": "started"})
         self.d.start_production()
         _, kwargs = mock_post.call_args
         self.assertNotIn("production", kwargs["json"])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_stop_production(self, mock_post):
         mock_post.return_value = _mock_response({"status": "stopped"})
         self.d.stop_production()
         args, _ = mock_post.call_args
         self.assertIn("/stop", args[0])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_shutdown_production(self, mock_post):
         mock_post.return_value = _mock_response({"status": "killed"})
         self.d.shutdown_production()
         args, _ = mock_post.call_args
         self.assertIn("/kill", args[0])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_restart_production(self, mock_post):
         mock_post.return_value = _mock_response({"status": "restarted"})
         self.d.restart_production()
         args, _ = mock_post.call_args
         self.assertIn("/restart", args[0])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_update_production(self, mock_post):
         mock_post.return_value = _mock_response({"status": "updated"})
         self.d.update_production()
         args, _ = mock_post.call_args
         self.assertIn("/update", args[0])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_start_component(self, mock_post):
         mock_post.return_value = _mock_response({"status": "started"})
         self.d.start_component("Python.MyOp")
@@ -567,7 +661,7 @@ class TestProductionLifecycle(unittest.TestCase):
         self.assertTrue(args[0].endswith("/component/start"))
         self.assertEqual(kwargs["json"]["component"], "Python.MyOp")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_stop_component(self, mock_post):
         mock_post.return_value = _mock_response({"status": "stopped"})
         self.d.stop_component("Python.MyOp")
@@ -575,7 +669,7 @@ class TestProductionLifecycle(unittest.TestCase):
         self.assertTrue(args[0].endswith("/component/stop"))
         self.assertEqual(kwargs["json"]["component"], "Python.MyOp")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_restart_component(self, mock_post):
         mock_post.return_value = _mock_response({"status": "restarted"})
         self.d.restart_component("Python.MyOp")
@@ -583,7 +677,7 @@ class TestProductionLifecycle(unittest.TestCase):
         self.assertTrue(args[0].endswith("/component/restart"))
         self.assertEqual(kwargs["json"]["component"], "Python.MyOp")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_bindings(self, mock_get):
         data = [{"class": "Python.MyOp", "used": False, "used_by": []}]
         mock_get.return_value = _mock_response(data)
@@ -593,7 +687,7 @@ class TestProductionLifecycle(unittest.TestCase):
         self.assertNotIn("unused", kwargs["params"])
         self.assertEqual(result, data)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_bindings_unused(self, mock_get):
         mock_get.return_value = _mock_response([])
         result = self.d.list_bindings(unused_only=True)
@@ -601,7 +695,7 @@ class TestProductionLifecycle(unittest.TestCase):
         self.assertEqual(kwargs["params"]["unused"], 1)
         self.assertEqual(result, [])
 
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_unbind_component(self, mock_delete):
         mock_delete.return_value = _mock_response({"status": "unbound"})
         self.d.unbind_component("Python.WrongOperation")
@@ -627,7 +721,7 @@ class TestLogging(unittest.TestCase):
             "time_logged": "2026-03-03 10:00:00", "type": "Info",
         }
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_log_entries_top(self, mock_get):
         entries = [self._make_log_entry(i) for i in range(3)]
         mock_get.return_value = _mock_response(entries)
@@ -636,7 +730,7 @@ class TestLogging(unittest.TestCase):
         _, kwargs = mock_get.call_args
         self.assertEqual(kwargs["params"]["top"], 3)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_log_entries_since_id(self, mock_get):
         mock_get.return_value = _mock_response([self._make_log_entry(10)])
         result = self.d._get_log_entries(since_id=9)
@@ -645,7 +739,7 @@ class TestLogging(unittest.TestCase):
         self.assertEqual(kwargs["params"]["since_id"], 9)
         self.assertNotIn("top", kwargs["params"])
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_log_entries_non_list_returns_empty(self, mock_get):
         mock_get.return_value = _mock_response({"error": "some error"})
         # _check_error raises before the isinstance check, so test with valid non-list
@@ -653,7 +747,7 @@ class TestLogging(unittest.TestCase):
         result = self.d._get_log_entries()
         self.assertEqual(result, [])
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_log_production_top_prints(self, mock_get):
         entries = [self._make_log_entry(1, "msg1"), self._make_log_entry(2, "msg2")]
         mock_get.return_value = _mock_response(entries)
@@ -680,7 +774,7 @@ class TestTestComponent(unittest.TestCase):
     def setUp(self):
         self.d = _make_director()
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_target_only(self, mock_post):
         mock_post.return_value = _mock_response({"classname": "Ens.Response", "body": "{}"})
         result = self.d.test_component("Python.MyOp")
@@ -690,7 +784,7 @@ class TestTestComponent(unittest.TestCase):
         self.assertNotIn("body", kwargs["json"])
         self.assertEqual(result["classname"], "Ens.Response")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_with_classname_and_body(self, mock_post):
         mock_post.return_value = _mock_response({"classname": "Python.MyMsg", "body": '{"k":"v"}'})
         self.d.test_component("Python.MyOp", classname="Python.MyMsg", body='{"k":"v"}')
@@ -698,7 +792,7 @@ class TestTestComponent(unittest.TestCase):
         self.assertEqual(kwargs["json"]["classname"], "Python.MyMsg")
         self.assertEqual(kwargs["json"]["body"], '{"k":"v"}')
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_message_arg_is_ignored(self, mock_post):
         """The 'message' positional arg is silently ignored in remote mode."""
         mock_post.return_value = _mock_response({"classname": "", "body": ""})
@@ -706,35 +800,35 @@ class TestTestComponent(unittest.TestCase):
         _, kwargs = mock_post.call_args
         self.assertNotIn("message", kwargs["json"])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_none_target_sends_empty_string(self, mock_post):
         mock_post.return_value = _mock_response({"classname": "", "body": ""})
         self.d.test_component(None)
         _, kwargs = mock_post.call_args
         self.assertEqual(kwargs["json"]["target"], "")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_restart_flag_sent_in_payload(self, mock_post):
         mock_post.return_value = _mock_response({"classname": "Ens.Response", "body": ""})
         self.d.test_component("Python.MyOp", restart=True)
         _, kwargs = mock_post.call_args
         self.assertTrue(kwargs["json"].get("restart"))
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_restart_true_by_default(self, mock_post):
         mock_post.return_value = _mock_response({"classname": "Ens.Response", "body": ""})
         self.d.test_component("Python.MyOp")
         _, kwargs = mock_post.call_args
         self.assertTrue(kwargs["json"].get("restart"))
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_restart_false_not_in_payload(self, mock_post):
         mock_post.return_value = _mock_response({"classname": "Ens.Response", "body": ""})
         self.d.test_component("Python.MyOp", restart=False)
         _, kwargs = mock_post.call_args
         self.assertNotIn("restart", kwargs["json"])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_error_response_raises(self, mock_post):
         mock_post.return_value = _mock_response({"error": "Component not found"})
         with self.assertRaises(RuntimeError) as ctx:
@@ -751,7 +845,7 @@ class TestExportProduction(unittest.TestCase):
     def setUp(self):
         self.d = _make_director()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_export_returns_parsed_dict(self, mock_get):
         mock_get.return_value = _mock_response({"MyApp.Production": {"@Name": "MyApp.Production", "Item": []}})
         result = self.d.export_production("MyApp.Production")
@@ -760,13 +854,13 @@ class TestExportProduction(unittest.TestCase):
         _, kwargs = mock_get.call_args
         self.assertEqual(kwargs["params"]["production"], "MyApp.Production")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_export_empty_returns_empty_dict(self, mock_get):
         mock_get.return_value = _mock_response({})
         result = self.d.export_production("MyApp.Production")
         self.assertEqual(result, {})
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_export_connections_uses_connections_endpoint(self, mock_get):
         mock_get.return_value = _mock_response(
             {
@@ -781,7 +875,7 @@ class TestExportProduction(unittest.TestCase):
         self.assertTrue(mock_get.call_args.args[0].endswith("/connections"))
         self.assertEqual(kwargs["params"]["production"], "MyApp.Production")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_export_queue_info_uses_queues_endpoint(self, mock_get):
         mock_get.return_value = _mock_response(
             {
@@ -806,8 +900,10 @@ class TestRemoteMigrate(unittest.TestCase):
     def setUp(self):
         self.d = _make_director()
 
-    @patch("requests.put")
-    def test_migrate_sends_selected_entrypoint_filename(self, mock_put):
+    @patch("requests.Session.get")
+    @patch("requests.Session.put")
+    def test_migrate_sends_selected_entrypoint_filename(self, mock_put, mock_get):
+        mock_get.return_value = _mock_response({"version": "1.0.0"})
         mock_put.return_value = _mock_response({})
         with tempfile.TemporaryDirectory() as tmp:
             demo_path = os.path.join(tmp, "demo.py")
@@ -828,6 +924,169 @@ class TestRemoteMigrate(unittest.TestCase):
         self.assertIn("demo.py", uploaded_names)
         self.assertIn("helper.py", uploaded_names)
 
+    def _write_project(self, tmp):
+        files = {
+            "settings.py": "REMOTE_SETTINGS = {'package': 'app'}\n",
+            "bo.py": "VALUE = 1\n",
+            "pkg/bp.py": "VALUE = 2\n",
+        }
+        for name, text in files.items():
+            path = os.path.join(tmp, *name.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return os.path.join(tmp, "settings.py")
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.put")
+    def test_migrate_uploads_only_changed_files(self, mock_put, mock_get):
+        from iop.migration import _remote_sync
+
+        mock_get.return_value = _mock_response(
+            {"version": "1.1.0", "features": ["migrate_manifest"]}
+        )
+        with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as server:
+            settings = self._write_project(tmp)
+            # The server holds an older bo.py, the current settings.py and a
+            # file that was removed from the project.
+            _remote_sync.apply_upload(
+                server,
+                [
+                    {"name": "settings.py", "data": "REMOTE_SETTINGS = {'package': 'app'}\n"},
+                    {"name": "bo.py", "data": "VALUE = 0\n"},
+                    {"name": "old.py", "data": ""},
+                ],
+            )
+
+            def put(url, json, **kwargs):
+                if "manifest" in json:
+                    return _mock_response(
+                        _remote_sync.diff_manifest(server, json["manifest"])
+                    )
+                _remote_sync.apply_upload(server, json["body"], json["delete"])
+                return _mock_response({})
+
+            mock_put.side_effect = put
+            with patch("sys.stdout", new=StringIO()) as out:
+                summary = upload_migration(self.d, settings)
+
+            self.assertEqual(_remote_sync.scan_folder(server), _remote_sync.scan_folder(tmp))
+
+        payload = mock_put.call_args.kwargs["json"]
+        self.assertTrue(payload["incremental"])
+        self.assertEqual([entry["name"] for entry in payload["body"]], ["bo.py", "pkg/bp.py"])
+        self.assertEqual(payload["body"][0]["encoding"], "gzip+base64")
+        self.assertEqual(payload["delete"], ["old.py"])
+        self.assertEqual((summary.files, summary.uploaded, summary.deleted), (3, 2, 1))
+        self.assertIn("Uploaded 2 of 3 files", out.getvalue())
+        self.assertIn("slowest PUT /migrate", out.getvalue())
+
+    def test_apply_upload_rejects_paths_outside_the_package(self):
+        from iop.migration import _remote_sync
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError):
+                _remote_sync.apply_upload(tmp, [{"name": "../evil.py", "data": ""}])
+
+    def test_apply_upload_entry_reads_bodies_above_the_iris_string_limit(self):
+        from iop.migration import _remote_sync
+        from iop.runtime import iris as runtime_iris
+        from iop.runtime.streams import IRIS_MAX_STRING_LENGTH, string_to_stream
+
+        content = os.urandom(3_000_000)
+        encoded = _remote_sync.encode_file(content)
+        self.assertGreater(len(encoded), IRIS_MAX_STRING_LENGTH)
+        stream = string_to_stream(runtime_iris.get_iris(), encoded)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            _remote_sync.apply_upload_entry(tmp, "pkg/big.py", "gzip+base64", stream)
+            _remote_sync.remove_file(tmp, "pkg/missing.py")
+
+            with open(os.path.join(tmp, "pkg", "big.py"), "rb") as fh:
+                self.assertEqual(fh.read(), content)
+
+
+# ---------------------------------------------------------------------------
+# setup (--init)
+# ---------------------------------------------------------------------------
+
+class TestRemoteSetup(unittest.TestCase):
+
+    CLASSES = {
+        "Demo.Base.cls": ["Class Demo.Base Extends %RegisteredObject", "{", "}"],
+        "Demo.Child.cls": ["Class Demo.Child Extends (%Persistent, Demo.Base)", "{", "}"],
+        "Demo.Other.cls": ["Class Demo.Other Extends %RegisteredObject", "{", "}"],
+    }
+
+    def setUp(self):
+        self.d = _make_director()
+        self.tmp = tempfile.TemporaryDirectory()
+        root = os.path.join(self.tmp.name, "Demo")
+        os.makedirs(root)
+        for doc_name, lines in self.CLASSES.items():
+            with open(os.path.join(root, doc_name[5:]), "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _setup(self, remote_docs):
+        compiled = []
+
+        def post(url, json=None, **kwargs):
+            if url.endswith("/docs"):
+                return _mock_response({"result": {"content": remote_docs}})
+            compiled.append(json)
+            return _mock_response({"console": [], "status": {"errors": []}})
+
+        with patch("requests.Session.post", side_effect=post), patch(
+            "requests.Session.put", return_value=_mock_response({})
+        ) as mock_put, patch("sys.stdout", new=StringIO()) as out:
+            self.d.setup(self.tmp.name)
+        uploaded = sorted(call.args[0].rsplit("/", 1)[1] for call in mock_put.call_args_list)
+        return uploaded, compiled, out.getvalue()
+
+    def test_uploads_changed_documents_and_compiles_subclasses(self):
+        remote = [
+            {"name": "Demo.Base.cls", "content": ["Class Demo.Base Extends %Persistent", "{", "}"]},
+            {"name": "Demo.Child.cls", "content": self.CLASSES["Demo.Child.cls"]},
+            {"name": "Demo.Other.cls", "content": self.CLASSES["Demo.Other.cls"] + [""]},
+        ]
+        uploaded, compiled, out = self._setup(remote)
+
+        self.assertEqual(uploaded, ["Demo.Base.cls"])
+        self.assertEqual(compiled, [["Demo.Base.cls", "Demo.Child.cls"]])
+        self.assertIn("Uploaded 1, skipped 2 unchanged, compiled 2", out)
+        self.assertIn("HTTP requests in", out)
+
+    def test_unchanged_documents_are_not_compiled(self):
+        remote = [{"name": name, "content": lines} for name, lines in self.CLASSES.items()]
+        uploaded, compiled, out = self._setup(remote)
+
+        self.assertEqual((uploaded, compiled), ([], []))
+        self.assertIn("Uploaded 0, skipped 3 unchanged, compiled 0", out)
+
+    def test_missing_documents_are_uploaded(self):
+        remote = [
+            {"name": name, "content": [], "status": "ERROR #16005: Document does not exist"}
+            for name in self.CLASSES
+        ]
+        uploaded, compiled, _ = self._setup(remote)
+
+        self.assertEqual(uploaded, sorted(self.CLASSES))
+        self.assertEqual(compiled, [sorted(self.CLASSES)])
+
+    def test_documents_not_up_to_date_are_compiled_again(self):
+        remote = [
+            {"name": name, "content": lines, "upd": name != "Demo.Other.cls"}
+            for name, lines in self.CLASSES.items()
+        ]
+        uploaded, compiled, out = self._setup(remote)
+
+        self.assertEqual(uploaded, ["Demo.Other.cls"])
+        self.assertEqual(compiled, [["Demo.Other.cls"]])
+        self.assertIn("Uploaded 1, skipped 2 unchanged, compiled 1", out)
+
 
 # ---------------------------------------------------------------------------
 # Namespace override
@@ -835,7 +1094,7 @@ class TestRemoteMigrate(unittest.TestCase):
 
 class TestNamespaceOverride(unittest.TestCase):
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_custom_namespace_sent_in_params(self, mock_get):
         mock_get.return_value = _mock_response({"production": "P", "status": "running"})
         d = _RemoteDirector({
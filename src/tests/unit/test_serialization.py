@@ -1,16 +1,24 @@
 """Unit tests for serialization — no live IRIS instance required."""
+import pickle
 from dataclasses import dataclass
 
 import pytest
 
-from iop import Message
+from iop import Message, PickleMessage, PydanticMessage
+from iop.messages.lazy import LazyMessage, is_loaded, materialize
+from iop.migration import utils as migration_utils
 from iop.messages.serialization import (
     MessageClassImportError,
+    MessageSerializer,
     SerializationError,
+    clear_serialization_cache,
+    dataclass_from_dict,
     deserialize_message,
     deserialize_pickle_message,
+    pickle_frames,
     serialize_message,
     serialize_pickle_message,
+    unpickle_frames,
 )
 
 
@@ -69,3 +77,297 @@ def test_json_deserialization_class_import_error_is_import_error():
     assert isinstance(exc.value, SerializationError)
     assert isinstance(exc.value, ImportError)
     assert "Failed to load class missing.module.MyMsg" in str(exc.value)
+
+
+def test_json_deserialization_caches_class_resolution(monkeypatch):
+    import iop.messages.serialization as serialization
+
+    clear_serialization_cache()
+    serial = serialize_message(IrisIdMessage(value="first"))
+    calls = []
+    real_import = serialization.importlib.import_module
+
+    def counting_import(name, *args, **kwargs):
+        calls.append(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(serialization.importlib, "import_module", counting_import)
+
+    assert deserialize_message(serial).value == "first"
+    assert deserialize_message(serial).value == "first"
+    assert calls == [IrisIdMessage.__module__]
+
+
+def test_json_deserialization_detects_replaced_class(monkeypatch):
+    import sys
+
+    serial = serialize_message(IrisIdMessage(value="test"))
+    deserialize_message(serial)
+
+    @dataclass
+    class IrisIdMessage2(Message):
+        value: str = ""
+
+    module = sys.modules[IrisIdMessage.__module__]
+    monkeypatch.setattr(module, "IrisIdMessage", IrisIdMessage2)
+
+    assert isinstance(deserialize_message(serial), IrisIdMessage2)
+
+
+def test_dataclass_decoder_reuses_type_adapters(monkeypatch):
+    import iop.messages.serialization as serialization
+
+    @dataclass
+    class Typed(Message):
+        count: int = 0
+        tags: list[str] = None
+
+    clear_serialization_cache()
+    created = []
+    real_adapter = serialization.TypeAdapter
+
+    def counting_adapter(field_type):
+        created.append(field_type)
+        return real_adapter(field_type)
+
+    monkeypatch.setattr(serialization, "TypeAdapter", counting_adapter)
+
+    for _ in range(3):
+        result = dataclass_from_dict(Typed, {"count": "3", "tags": ["a"]})
+
+    assert result.count == 3
+    assert result.tags == ["a"]
+    assert len(created) == 2
+
+
+def test_clear_serialization_cache_for_one_classname():
+    serial = serialize_message(IrisIdMessage(value="test"))
+    deserialize_message(serial)
+
+    clear_serialization_cache(serial.classname)
+
+    assert deserialize_message(serial).value == "test"
+
+
+def test_clear_serialization_cache_for_one_classname_drops_type_adapters():
+    from iop.messages import serialization
+
+    serialization._type_adapter(list[int])
+    assert serialization._cached_type_adapter.cache_info().currsize
+
+    clear_serialization_cache("tests.unit.not_cached")
+
+    assert serialization._cached_type_adapter.cache_info().currsize == 0
+
+
+def test_json_serialization_keeps_extra_and_nested_attributes():
+    @dataclass
+    class Inner:
+        value: int = 0
+
+    @dataclass
+    class Outer(Message):
+        inner: Inner = None
+        items: list = None
+
+    msg = Outer(inner=Inner(value=1), items=[Inner(value=2), 3])
+    msg.inner.note = "nested extra"
+    msg.extra = float("inf")
+
+    serial = serialize_message(msg)
+
+    assert serial.json == (
+        '{"inner":{"value":1,"note":"nested extra"},'
+        '"items":[{"value":2},3],"extra":null}'
+    )
+
+
+class ZeroCopyBlob:
+    """Pickles its data as a protocol 5 out-of-band buffer."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self)._rebuild, (pickle.PickleBuffer(self.data),)
+        return type(self)._rebuild, (bytes(self.data),)
+
+    @classmethod
+    def _rebuild(cls, data):
+        return cls(data)
+
+
+@dataclass
+class BlobMessage(PickleMessage):
+    blob: ZeroCopyBlob = None
+
+
+def test_pickle_serialization_writes_raw_binary_stream():
+    serial = serialize_pickle_message(IrisIdMessage(value="test"))
+
+    assert serial.jbin.Size > 0
+    assert serial.jstr._value == ""
+    assert deserialize_pickle_message(serial).value == "test"
+
+
+def test_pickle_serialization_keeps_out_of_band_buffers():
+    data = bytearray(b"\x01\x02" * 1000)
+    serial = serialize_pickle_message(BlobMessage(blob=ZeroCopyBlob(data)))
+
+    payload = bytes(serial.jbin._value)
+    assert payload.endswith(bytes(data))
+
+    result = deserialize_pickle_message(serial)
+    assert bytes(result.blob.data) == bytes(data)
+    assert not result.blob.data.readonly
+
+
+def test_pickle_deserialization_reads_legacy_base64_messages(monkeypatch):
+    monkeypatch.setattr(MessageSerializer, "pickle_storage", "base64")
+    serial = serialize_pickle_message(IrisIdMessage(value="legacy"))
+    monkeypatch.undo()
+
+    assert serial.jbin.Size == 0
+    assert deserialize_pickle_message(serial).value == "legacy"
+
+
+def test_unpickle_frames_rejects_bad_payloads():
+    payload = b"".join(pickle_frames(IrisIdMessage(value="test")))
+
+    with pytest.raises(SerializationError, match="truncated"):
+        unpickle_frames(payload[:4])
+    with pytest.raises(SerializationError, match="frame header"):
+        unpickle_frames(b"XXXX" + payload[4:])
+    with pytest.raises(SerializationError, match="size mismatch"):
+        unpickle_frames(payload + b"\x00")
+
+
+@dataclass
+class BundleMessage(Message):
+    entries: list = None
+    note: str = ""
+
+
+class PydanticBundle(PydanticMessage):
+    entries: list[dict] = []
+    note: str = ""
+
+
+@dataclass
+class LazyBundle(Message):
+    LAZY_BODY = True
+
+    entries: list = None
+
+
+@pytest.mark.parametrize("msg_class", [BundleMessage, PydanticBundle])
+def test_json_stream_bodies_decode_from_utf8(msg_class):
+    original = msg_class(entries=[{"text": "€漢字" * 100}], note="ü")
+    serial = serialize_message(original)
+    serial.json = migration_utils.string_to_stream(serial.json, 64)
+
+    result = deserialize_message(serial)
+
+    assert result.entries == original.entries
+    assert result.note == "ü"
+
+
+def test_stream_to_utf8_encodes_each_chunk():
+    stream = migration_utils.string_to_stream("a€" * 10, 3)
+
+    assert migration_utils.stream_to_utf8(stream, 3) == ("a€" * 10).encode()
+
+
+def test_lazy_body_decodes_on_first_access(monkeypatch):
+    serial = serialize_message(LazyBundle(entries=[1, 2]))
+    serial._Id = lambda: "7"
+    decoded = []
+    real_decode = MessageSerializer._deserialize_json
+    monkeypatch.setattr(
+        MessageSerializer,
+        "_deserialize_json",
+        staticmethod(lambda s: decoded.append(s) or real_decode(s)),
+    )
+
+    result = deserialize_message(serial)
+
+    assert type(result) is LazyMessage
+    assert isinstance(result, LazyBundle)
+    assert not is_loaded(result)
+    assert decoded == []
+
+    assert result.entries == [1, 2]
+    assert result.get_iris_id() == "7"
+    assert is_loaded(result)
+    assert type(materialize(result)) is LazyBundle
+    assert len(decoded) == 1
+
+
+def test_lazy_body_serializes_and_copies_as_the_message():
+    result = deserialize_message(serialize_message(LazyBundle(entries=[3])))
+    result.entries.append(4)
+
+    again = deserialize_message(serialize_message(result))
+    assert again.entries == [3, 4]
+    assert pickle.loads(pickle.dumps(result)) == LazyBundle(entries=[3, 4])
+
+
+@dataclass
+class PickledValue(PickleMessage):
+    value: int = 0
+
+
+def test_unresolvable_pickle_classnames_are_resolved_once(monkeypatch):
+    clear_serialization_cache()
+    serial = serialize_pickle_message(PickledValue(value=1))
+    serial.classname = "tests.unit.missing_module.PickledValue"
+    parsed = []
+    real_parse = MessageSerializer._parse_classname
+    monkeypatch.setattr(
+        MessageSerializer,
+        "_parse_classname",
+        staticmethod(lambda name: parsed.append(name) or real_parse(name)),
+    )
+
+    for _ in range(3):
+        assert deserialize_pickle_message(serial).value == 1
+
+    assert parsed == [serial.classname]
+
+
+def test_cached_decoders_do_not_keep_message_classes_alive():
+    import gc
+    import weakref
+
+    from iop.messages import serialization
+
+    @dataclass
+    class Reloaded(Message):
+        value: int = 0
+
+    dataclass_from_dict(Reloaded, {"value": 1})
+    serialization.encode_dataclass_message(Reloaded(value=1))
+    ref = weakref.ref(Reloaded)
+    del Reloaded
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_json_stream_bodies_are_written_in_chunks_of_the_message_buffer(
+    fake_iris_runtime, monkeypatch
+):
+    writes = []
+    stream = fake_iris_runtime.cls("%Stream.GlobalCharacter")._New()
+    monkeypatch.setattr(stream, "Write", writes.append)
+    monkeypatch.setattr(
+        fake_iris_runtime.cls("%Stream.GlobalCharacter"), "_New", lambda: stream
+    )
+    message_class = type(fake_iris_runtime.cls("IOP.Message")._New())
+    monkeypatch.setattr(message_class, "buffer", 16)
+
+    serialize_message(BundleMessage(entries=["x" * 40]))
+
+    assert len(writes) > 1
+    assert max(len(chunk) for chunk in writes) == 16
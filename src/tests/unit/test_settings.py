@@ -114,3 +114,69 @@ def test_controls_expose_pythonic_and_raw_selector_strings():
     assert controls.raw("selector?context={Custom/Search}") == (
         "selector?context={Custom/Search}"
     )
+
+
+def test_settings_metadata_is_computed_once_per_class(monkeypatch):
+    from iop.components import common
+
+    class Service(BusinessService):
+        Directory = ""
+
+    calls = []
+    build = Service._build_properties.__func__
+
+    def counting_build(cls):
+        calls.append(cls)
+        return build(cls)
+
+    monkeypatch.setattr(Service, "_build_properties", classmethod(counting_build))
+    common.clear_settings_cache(Service)
+
+    first = Service._get_properties()
+    first[0][0] = "mutated"
+    assert Service._get_properties() == build(Service)
+    assert calls == [Service]
+
+    Service.Limit = 5
+    assert "Limit" in [prop[0] for prop in Service._get_properties()]
+    assert calls == [Service, Service]
+
+
+def test_settings_metadata_bulk_api_skips_non_components():
+    from iop.components.common import settings_metadata
+
+    class Service(BusinessService):
+        """Reads files."""
+
+        Directory = ""
+
+    metadata = settings_metadata(
+        {"A": Service, "B": Service, "Helper": dict, "module": "not a class"}
+    )
+
+    assert sorted(metadata) == ["A", "B"]
+    info, properties = metadata["A"]
+    assert info == Service._get_info()
+    assert properties == Service._get_properties()
+    assert metadata["B"] == metadata["A"]
+    assert metadata["B"][1] is not metadata["A"][1]
+
+
+def test_apply_settings_sets_all_values_and_logs_failures(monkeypatch):
+    class Service(BusinessService):
+        Directory = ""
+        Limit = 0
+
+        @property
+        def read_only(self):
+            return "fixed"
+
+    service = Service()
+    warnings = []
+    monkeypatch.setattr(service, "log_warning", warnings.append)
+
+    service._apply_settings({"Directory": "/tmp", "Limit": 5, "read_only": "x"})
+
+    assert (service.Directory, service.Limit, service.read_only) == ("/tmp", 5, "fixed")
+    assert len(warnings) == 1 and "read_only" in warnings[0]
+    assert "_apply_settings" not in [prop[0] for prop in Service._get_properties()]
@@ -24,6 +24,7 @@ from iop.messages.base import _Message as Message
 from iop.messages.base import _PydanticMessage as PydanticMessage
 from iop.migration import utils as migration_utils
 from iop.migration.manifest import MigrationManifestBuilder
+from iop.runtime.streams import IRIS_MAX_STRING_LENGTH
 
 
 @pytest.fixture
@@ -741,3 +742,65 @@ class TestXmlToJson:
         data = json.loads(result)
         # falls back to 'Production' when @Name is absent
         assert "Production" in data
+
+
+class TestStreamConversion:
+    @pytest.fixture(autouse=True)
+    def restore_chunk_size(self):
+        size = migration_utils.get_stream_chunk_size()
+        yield
+        migration_utils.set_stream_chunk_size(size)
+
+    def test_string_round_trip(self):
+        text = "abcdefghij" * 10
+        stream = migration_utils.string_to_stream(text, 30)
+
+        assert migration_utils.stream_to_string(stream, 7) == text
+        assert list(migration_utils.iter_stream_chunks(stream, 40)) == [
+            text[0:40],
+            text[40:80],
+            text[80:100],
+        ]
+
+    def test_chunks_to_stream_consumes_a_generator(self):
+        chunks = (str(i) for i in range(5))
+        stream = migration_utils.chunks_to_stream(chunks)
+
+        assert migration_utils.stream_to_string(stream) == "01234"
+
+    def test_string_to_stream_writes_one_slice_per_chunk(self, fake_iris_runtime):
+        writes = []
+
+        class RecordingStream:
+            def Write(self, chunk):
+                writes.append(chunk)
+
+        with patch.object(
+            fake_iris_runtime.cls("%Stream.GlobalCharacter"),
+            "_New",
+            return_value=RecordingStream(),
+        ):
+            migration_utils.string_to_stream("x" * 25, 10)
+
+        assert writes == ["x" * 10, "x" * 10, "x" * 5]
+
+    def test_bytes_round_trip(self):
+        data = bytes(range(256)) * 4
+        stream = migration_utils.buffers_to_stream([data[:100], data[100:]], 64)
+
+        assert migration_utils.stream_to_bytes(stream, 50) == data
+
+    def test_set_stream_chunk_size_aligns_to_stream_blocks(self):
+        assert migration_utils.set_stream_chunk_size(100_000) == 96_000
+        assert migration_utils.get_stream_chunk_size() == 96_000
+        assert migration_utils.set_stream_chunk_size(100) == 100
+
+        with pytest.raises(ValueError):
+            migration_utils.set_stream_chunk_size(0)
+
+    def test_set_stream_chunk_size_rejects_sizes_above_max_string(self):
+        limit = IRIS_MAX_STRING_LENGTH
+        assert migration_utils.set_stream_chunk_size(limit) == 3_616_000
+
+        with pytest.raises(ValueError):
+            migration_utils.set_stream_chunk_size(limit + 1)